@@ -11,11 +11,11 @@ class C4ContainerItem(Named, ElementPresentation):
     def __init__(self, diagram, id=None):
         super().__init__(diagram, id)
 
-        self.watch("subject[NamedElement].name")
-        self.watch("subject[C4Container].technology")
-        self.watch("subject[C4Container].description")
-        self.watch("subject[C4Container].type")
-        self.watch("children", self.update_shapes)
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject[C4Container].technology", defer=True)
+        self.watch("subject[C4Container].description", defer=True)
+        self.watch("subject[C4Container].type", defer=True)
+        self.watch("children", self.update_shapes, defer=True)
 
     def update_shapes(self, event=None):
         text_align = (
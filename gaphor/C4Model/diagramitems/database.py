@@ -13,10 +13,10 @@ class C4DatabaseItem(Named, ElementPresentation):
     def __init__(self, diagram, id=None):
         super().__init__(diagram, id)
 
-        self.watch("subject[NamedElement].name")
-        self.watch("subject[C4Container].technology")
-        self.watch("subject[C4Container].description")
-        self.watch("subject[C4Container].type")
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject[C4Container].technology", defer=True)
+        self.watch("subject[C4Container].description", defer=True)
+        self.watch("subject[C4Container].type", defer=True)
 
     def update_shapes(self, event=None):
         self.shape = Box(
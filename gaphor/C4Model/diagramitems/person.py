@@ -13,8 +13,8 @@ class C4PersonItem(Named, ElementPresentation):
     def __init__(self, diagram, id=None):
         super().__init__(diagram, id, width=48, height=48)
 
-        self.watch("subject[NamedElement].name")
-        self.watch("subject[C4Person].description")
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject[C4Person].description", defer=True)
 
     def update_shapes(self, event=None):
         self.shape = Box(
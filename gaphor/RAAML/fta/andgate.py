@@ -24,8 +24,8 @@ class ANDItem(Classified, ElementPresentation):
     def __init__(self, diagram, id=None):
         super().__init__(diagram, id, width=DEFAULT_FTA_MINOR, height=DEFAULT_FTA_MAJOR)
 
-        self.watch("subject[NamedElement].name").watch(
-            "subject[NamedElement].namespace.name"
+        self.watch("subject[NamedElement].name", defer=True).watch(
+            "subject[NamedElement].namespace.name", defer=True
         )
 
     def update_shapes(self, event=None):
@@ -22,8 +22,8 @@ class DormantEventItem(Classified, ElementPresentation):
     def __init__(self, diagram, id=None):
         super().__init__(diagram, id, width=70, height=35)
 
-        self.watch("subject[NamedElement].name").watch(
-            "subject[NamedElement].namespace.name"
+        self.watch("subject[NamedElement].name", defer=True).watch(
+            "subject[NamedElement].namespace.name", defer=True
         )
 
     def update_shapes(self, event=None):
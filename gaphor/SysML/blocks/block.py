@@ -32,18 +32,18 @@ class BlockItem(Classified, ElementPresentation[Block]):
     def __init__(self, diagram, id=None):
         super().__init__(diagram, id)
 
-        self.watch("show_stereotypes", self.update_shapes).watch(
-            "show_parts", self.update_shapes
-        ).watch("show_references", self.update_shapes).watch(
-            "show_values", self.update_shapes
+        self.watch("show_stereotypes", self.update_shapes, defer=True).watch(
+            "show_parts", self.update_shapes, defer=True
+        ).watch("show_references", self.update_shapes, defer=True).watch(
+            "show_values", self.update_shapes, defer=True
         ).watch(
-            "subject[NamedElement].name"
+            "subject[NamedElement].name", defer=True
         ).watch(
-            "subject[NamedElement].namespace.name"
+            "subject[NamedElement].namespace.name", defer=True
         ).watch(
-            "subject[Classifier].isAbstract", self.update_shapes
+            "subject[Classifier].isAbstract", self.update_shapes, defer=True
         ).watch(
-            "subject[Class].ownedAttribute.aggregation", self.update_shapes
+            "subject[Class].ownedAttribute.aggregation", self.update_shapes, defer=True
         )
         attribute_watches(self, "Block")
         stereotype_watches(self)
@@ -17,17 +17,19 @@ class PropertyItem(Named, ElementPresentation[UML.Property]):
     def __init__(self, diagram, id=None):
         super().__init__(diagram, id)
 
-        self.watch("show_stereotypes", self.update_shapes)
-        self.watch("subject[Property].name")
-        self.watch("subject[Property].type.name")
-        self.watch("subject[Property].lowerValue")
-        self.watch("subject[Property].upperValue")
-        self.watch("subject.appliedStereotype", self.update_shapes)
-        self.watch("subject.appliedStereotype.classifier.name")
-        self.watch("subject.appliedStereotype.slot", self.update_shapes)
-        self.watch("subject.appliedStereotype.slot.definingFeature.name")
-        self.watch("subject.appliedStereotype.slot.value", self.update_shapes)
-        self.watch("subject[Property].aggregation", self.update_shapes)
+        self.watch("show_stereotypes", self.update_shapes, defer=True)
+        self.watch("subject[Property].name", defer=True)
+        self.watch("subject[Property].type.name", defer=True)
+        self.watch("subject[Property].lowerValue", defer=True)
+        self.watch("subject[Property].upperValue", defer=True)
+        self.watch("subject.appliedStereotype", self.update_shapes, defer=True)
+        self.watch("subject.appliedStereotype.classifier.name", defer=True)
+        self.watch("subject.appliedStereotype.slot", self.update_shapes, defer=True)
+        self.watch("subject.appliedStereotype.slot.definingFeature.name", defer=True)
+        self.watch(
+            "subject.appliedStereotype.slot.value", self.update_shapes, defer=True
+        )
+        self.watch("subject[Property].aggregation", self.update_shapes, defer=True)
 
     show_stereotypes: attribute[int] = attribute("show_stereotypes", int)
 
@@ -26,7 +26,7 @@ def text_position(position):
 class ProxyPortItem(Named, AttachedPresentation[sysml.ProxyPort]):
     def __init__(self, diagram, id=None):
         super().__init__(diagram, id, width=16, height=16)
-        self.watch("subject[NamedElement].name")
+        self.watch("subject[NamedElement].name", defer=True)
 
     def update_shapes(self):
         self.shape = IconBox(
@@ -21,8 +21,8 @@ class DirectedRelationshipPropertyPathItem(Named, LinePresentation):
         )
 
         self.draw_head = draw_arrow_head
-        self.watch("subject[NamedElement].name").watch(
-            "subject.appliedStereotype.classifier.name"
+        self.watch("subject[NamedElement].name", defer=True).watch(
+            "subject.appliedStereotype.classifier.name", defer=True
         )
 
 
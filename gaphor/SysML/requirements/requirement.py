@@ -31,18 +31,18 @@ class RequirementItem(Classified, ElementPresentation[Requirement]):
     def __init__(self, diagram, id=None):
         super().__init__(diagram, id)
 
-        self.watch("show_stereotypes", self.update_shapes).watch(
-            "show_attributes", self.update_shapes
-        ).watch("show_operations", self.update_shapes).watch(
-            "subject[NamedElement].name"
+        self.watch("show_stereotypes", self.update_shapes, defer=True).watch(
+            "show_attributes", self.update_shapes, defer=True
+        ).watch("show_operations", self.update_shapes, defer=True).watch(
+            "subject[NamedElement].name", defer=True
         ).watch(
-            "subject[NamedElement].namespace.name"
+            "subject[NamedElement].namespace.name", defer=True
         ).watch(
-            "subject[Classifier].isAbstract", self.update_shapes
+            "subject[Classifier].isAbstract", self.update_shapes, defer=True
         ).watch(
-            "subject[AbstractRequirement].externalId", self.update_shapes
+            "subject[AbstractRequirement].externalId", self.update_shapes, defer=True
         ).watch(
-            "subject[AbstractRequirement].text", self.update_shapes
+            "subject[AbstractRequirement].text", self.update_shapes, defer=True
         )
         attribute_watches(self, "Requirement")
         operation_watches(self, "Requirement")
@@ -28,8 +28,8 @@ class ActionItem(Named, ElementPresentation):
             draw=draw_border,
         )
 
-        self.watch("subject[NamedElement].name")
-        self.watch("subject.appliedStereotype.classifier.name")
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject.appliedStereotype.classifier.name", defer=True)
 
 
 @represents(UML.SendSignalAction)
@@ -46,8 +46,8 @@ class SendSignalActionItem(Named, ElementPresentation):
             draw=self.draw_border,
         )
 
-        self.watch("subject[NamedElement].name")
-        self.watch("subject.appliedStereotype.classifier.name")
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject.appliedStereotype.classifier.name", defer=True)
 
     def draw_border(self, box, context, bounding_box):
         cr = context.cairo
@@ -77,8 +77,8 @@ class AcceptEventActionItem(Named, ElementPresentation):
             draw=self.draw_border,
         )
 
-        self.watch("subject[NamedElement].name")
-        self.watch("subject.appliedStereotype.classifier.name")
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject.appliedStereotype.classifier.name", defer=True)
 
     def draw_border(self, box, context, bounding_box):
         cr = context.cairo
@@ -18,9 +18,9 @@ class ActivityItem(Classified, ElementPresentation):
 
         self.width = 100
 
-        self.watch("subject[NamedElement].name").watch(
-            "subject.appliedStereotype.classifier.name"
-        ).watch("subject[Classifier].isAbstract", self.update_shapes).watch(
+        self.watch("subject[NamedElement].name", defer=True).watch(
+            "subject.appliedStereotype.classifier.name", defer=True
+        ).watch("subject[Classifier].isAbstract", self.update_shapes, defer=True).watch(
             "subject[Activity].node[ActivityParameterNode].parameter.name",
             self.update_parameters,
         ).watch(
@@ -92,4 +92,4 @@ class ActivityParameterNodeItem(AttachedPresentation[UML.ActivityParameterNode])
             style={"padding": (4, 12, 4, 12), "background-color": (1, 1, 1, 1)},
             draw=draw_border,
         )
-        self.watch("subject[ActivityParameterNode].parameter.name")
+        self.watch("subject[ActivityParameterNode].parameter.name", defer=True)
@@ -57,8 +57,8 @@ class InitialNodeItem(ActivityNodeItem, ElementPresentation):
             Text(text=lambda: self.subject and self.subject.name or ""),
         )
 
-        self.watch("subject[NamedElement].name")
-        self.watch("subject.appliedStereotype.classifier.name")
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject.appliedStereotype.classifier.name", defer=True)
 
 
 def draw_initial_node(_box, context, _bounding_box):
@@ -94,8 +94,8 @@ class ActivityFinalNodeItem(ActivityNodeItem, ElementPresentation):
             Text(text=lambda: self.subject and self.subject.name or ""),
         )
 
-        self.watch("subject[NamedElement].name")
-        self.watch("subject.appliedStereotype.classifier.name")
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject.appliedStereotype.classifier.name", defer=True)
 
 
 def draw_activity_final_node(_box, context, _bounding_box):
@@ -140,8 +140,8 @@ class FlowFinalNodeItem(ActivityNodeItem, ElementPresentation):
             Text(text=lambda: self.subject and self.subject.name or ""),
         )
 
-        self.watch("subject[NamedElement].name")
-        self.watch("subject.appliedStereotype.classifier.name")
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject.appliedStereotype.classifier.name", defer=True)
 
 
 def draw_flow_final_node(_box, context, _bounding_box):
@@ -177,9 +177,9 @@ class DecisionNodeItem(ActivityNodeItem, ElementPresentation):
             Text(text=lambda: self.subject and self.subject.name or ""),
         )
 
-        self.watch("show_underlaying_type")
-        self.watch("subject[NamedElement].name")
-        self.watch("subject.appliedStereotype.classifier.name")
+        self.watch("show_underlaying_type", defer=True)
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject.appliedStereotype.classifier.name", defer=True)
 
     show_underlaying_type: attribute[int] = attribute("show_type", int, 0)
     combined: relation_one[UML.ControlNode] = association(
@@ -239,9 +239,9 @@ class ForkNodeItem(Named, Presentation[UML.ForkNode], HandlePositionUpdate):
             ),
         )
 
-        self.watch("subject[NamedElement].name")
-        self.watch("subject.appliedStereotype.classifier.name")
-        self.watch("subject[JoinNode].joinSpec")
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject.appliedStereotype.classifier.name", defer=True)
+        self.watch("subject[JoinNode].joinSpec", defer=True)
 
         diagram.connections.add_constraint(self, constraint(vertical=(h1.pos, h2.pos)))
         diagram.connections.add_constraint(
@@ -30,8 +30,8 @@ class ControlFlowItem(Named, LinePresentation):
             Text(text=lambda: self.subject.name or ""),
         )
 
-        self.watch("subject[NamedElement].name")
-        self.watch("subject.appliedStereotype.classifier.name")
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject.appliedStereotype.classifier.name", defer=True)
 
         self.shape_middle = Text(
             text=lambda: self.subject
@@ -40,7 +40,7 @@ class ControlFlowItem(Named, LinePresentation):
             or ""
         )
 
-        self.watch("subject[ControlFlow].guard")
+        self.watch("subject[ControlFlow].guard", defer=True)
 
         self.draw_tail = draw_arrow_tail
 
@@ -63,8 +63,8 @@ class ObjectFlowItem(Named, LinePresentation):
             Text(text=lambda: self.subject.name or ""),
         )
 
-        self.watch("subject[NamedElement].name")
-        self.watch("subject.appliedStereotype.classifier.name")
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject.appliedStereotype.classifier.name", defer=True)
 
         self.shape_middle = Text(
             text=lambda: self.subject
@@ -73,6 +73,6 @@ class ObjectFlowItem(Named, LinePresentation):
             or ""
         )
 
-        self.watch("subject[ObjectFlow].guard")
+        self.watch("subject[ObjectFlow].guard", defer=True)
 
         self.draw_tail = draw_arrow_tail
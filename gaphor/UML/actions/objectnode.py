@@ -58,11 +58,11 @@ class ObjectNodeItem(Named, ElementPresentation):
             height=30,
         )
 
-        self.watch("subject[NamedElement].name")
-        self.watch("subject.appliedStereotype.classifier.name")
-        self.watch("subject[ObjectNode].upperBound")
-        self.watch("subject[ObjectNode].ordering")
-        self.watch("show_ordering")
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject.appliedStereotype.classifier.name", defer=True)
+        self.watch("subject[ObjectNode].upperBound", defer=True)
+        self.watch("subject[ObjectNode].ordering", defer=True)
+        self.watch("show_ordering", defer=True)
 
     show_ordering: attribute[int] = attribute("show_ordering", int, default=False)
 
@@ -29,11 +29,13 @@ class PartitionItem(ElementPresentation):
             },
             draw=self.draw_swimlanes,
         )
-        self.watch("subject[NamedElement].name")
-        self.watch("subject.appliedStereotype.classifier.name")
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject.appliedStereotype.classifier.name", defer=True)
         self.watch("partition", self.update_partition)
-        self.watch("partition.name")
-        self.watch("partition[ActivityPartition].represents[NamedElement].name")
+        self.watch("partition.name", defer=True)
+        self.watch(
+            "partition[ActivityPartition].represents[NamedElement].name", defer=True
+        )
         self.handles()[NW].pos.add_handler(self.update_width)
         self.handles()[SE].pos.add_handler(self.update_width)
 
@@ -25,7 +25,7 @@ def text_position(position):
 class PinItem(Named, AttachedPresentation[UML.Pin]):
     def __init__(self, diagram, id=None):
         super().__init__(diagram, id, width=16, height=16)
-        self.watch("subject[NamedElement].name")
+        self.watch("subject[NamedElement].name", defer=True)
 
     def pin_type(self):
         return ""
@@ -64,8 +64,8 @@ class AssociationItem(Named, LinePresentation[UML.Association]):
 
         # For the association ends:
         base = "subject[Association].memberEnd[Property]"
-        self.watch("subject[NamedElement].name").watch(
-            "subject.appliedStereotype.classifier.name"
+        self.watch("subject[NamedElement].name", defer=True).watch(
+            "subject.appliedStereotype.classifier.name", defer=True
         ).watch(f"{base}.name", self.on_association_end_value).watch(
             f"{base}.aggregation", self.on_association_end_value
         ).watch(
@@ -90,13 +90,13 @@ class AssociationItem(Named, LinePresentation[UML.Association]):
         ).watch(
             f"{base}.appliedStereotype.classifier", self.on_association_end_value
         ).watch(
-            "subject[Association].memberEnd"
+            "subject[Association].memberEnd", defer=True
         ).watch(
-            "subject[Association].ownedEnd"
+            "subject[Association].ownedEnd", defer=True
         ).watch(
-            "subject[Association].navigableOwnedEnd"
+            "subject[Association].navigableOwnedEnd", defer=True
         ).watch(
-            "show_direction"
+            "show_direction", defer=True
         ).watch(
             "preferred_aggregation", self.on_association_end_value
         )
@@ -14,14 +14,16 @@ class ComponentItem(Classified, ElementPresentation):
     def __init__(self, diagram, id=None):
         super().__init__(diagram, id)
 
-        self.watch("show_stereotypes", self.update_shapes)
-        self.watch("subject[NamedElement].name")
-        self.watch("subject.appliedStereotype", self.update_shapes)
-        self.watch("subject.appliedStereotype.classifier.name")
-        self.watch("subject.appliedStereotype.slot", self.update_shapes)
-        self.watch("subject.appliedStereotype.slot.definingFeature.name")
-        self.watch("subject.appliedStereotype.slot.value", self.update_shapes)
-        self.watch("subject[Classifier].useCase", self.update_shapes)
+        self.watch("show_stereotypes", self.update_shapes, defer=True)
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject.appliedStereotype", self.update_shapes, defer=True)
+        self.watch("subject.appliedStereotype.classifier.name", defer=True)
+        self.watch("subject.appliedStereotype.slot", self.update_shapes, defer=True)
+        self.watch("subject.appliedStereotype.slot.definingFeature.name", defer=True)
+        self.watch(
+            "subject.appliedStereotype.slot.value", self.update_shapes, defer=True
+        )
+        self.watch("subject[Classifier].useCase", self.update_shapes, defer=True)
 
     show_stereotypes: attribute[int] = attribute("show_stereotypes", int)
 
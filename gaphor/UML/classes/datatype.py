@@ -37,10 +37,10 @@ class DataTypeItem(Classified, ElementPresentation[UML.DataType]):
     def __init__(self, diagram, id=None):
         super().__init__(diagram, id=id)
 
-        self.watch("show_attributes", self.update_shapes).watch(
-            "show_operations", self.update_shapes
-        ).watch("subject[NamedElement].name").watch(
-            "subject[NamedElement].namespace.name"
+        self.watch("show_attributes", self.update_shapes, defer=True).watch(
+            "show_operations", self.update_shapes, defer=True
+        ).watch("subject[NamedElement].name", defer=True).watch(
+            "subject[NamedElement].namespace.name", defer=True
         )
         attribute_watches(self, "DataType")
         operation_watches(self, "DataType")
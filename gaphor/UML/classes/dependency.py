@@ -61,8 +61,8 @@ class DependencyItem(Named, LinePresentation):
             ),
             Text(text=lambda: self.subject.name or ""),
         )
-        self.watch("subject[NamedElement].name")
-        self.watch("subject.appliedStereotype.classifier.name")
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject.appliedStereotype.classifier.name", defer=True)
 
     def save(self, save_func):
         super().save(save_func)
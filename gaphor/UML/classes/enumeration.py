@@ -35,16 +35,16 @@ class EnumerationItem(Classified, ElementPresentation[UML.Enumeration]):
     def __init__(self, diagram, id=None):
         super().__init__(diagram, id=id)
 
-        self.watch("show_attributes", self.update_shapes).watch(
-            "show_operations", self.update_shapes
-        ).watch("show_enumerations", self.update_shapes).watch(
-            "subject[NamedElement].name"
+        self.watch("show_attributes", self.update_shapes, defer=True).watch(
+            "show_operations", self.update_shapes, defer=True
+        ).watch("show_enumerations", self.update_shapes, defer=True).watch(
+            "subject[NamedElement].name", defer=True
         ).watch(
-            "subject[NamedElement].namespace.name"
+            "subject[NamedElement].namespace.name", defer=True
         ).watch(
-            "subject[Enumeration].ownedLiteral", self.update_shapes
+            "subject[Enumeration].ownedLiteral", self.update_shapes, defer=True
         ).watch(
-            "subject[Enumeration].ownedLiteral.name", self.update_shapes
+            "subject[Enumeration].ownedLiteral.name", self.update_shapes, defer=True
         )
         attribute_watches(self, "Enumeration")
         operation_watches(self, "Enumeration")
@@ -26,7 +26,7 @@ class GeneralizationItem(LinePresentation):
                 text=lambda: stereotypes_str(self.subject),
             )
         )
-        self.watch("subject.appliedStereotype.classifier.name")
+        self.watch("subject.appliedStereotype.classifier.name", defer=True)
 
     def draw_tail(self, context: DrawContext):
         cr = context.cairo
@@ -182,24 +182,24 @@ class InterfaceItem(Classified, ElementPresentation):
             InterfacePort(h_sw.pos, h_nw.pos, is_folded, Side.W),
         ]
 
-        self.watch("show_stereotypes", self.update_shapes).watch(
-            "show_attributes", self.update_shapes
-        ).watch("show_operations", self.update_shapes).watch(
-            "subject[NamedElement].name"
+        self.watch("show_stereotypes", self.update_shapes, defer=True).watch(
+            "show_attributes", self.update_shapes, defer=True
+        ).watch("show_operations", self.update_shapes, defer=True).watch(
+            "subject[NamedElement].name", defer=True
         ).watch(
-            "subject[NamedElement].namespace.name"
+            "subject[NamedElement].namespace.name", defer=True
         ).watch(
-            "subject.appliedStereotype", self.update_shapes
+            "subject.appliedStereotype", self.update_shapes, defer=True
         ).watch(
-            "subject.appliedStereotype.classifier.name"
+            "subject.appliedStereotype.classifier.name", defer=True
         ).watch(
-            "subject.appliedStereotype.slot", self.update_shapes
+            "subject.appliedStereotype.slot", self.update_shapes, defer=True
         ).watch(
-            "subject.appliedStereotype.slot.definingFeature.name"
+            "subject.appliedStereotype.slot.definingFeature.name", defer=True
         ).watch(
-            "subject.appliedStereotype.slot.value", self.update_shapes
+            "subject.appliedStereotype.slot.value", self.update_shapes, defer=True
         ).watch(
-            "subject[Interface].supplierDependency", self.update_shapes
+            "subject[Interface].supplierDependency", self.update_shapes, defer=True
         )
         attribute_watches(self, "Interface")
         operation_watches(self, "Interface")
@@ -25,8 +25,8 @@ class InterfaceRealizationItem(Named, LinePresentation):
             ),
             Text(text=lambda: self.subject.name or ""),
         )
-        self.watch("subject[NamedElement].name")
-        self.watch("subject.appliedStereotype.classifier.name")
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject.appliedStereotype.classifier.name", defer=True)
         self._inline_style: Style = {}
 
     @property
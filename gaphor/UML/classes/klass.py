@@ -35,14 +35,14 @@ class ClassItem(Classified, ElementPresentation[UML.Class]):
     def __init__(self, diagram, id=None):
         super().__init__(diagram, id=id)
 
-        self.watch("show_stereotypes", self.update_shapes).watch(
-            "show_attributes", self.update_shapes
-        ).watch("show_operations", self.update_shapes).watch(
-            "subject[NamedElement].name"
+        self.watch("show_stereotypes", self.update_shapes, defer=True).watch(
+            "show_attributes", self.update_shapes, defer=True
+        ).watch("show_operations", self.update_shapes, defer=True).watch(
+            "subject[NamedElement].name", defer=True
         ).watch(
-            "subject[NamedElement].namespace.name"
+            "subject[NamedElement].namespace.name", defer=True
         ).watch(
-            "subject[Classifier].isAbstract", self.update_shapes
+            "subject[Classifier].isAbstract", self.update_shapes, defer=True
         )
         attribute_watches(self, "Class")
         operation_watches(self, "Class")
@@ -106,48 +106,48 @@ class ClassItem(Classified, ElementPresentation[UML.Class]):
 
 
 def attribute_watches(presentation, cast):
-    presentation.watch(
-        f"subject[{cast}].ownedAttribute", presentation.update_shapes
-    ).watch(
-        f"subject[{cast}].ownedAttribute.association", presentation.update_shapes
-    ).watch(
-        f"subject[{cast}].ownedAttribute.name"
-    ).watch(
-        f"subject[{cast}].ownedAttribute.isStatic", presentation.update_shapes
-    ).watch(
-        f"subject[{cast}].ownedAttribute.isDerived"
-    ).watch(
-        f"subject[{cast}].ownedAttribute.visibility"
-    ).watch(
-        f"subject[{cast}].ownedAttribute.lowerValue"
-    ).watch(
-        f"subject[{cast}].ownedAttribute.upperValue"
-    ).watch(
-        f"subject[{cast}].ownedAttribute.defaultValue"
-    ).watch(
-        f"subject[{cast}].ownedAttribute.type"
-    ).watch(
-        f"subject[{cast}].ownedAttribute.typeValue"
+    presentation.watch_all(
+        (
+            f"subject[{cast}].ownedAttribute",
+            f"subject[{cast}].ownedAttribute.association",
+            f"subject[{cast}].ownedAttribute.isStatic",
+        ),
+        presentation.update_shapes,
+        defer=True,
+    ).watch_all(
+        (
+            f"subject[{cast}].ownedAttribute.name",
+            f"subject[{cast}].ownedAttribute.isDerived",
+            f"subject[{cast}].ownedAttribute.visibility",
+            f"subject[{cast}].ownedAttribute.lowerValue",
+            f"subject[{cast}].ownedAttribute.upperValue",
+            f"subject[{cast}].ownedAttribute.defaultValue",
+            f"subject[{cast}].ownedAttribute.type",
+            f"subject[{cast}].ownedAttribute.typeValue",
+        ),
+        defer=True,
     )
 
 
 def operation_watches(presentation, cast):
-    presentation.watch(
-        f"subject[{cast}].ownedOperation", presentation.update_shapes
-    ).watch(f"subject[{cast}].ownedOperation.name").watch(
-        f"subject[{cast}].ownedOperation.isAbstract", presentation.update_shapes
-    ).watch(
-        f"subject[{cast}].ownedOperation.isStatic", presentation.update_shapes
-    ).watch(
-        f"subject[{cast}].ownedOperation.visibility"
-    ).watch(
-        f"subject[{cast}].ownedOperation.ownedParameter.lowerValue"
-    ).watch(
-        f"subject[{cast}].ownedOperation.ownedParameter.upperValue"
-    ).watch(
-        f"subject[{cast}].ownedOperation.ownedParameter.typeValue"
-    ).watch(
-        f"subject[{cast}].ownedOperation.ownedParameter.defaultValue"
+    presentation.watch_all(
+        (
+            f"subject[{cast}].ownedOperation",
+            f"subject[{cast}].ownedOperation.isAbstract",
+            f"subject[{cast}].ownedOperation.isStatic",
+        ),
+        presentation.update_shapes,
+        defer=True,
+    ).watch_all(
+        (
+            f"subject[{cast}].ownedOperation.name",
+            f"subject[{cast}].ownedOperation.visibility",
+            f"subject[{cast}].ownedOperation.ownedParameter.lowerValue",
+            f"subject[{cast}].ownedOperation.ownedParameter.upperValue",
+            f"subject[{cast}].ownedOperation.ownedParameter.typeValue",
+            f"subject[{cast}].ownedOperation.ownedParameter.defaultValue",
+        ),
+        defer=True,
     )
 
 
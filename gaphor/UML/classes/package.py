@@ -15,10 +15,10 @@ class PackageItem(Named, ElementPresentation):
     def __init__(self, diagram, id=None):
         super().__init__(diagram, id, width=70, height=70)
 
-        self.watch("children", self.update_shapes)
-        self.watch("subject[NamedElement].name")
-        self.watch("subject[NamedElement].namespace.name")
-        self.watch("subject.appliedStereotype.classifier.name")
+        self.watch("children", self.update_shapes, defer=True)
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject[NamedElement].namespace.name", defer=True)
+        self.watch("subject.appliedStereotype.classifier.name", defer=True)
 
     def update_shapes(self, event=None):
         self.shape = Box(
@@ -6,12 +6,20 @@ from gaphor.diagram.shapes import Box, Text, draw_top_separator
 
 
 def stereotype_watches(presentation):
-    presentation.watch("subject.appliedStereotype", presentation.update_shapes).watch(
-        "subject.appliedStereotype.classifier.name"
-    ).watch("subject.appliedStereotype.slot", presentation.update_shapes).watch(
-        "subject.appliedStereotype.slot.definingFeature.name"
-    ).watch(
-        "subject.appliedStereotype.slot.value", presentation.update_shapes
+    presentation.watch_all(
+        (
+            "subject.appliedStereotype",
+            "subject.appliedStereotype.slot",
+            "subject.appliedStereotype.slot.value",
+        ),
+        presentation.update_shapes,
+        defer=True,
+    ).watch_all(
+        (
+            "subject.appliedStereotype.classifier.name",
+            "subject.appliedStereotype.slot.definingFeature.name",
+        ),
+        defer=True,
     )
 
 
@@ -154,16 +154,20 @@ class ConnectorItem(Named, LinePresentation[UML.Connector]):
             ),
         )
 
-        self.watch("subject[NamedElement].name")
-        self.watch("subject.appliedStereotype.classifier.name")
-        self.watch("subject[Connector].informationFlow.informationSource")
-        self.watch("subject[Connector].informationFlow.conveyed.name")
-        self.watch("subject[Connector].informationFlow[ItemFlow].itemProperty.name")
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject.appliedStereotype.classifier.name", defer=True)
+        self.watch("subject[Connector].informationFlow.informationSource", defer=True)
+        self.watch("subject[Connector].informationFlow.conveyed.name", defer=True)
         self.watch(
-            "subject[Connector].informationFlow[ItemFlow].itemProperty.type.name"
+            "subject[Connector].informationFlow[ItemFlow].itemProperty.name", defer=True
         )
         self.watch(
-            "subject[Connector].informationFlow[ItemFlow].itemProperty.type.appliedStereotype.classifier.name"
+            "subject[Connector].informationFlow[ItemFlow].itemProperty.type.name",
+            defer=True,
+        )
+        self.watch(
+            "subject[Connector].informationFlow[ItemFlow].itemProperty.type.appliedStereotype.classifier.name",
+            defer=True,
         )
 
     def draw(self, context):
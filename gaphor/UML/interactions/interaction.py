@@ -33,8 +33,8 @@ class InteractionItem(Named, ElementPresentation):
             draw=draw_interaction,
         )
 
-        self.watch("subject[NamedElement].name")
-        self.watch("subject.appliedStereotype.classifier.name")
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject.appliedStereotype.classifier.name", defer=True)
 
 
 def draw_interaction(box, context, bounding_box):
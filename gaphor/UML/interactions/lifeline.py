@@ -189,8 +189,8 @@ class LifelineItem(Named, ElementPresentation[UML.Lifeline]):
             draw=self.draw_lifeline,
         )
 
-        self.watch("subject[NamedElement].name")
-        self.watch("subject.appliedStereotype.classifier.name")
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject.appliedStereotype.classifier.name", defer=True)
         self.setup_constraints()
 
     def setup_constraints(self):
@@ -91,8 +91,8 @@ class MessageItem(Named, LinePresentation[UML.Message]):
         self._arrow_pos = 0, 0
         self._arrow_angle = 0
 
-        self.watch("subject[NamedElement].name")
-        self.watch("subject.appliedStereotype.classifier.name")
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject.appliedStereotype.classifier.name", defer=True)
 
     def _get_center_pos(self):
         """Return position in the centre of middle segment of a line.
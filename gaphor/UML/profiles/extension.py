@@ -27,8 +27,8 @@ class ExtensionItem(Named, LinePresentation):
             Text(text=lambda: self.subject.name or ""),
         )
 
-        self.watch("subject[NamedElement].name")
-        self.watch("subject.appliedStereotype.classifier.name")
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject.appliedStereotype.classifier.name", defer=True)
 
     def draw_head(self, context):
         cr = context.cairo
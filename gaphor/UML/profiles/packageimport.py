@@ -25,5 +25,5 @@ class PackageImportItem(LinePresentation):
         self.shape_middle = Text(
             text=lambda: stereotypes_str(self.subject, (gettext("import"),)),
         )
-        self.watch("subject.appliedStereotype.classifier.name")
+        self.watch("subject.appliedStereotype.classifier.name", defer=True)
         self.draw_head = draw_arrow_head
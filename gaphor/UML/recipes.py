@@ -130,7 +130,7 @@ def get_stereotypes(element):
     names = {c.__name__ for c in cls.__mro__ if issubclass(c, Element)}
 
     # find stereotypes that extend element class
-    classes = model.select(lambda e: e.isKindOf(Class) and e.name in names)
+    classes = (c for name in names for c in model.select_by("name", name, Class))
 
     stereotypes = list({ext.ownedEnd.type for cls in classes for ext in cls.extension})
 
@@ -24,8 +24,8 @@ class FinalStateItem(ElementPresentation, Named):
             Text(text=lambda: self.subject and self.subject.name or ""),
         )
 
-        self.watch("subject[NamedElement].name")
-        self.watch("subject.appliedStereotype.classifier.name")
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject.appliedStereotype.classifier.name", defer=True)
 
 
 def draw_final_state(box, context, bounding_box):
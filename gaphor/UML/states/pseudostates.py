@@ -37,9 +37,9 @@ class PseudostateItem(ElementPresentation, Named):
         for h in self.handles():
             h.movable = False
 
-        self.watch("subject[NamedElement].name")
-        self.watch("subject.appliedStereotype.classifier.name")
-        self.watch("subject[Pseudostate].kind", self.update_shapes)
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject.appliedStereotype.classifier.name", defer=True)
+        self.watch("subject[Pseudostate].kind", self.update_shapes, defer=True)
 
     def update_shapes(self, event=None):
         kind = self.subject.kind if self.subject and self.subject.kind else "initial"
@@ -21,14 +21,14 @@ class StateItem(ElementPresentation[UML.State], Named):
     def __init__(self, diagram, id=None):
         super().__init__(diagram, id, width=50, height=30)
         self._region_boxes = []
-        self.watch("subject[NamedElement].name")
-        self.watch("subject.appliedStereotype.classifier.name")
-        self.watch("subject[State].entry.name", self.update_shapes)
-        self.watch("subject[State].exit.name", self.update_shapes)
-        self.watch("subject[State].doActivity.name", self.update_shapes)
-        self.watch("subject[State].region.name")
-        self.watch("subject[State].region", self.update_shapes)
-        self.watch("show_regions", self.update_shapes)
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject.appliedStereotype.classifier.name", defer=True)
+        self.watch("subject[State].entry.name", self.update_shapes, defer=True)
+        self.watch("subject[State].exit.name", self.update_shapes, defer=True)
+        self.watch("subject[State].doActivity.name", self.update_shapes, defer=True)
+        self.watch("subject[State].region.name", defer=True)
+        self.watch("subject[State].region", self.update_shapes, defer=True)
+        self.watch("show_regions", self.update_shapes, defer=True)
 
     show_regions: attribute[int] = attribute("show_regions", int, default=True)
 
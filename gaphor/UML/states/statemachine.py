@@ -20,11 +20,11 @@ class StateMachineItem(Classified, ElementPresentation[UML.StateMachine]):
     def __init__(self, diagram, id=None):
         super().__init__(diagram, id)
         self._region_boxes = []
-        self.watch("show_stereotypes", self.update_shapes)
-        self.watch("show_regions", self.update_shapes)
-        self.watch("subject[NamedElement].name")
-        self.watch("subject[StateMachine].region.name")
-        self.watch("subject[StateMachine].region", self.update_shapes)
+        self.watch("show_stereotypes", self.update_shapes, defer=True)
+        self.watch("show_regions", self.update_shapes, defer=True)
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject[StateMachine].region.name", defer=True)
+        self.watch("subject[StateMachine].region", self.update_shapes, defer=True)
         stereotype_watches(self)
 
     show_stereotypes: attribute[int] = attribute("show_stereotypes", int)
@@ -21,8 +21,8 @@ class TransitionItem(Named, LinePresentation[UML.Transition]):
             Text(text=lambda: self.subject.name or ""),
         )
 
-        self.watch("subject[NamedElement].name")
-        self.watch("subject.appliedStereotype.classifier.name")
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject.appliedStereotype.classifier.name", defer=True)
 
         self.shape_middle = Text(
             text=lambda: self.subject
@@ -32,6 +32,6 @@ class TransitionItem(Named, LinePresentation[UML.Transition]):
             or ""
         )
 
-        self.watch("subject[Transition].guard[Constraint].specification")
+        self.watch("subject[Transition].guard[Constraint].specification", defer=True)
 
         self.draw_tail = draw_arrow_tail
@@ -39,8 +39,8 @@ class ActorItem(Classified, ElementPresentation):
             ),
         )
 
-        self.watch("subject[NamedElement].name")
-        self.watch("subject.appliedStereotype.classifier.name")
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject.appliedStereotype.classifier.name", defer=True)
 
 
 def draw_actor(box, context, bounding_box):
@@ -22,7 +22,7 @@ class ExtendItem(Named, LinePresentation):
             Text(text=lambda: stereotypes_str(self.subject, (gettext("extend"),))),
             Text(text=lambda: self.subject.name or ""),
         )
-        self.watch("subject.appliedStereotype.classifier.name").watch(
-            "subject[NamedElement].name"
+        self.watch("subject.appliedStereotype.classifier.name", defer=True).watch(
+            "subject[NamedElement].name", defer=True
         )
         self.draw_head = draw_arrow_head
@@ -23,7 +23,7 @@ class IncludeItem(Named, LinePresentation):
             Text(text=lambda: self.subject.name or ""),
         )
 
-        self.watch("subject.appliedStereotype.classifier.name").watch(
-            "subject[NamedElement].name"
+        self.watch("subject.appliedStereotype.classifier.name", defer=True).watch(
+            "subject[NamedElement].name", defer=True
         )
         self.draw_head = draw_arrow_head
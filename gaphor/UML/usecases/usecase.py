@@ -28,8 +28,8 @@ class UseCaseItem(Classified, ElementPresentation):
             draw=draw_usecase,
         )
 
-        self.watch("subject[NamedElement].name")
-        self.watch("subject.appliedStereotype.classifier.name")
+        self.watch("subject[NamedElement].name", defer=True)
+        self.watch("subject.appliedStereotype.classifier.name", defer=True)
 
 
 def draw_usecase(box, context, bounding_box):
@@ -413,9 +413,7 @@ def in_super_model(
 ) -> tuple[type[Element], UML.Class] | tuple[None, None]:
     for modeling_language, factory in super_models:
         cls: UML.Class
-        for cls in factory.select(  # type: ignore[assignment]
-            lambda e: isinstance(e, UML.Class) and e.name == name
-        ):
+        for cls in factory.select_by("name", name, UML.Class):
             if not (is_in_profile(cls) or is_enumeration(cls)):
                 element_type = modeling_language.lookup_element(cls.name)
                 assert (
@@ -457,10 +455,7 @@ def resolve_attribute_type_values(element_factory: ElementFactory) -> None:
             prop.typeValue = "int"
         else:
             c: UML.Class | None = next(
-                element_factory.select(
-                    lambda e: isinstance(e, UML.Class) and e.name == prop.typeValue
-                ),  # type: ignore[arg-type]
-                None,
+                element_factory.select_by("name", prop.typeValue, UML.Class), None
             )
             if c:
                 prop.type = c
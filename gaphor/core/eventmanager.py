@@ -1,19 +1,37 @@
 """Event Manager."""
 
+from __future__ import annotations
+
+import copy
+import sys
 from collections import deque
+from contextlib import contextmanager
+from typing import Hashable
 
 from generic.event import Event, Handler
 from generic.event import Manager as _Manager
 
 from gaphor.abc import Service
+from gaphor.event import TransactionBegin, TransactionCommit, TransactionRollback
+
+if sys.version_info < (3, 11):
+    from exceptiongroup import ExceptionGroup
 
 
-def event_handler(*event_types):
+def event_handler(*event_types, batch=False):
     """Mark a function/method as an event handler for a particular type of
-    event."""
+    event.
+
+    A batch handler is called with a list of events, once those events
+    have been handled by the regular handlers. Within a batch (e.g. a
+    transaction) events are delivered when the batch ends. Of events
+    with the same ``coalesce_key``, only the last one is delivered, with
+    the ``old_value`` of the first one.
+    """
 
     def wrapper(func):
         func.__event_types__ = event_types
+        func.__event_batch__ = batch
         return func
 
     return wrapper
@@ -24,8 +42,18 @@ class EventManager(Service):
 
     def __init__(self) -> None:
         self._events = _Manager()
+        self._handler_sets: dict[type, tuple[set[Handler], ...]] = {}
+        self._batch_events = _Manager()
+        self._batch_handlers: dict[type, list[Handler]] = {}
         self._queue: deque[Event] = deque()
         self._handling = False
+        self._batch_depth = 0
+        # The first and last event, by coalesce key
+        self._batch: dict[Hashable, tuple[Event, Event]] = {}
+
+        self._events.subscribe(self._begin_batch, TransactionBegin)
+        self._events.subscribe(self._end_batch, TransactionCommit)
+        self._events.subscribe(self._end_batch, TransactionRollback)
 
     def shutdown(self) -> None:
         pass
@@ -40,8 +68,14 @@ class EventManager(Service):
         if not event_types:
             raise Exception(f"No event types provided for function {handler}")
 
-        for et in event_types:
-            self._events.subscribe(handler, et)
+        if getattr(handler, "__event_batch__", False):
+            for et in event_types:
+                self._batch_events.subscribe(handler, et)
+            self._batch_handlers.clear()
+        else:
+            for et in event_types:
+                self._events.subscribe(handler, et)
+            self._handler_sets.clear()
 
     def unsubscribe(self, handler: Handler) -> None:
         """Unregister a previously registered handler."""
@@ -49,8 +83,35 @@ class EventManager(Service):
         if not event_types:
             raise Exception(f"No event types provided for function {handler}")
 
-        for et in event_types:
-            self._events.unsubscribe(handler, et)
+        if getattr(handler, "__event_batch__", False):
+            for et in event_types:
+                self._batch_events.unsubscribe(handler, et)
+            self._batch_handlers.clear()
+        else:
+            for et in event_types:
+                self._events.unsubscribe(handler, et)
+            self._handler_sets.clear()
+
+    @contextmanager
+    def batch(self):
+        """Deliver events to batch handlers when the batch ends.
+
+        Batches can be nested. A transaction is also a batch.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._end_batch()
+
+    def _begin_batch(self, _event=None) -> None:
+        self._batch_depth += 1
+
+    def _end_batch(self, _event=None) -> None:
+        self._batch_depth = max(self._batch_depth - 1, 0)
+        if not self._batch_depth and self._batch:
+            # Events emitted by batch handlers are handled right away
+            self.handle()
 
     def handle(self, *events: Event) -> None:
         """Send event notifications to registered handlers."""
@@ -60,7 +121,88 @@ class EventManager(Service):
         if not self._handling:
             self._handling = True
             try:
-                while queue:
-                    self._events.handle(queue.pop())
+                while queue or (self._batch and not self._batch_depth):
+                    while queue:
+                        event = queue.pop()
+                        self._handle(event)
+                        if self._batch_handlers_for(event):
+                            self._collect(event)
+                    if self._batch and not self._batch_depth:
+                        self._handle_batch()
             finally:
                 self._handling = False
+
+    def _handle(self, event: Event) -> None:
+        # Like generic.event.Manager.handle(), with handlers resolved once per event type
+        event_type = type(event)
+        try:
+            handler_sets = self._handler_sets[event_type]
+        except KeyError:
+            handler_sets = self._handler_sets[event_type] = tuple(
+                self._events.registry.query(event)
+            )
+
+        for handler_set in handler_sets:
+            if handler_set:
+                exceptions = []
+                for handler in set(handler_set):
+                    try:
+                        handler(event)
+                    except BaseException as e:
+                        exceptions.append(e)
+                if exceptions:
+                    raise ExceptionGroup("Error while handling events", exceptions)
+
+    def _collect(self, event: Event) -> None:
+        key = getattr(event, "coalesce_key", None)
+        if key is None:
+            self._batch[object()] = (event, event)
+        elif collected := self._batch.get(key):
+            # Keep the position of the first event, with the latest state
+            self._batch[key] = (collected[0], event)
+        else:
+            self._batch[key] = (event, event)
+
+    def _batch_handlers_for(self, event: Event) -> list[Handler]:
+        event_type = type(event)
+        try:
+            return self._batch_handlers[event_type]
+        except KeyError:
+            handlers = self._batch_handlers[event_type] = list(
+                dict.fromkeys(
+                    handler
+                    for handler_set in self._batch_events.registry.query(event)
+                    for handler in handler_set
+                )
+            )
+            return handlers
+
+    def _handle_batch(self) -> None:
+        events, self._batch = self._batch, {}
+        batches: dict[Handler, list[Event]] = {}
+        for first, last in events.values():
+            event = _coalesce(first, last)
+            for handler in self._batch_handlers_for(event):
+                batches.setdefault(handler, []).append(event)
+
+        exceptions = []
+        for handler, batch in batches.items():
+            try:
+                handler(batch)
+            except BaseException as e:
+                exceptions.append(e)
+        if exceptions:
+            raise ExceptionGroup("Error while handling events", exceptions)
+
+
+def _coalesce(first: Event, last: Event) -> Event:
+    """The last event, with the old value from before the first event.
+
+    The events themselves are left untouched, since they may have been
+    stored, e.g. by the undo manager.
+    """
+    if first is last or not hasattr(first, "old_value"):
+        return last
+    event = copy.copy(last)
+    event.old_value = first.old_value
+    return event
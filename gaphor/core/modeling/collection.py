@@ -1,6 +1,8 @@
 """1:n and n:m relations in the data model are saved using a collection."""
 
-from typing import Generic, List, Type, TypeVar, overload
+from __future__ import annotations
+
+from typing import Dict, Generic, List, Type, TypeVar, overload
 
 from gaphor.core.modeling.event import AssociationUpdated
 from gaphor.core.modeling.listmixins import querymixin, recursemixin, recurseproxy
@@ -47,16 +49,95 @@ class collectionlist(recursemixin, querymixin, List[T]):  # type: ignore[misc]
 
 
 class collection(Generic[T]):
-    """Collection (set-like) for model elements' 1:n and n:m relationships."""
+    """Collection (set-like) for model elements' 1:n and n:m relationships.
+
+    Members are stored in an insertion ordered dict, so membership tests,
+    additions and removals take constant time. The list of ``items`` is
+    created from the members when it's requested.
+
+    Each member has a sequence number, in insertion order. The position
+    of a member is found by counting the members with a lower sequence
+    number, in a binary indexed tree. The tree is created when a position
+    is requested, and is updated on additions and removals, which take
+    logarithmic time from then on.
+    """
 
     def __init__(self, property, object, type: Type[T]):
         self.property = property
         self.object = object
         self.type = type
-        self.items: collectionlist[T] = collectionlist()
+        # Member -> sequence number
+        self._members: Dict[T, int] = {}
+        self._items: collectionlist[T] | None = collectionlist()
+        self._sequence = 0
+        # Binary indexed tree of member counts, by sequence number + 1
+        self._positions: List[int] | None = None
+
+    @property
+    def items(self) -> collectionlist[T]:
+        items = self._items
+        if items is None:
+            items = self._items = collectionlist(self._members)
+        return items
+
+    @items.setter
+    def items(self, items) -> None:
+        self._items = collectionlist(items)
+        self._renumber(self._items)
+
+    def _renumber(self, items) -> None:
+        self._members = {}
+        for n, value in enumerate(items):
+            self._members.setdefault(value, n)
+        self._sequence = len(items)
+        self._positions = None
+
+    def _has_duplicates(self) -> bool:
+        """Items set explicitly may contain a value more than once."""
+        items = self._items
+        return items is not None and len(items) != len(self._members)
+
+    def _update_positions(self, sequence: int, delta: int) -> None:
+        tree = self._positions
+        assert tree is not None
+        i = sequence + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _add(self, value: T) -> None:
+        """Add a value at the end of the collection, without notification."""
+        sequence = self._sequence
+        self._sequence += 1
+        self._members[value] = sequence
+        if self._items is not None:
+            self._items.append(value)
+        if self._positions is not None:
+            if sequence + 1 < len(self._positions):
+                self._update_positions(sequence, 1)
+            else:
+                self._positions = None
+
+    def _discard(self, value: T) -> bool:
+        """Remove a value, without notification.
+
+        Returns ``True`` if the value was a member.
+        """
+        try:
+            sequence = self._members.pop(value)
+        except KeyError:
+            return False
+        if self._positions is not None:
+            self._update_positions(sequence, -1)
+        items = self._items
+        if items and items[-1] is value:
+            items.pop()
+        else:
+            self._items = None
+        return True
 
     def __len__(self) -> int:
-        return len(self.items)
+        return len(self._members)
 
     def __setitem__(self, key, value) -> None:
         raise RuntimeError("items should not be overwritten.")
@@ -76,7 +157,7 @@ class collection(Generic[T]):
         return self.items.__getitem__(key)
 
     def __contains__(self, obj) -> bool:
-        return self.items.__contains__(obj)
+        return obj in self._members
 
     def __iter__(self):
         return iter(self.items)
@@ -87,7 +168,7 @@ class collection(Generic[T]):
     __repr__ = __str__
 
     def __bool__(self):
-        return self.items != []
+        return bool(self._members)
 
     def append(self, value: T) -> None:
         if isinstance(value, self.type):
@@ -96,33 +177,61 @@ class collection(Generic[T]):
             raise TypeError(f"Object is not of type {self.type.__name__}")
 
     def remove(self, value: T) -> None:
-        if value in self.items:
+        if value in self._members:
             self.property.delete(self.object, value)
 
     def index(self, key: T) -> int:
         """Given an object, return the position of that object in the
         collection."""
-        return self.items.index(key)
+        if self._has_duplicates():
+            return self.items.index(key)
+        tree = self._positions
+        if tree is None:
+            tree = self._create_positions()
+        try:
+            sequence = self._members[key]
+        except KeyError:
+            raise ValueError(f"{key!r} is not in collection") from None
+
+        position = -1
+        i = sequence + 1
+        while i > 0:
+            position += tree[i]
+            i -= i & -i
+        return position
+
+    def _create_positions(self) -> List[int]:
+        # Sequence numbers are made consecutive, leaving room for additions
+        self._renumber(self._members)
+        size = 2 * len(self._members) + 16
+        tree = self._positions = [0] + [1] * len(self._members)
+        tree.extend([0] * (size - len(tree)))
+        for i in range(1, size):
+            if (j := i + (i & -i)) < size:
+                tree[j] += tree[i]
+        return tree
 
     # OCL members (from SMW by Ivan Porres, http://www.abo.fi/~iporres/smw)
 
     def size(self):
-        return len(self.items)
+        return len(self._members)
 
     def includes(self, o):
-        return o in self.items
+        return o in self._members
 
     def excludes(self, o):
         return not self.includes(o)
 
     def count(self, o):
-        return self.items.count(o)
+        if self._has_duplicates():
+            return self.items.count(o)
+        return int(o in self._members)
 
     def includesAll(self, c):
-        return next((0 for o in c if o not in self.items), 1)
+        return next((0 for o in c if o not in self._members), 1)
 
     def excludesAll(self, c):
-        return next((0 for o in c if o in self.items), 1)
+        return next((0 for o in c if o in self._members), 1)
 
     def select(self, f):
         return [v for v in self.items if f(v)]
@@ -134,7 +243,7 @@ class collection(Generic[T]):
         return [f(v) for v in self.items]
 
     def isEmpty(self):
-        return len(self.items) == 0
+        return not self._members
 
     def nonEmpty(self):
         return not self.isEmpty()
@@ -144,10 +253,12 @@ class collection(Generic[T]):
 
         Return true if swap was successful.
         """
+        items = self.items
         try:
-            i1 = self.items.index(item1)
-            i2 = self.items.index(item2)
-            self.items[i1], self.items[i2] = self.items[i2], self.items[i1]
+            i1 = items.index(item1)
+            i2 = items.index(item2)
+            items[i1], items[i2] = items[i2], items[i1]
+            self._renumber(items)
 
             self.object.handle(AssociationUpdated(self.object, self.property))
             return True
@@ -155,5 +266,7 @@ class collection(Generic[T]):
             return False
 
     def order(self, key):
-        self.items.sort(key=key)
+        items = self.items
+        items.sort(key=key)
+        self._renumber(items)
         self.object.handle(AssociationUpdated(self.object, self.property))
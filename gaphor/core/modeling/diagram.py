@@ -90,16 +90,18 @@ def removesuffix(self: str, suffix: str) -> str:
 
 
 @lru_cache()
-def attrname(obj, lower_name):
-    """Look up a real attribute name based on a lower case (normalized)
-    name."""
-    return next((name for name in dir(obj) if name.lower() == lower_name), lower_name)
+def attrname(obj_type, lower_name):
+    """Look up a real attribute name of a type based on a lower case
+    (normalized) name."""
+    return next(
+        (name for name in dir(obj_type) if name.lower() == lower_name), lower_name
+    )
 
 
 def rgetattr(obj, names):
     """Recursively het a name, based on a list of names."""
     name, *tail = names
-    v = getattr(obj, attrname(obj, name), None)
+    v = getattr(obj, attrname(type(obj), name), None)
     if isinstance(v, (collection, list, tuple)):
         if tail:
             for m in v:
@@ -166,26 +168,37 @@ class StyledItem:
 
     For convenience, a selection can be added. The selection instance
     will provide pseudo-classes for the item (focus, hover, etc.).
+
+    Wrappers created by a `StyledItems` instance share their ancestors.
     """
 
     def __init__(
-        self, item: Presentation, selection: gaphas.selection.Selection | None = None
+        self,
+        item: Presentation,
+        selection: gaphas.selection.Selection | None = None,
+        styled_items: StyledItems | None = None,
     ):
         assert item.diagram
         self.item = item
         self.diagram = item.diagram
         self.selection = selection
+        self._styled_items = styled_items
+        self._parent: StyledItem | StyledDiagram | None = None
 
     def name(self) -> str:
-        return removesuffix(type(self.item).__name__, "Item").lower()
+        return style_name(type(self.item))
 
     def parent(self) -> StyledItem | StyledDiagram:
+        if self._parent:
+            return self._parent
         parent = self.item.parent
-        return (
-            StyledItem(parent, self.selection)
-            if parent
-            else StyledDiagram(self.diagram, self.selection)
-        )
+        if self._styled_items:
+            self._parent = self._styled_items(parent)
+        elif parent:
+            self._parent = StyledItem(parent, self.selection)
+        else:
+            self._parent = StyledDiagram(self.diagram, self.selection)
+        return self._parent
 
     def children(self) -> Iterator[StyledItem]:
         selection = self.selection
@@ -214,6 +227,36 @@ class StyledItem:
         )
 
 
+class StyledItems:
+    """Create styled items for one update or paint pass.
+
+    Items share the wrappers of their parents, so ancestors are
+    wrapped once per pass.
+    """
+
+    def __init__(
+        self, diagram: Diagram, selection: gaphas.selection.Selection | None = None
+    ):
+        self.diagram = diagram
+        self.selection = selection
+        self._nodes: dict[Presentation | None, StyledItem | StyledDiagram] = {
+            None: StyledDiagram(diagram, selection)
+        }
+
+    def __call__(self, item: Presentation | None) -> StyledItem | StyledDiagram:
+        try:
+            return self._nodes[item]
+        except KeyError:
+            assert item
+            node = self._nodes[item] = StyledItem(item, self.selection, self)
+            return node
+
+
+@lru_cache()
+def style_name(item_type: type) -> str:
+    return removesuffix(item_type.__name__, "Item").lower()
+
+
 P = TypeVar("P", bound=Presentation)
 
 
@@ -235,6 +278,8 @@ class Diagram(Element):
         self._connections.add_handler(self._on_constraint_solved)
 
         self._registered_views: set[gaphas.model.View] = set()
+        self._watches_enabled = True
+        self._style_sheet: StyleSheet | None = None
 
         self._watcher = self.watcher()
         self._watcher.watch("ownedPresentation", self._owned_presentation_changed)
@@ -249,32 +294,99 @@ class Diagram(Element):
         """Returns the qualified name of the element as a tuple."""
         return qualifiedName(self)
 
+    @property
+    def watches_enabled(self) -> bool:
+        """Presentations on this diagram subscribe all their watches."""
+        return self._watches_enabled
+
+    def defer_watches(self) -> None:
+        """Presentations created from now on defer the watches that only
+        affect their appearance, until the diagram is displayed.
+
+        This is used for loaded diagrams, most of which are never opened.
+        """
+        self._watches_enabled = False
+
+    def enable_watches(self) -> None:
+        """Let presentations subscribe the watches they deferred.
+
+        This is done when a view is registered or the diagram is updated,
+        or can be requested explicitly.
+        """
+        if self._watches_enabled:
+            return
+        self._watches_enabled = True
+        for item in self.ownedPresentation:
+            item.enable_watches()
+
     def _owned_presentation_changed(self, event):
         if isinstance(event, AssociationDeleted) and event.old_value:
             self._update_views(removed_items=(event.old_value,))
         elif isinstance(event, AssociationAdded):
-            self._order_owned_presentation()
+            if not self._appended_in_order(event.new_value):
+                self._order_owned_presentation()
+
+    def _appended_in_order(self, item: Presentation) -> bool:
+        """A new item is in order if it's added at the end as top level
+        item, and it's not followed by an item that should go first."""
+        items = self.ownedPresentation.items
+        if item.parent or item.children or items[-1] is not item:
+            return False
+        return (
+            len(items) == 1
+            or isinstance(item, gaphas.Line)
+            or not isinstance(items[-2], gaphas.Line)
+        )
 
     def _order_owned_presentation(self, event=None):
+        """Order presentations depth-first, with lines last.
+
+        Siblings keep their relative order. The ordering is done in one
+        pass over the presentations.
+        """
         if event and event.property is not Presentation.parent:
             return
 
         ownedPresentation = self.ownedPresentation
+        children: dict[Presentation | None, list[Presentation]] = {}
+        for item in ownedPresentation:
+            children.setdefault(item.parent, []).append(item)
+
+        elements: list[Presentation] = []
+        lines: list[Presentation] = []
+        stack = [iter(children.get(None, ()))]
+        while stack:
+            item = next(stack[-1], None)
+            if item is None:
+                stack.pop()
+                continue
+            (lines if isinstance(item, gaphas.Line) else elements).append(item)
+            if item in children:
+                stack.append(iter(children[item]))
+
+        new_order = elements + lines
+        items = ownedPresentation.items
+        if len(new_order) < len(items):
+            # Items with a parent outside the diagram go last
+            ordered = set(new_order)
+            new_order.extend(item for item in items if item not in ordered)
+        if new_order == items:
+            return
 
-        def traverse_items(parent=None) -> Iterable[Presentation]:
-            for item in ownedPresentation:
-                if item.parent is parent:
-                    yield item
-                    yield from traverse_items(item)
-
-        new_order = sorted(
-            traverse_items(), key=lambda e: int(isinstance(e, gaphas.Line))
-        )
-        self.ownedPresentation.order(new_order.index)
+        position = {item: n for n, item in enumerate(new_order)}
+        ownedPresentation.order(position.__getitem__)
 
     @property
     def styleSheet(self) -> StyleSheet | None:
-        return next(self.model.select(StyleSheet), None)
+        """The style sheet of the model.
+
+        The style sheet is looked up once and cached until it's removed
+        from the model.
+        """
+        style_sheet = self._style_sheet
+        if style_sheet is None or style_sheet._model is not self._model:
+            style_sheet = self._style_sheet = next(self.model.select(StyleSheet), None)
+        return style_sheet
 
     def style(self, node: StyleNode) -> Style:
         style_sheet = self.styleSheet
@@ -323,6 +435,7 @@ class Diagram(Element):
         for item in self.ownedPresentation:
             self.connections.remove_connections_to_item(item)
         self._watcher.unsubscribe_all()
+        self._style_sheet = None
         super().unlink()
 
     @overload
@@ -382,6 +495,7 @@ class Diagram(Element):
         dirty_matrix_items: Sequence[Presentation] = (),
     ) -> None:
         """Update the diagram canvas."""
+        self.enable_watches()
         sort = self.sort
 
         def dirty_items_with_ancestors():
@@ -395,9 +509,10 @@ class Diagram(Element):
         self._connections.solve()
 
     def _update_items(self, items):
+        styled_items = StyledItems(self)
         for item in items:
             if update := getattr(item, "update", None):
-                update(UpdateContext(style=self.style(StyledItem(item))))
+                update(UpdateContext(style=self.style(styled_items(item))))
 
     def _on_constraint_solved(self, cinfo: gaphas.connections.Connection) -> None:
         dirty_items = set()
@@ -409,6 +524,7 @@ class Diagram(Element):
             self._update_views(dirty_items)
 
     def register_view(self, view: gaphas.model.View[Presentation]) -> None:
+        self.enable_watches()
         self._registered_views.add(view)
 
     def unregister_view(self, view: gaphas.model.View[Presentation]) -> None:
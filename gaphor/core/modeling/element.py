@@ -4,7 +4,15 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Callable, Iterator, Protocol, TypeVar, overload
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Iterable,
+    Iterator,
+    Protocol,
+    TypeVar,
+    overload,
+)
 from uuid import uuid1
 
 from gaphor.core.modeling.event import ElementUpdated
@@ -13,6 +21,7 @@ from gaphor.core.modeling.properties import (
     relation_many,
     relation_one,
     umlproperty,
+    umlproperty_table,
 )
 
 if TYPE_CHECKING:
@@ -37,6 +46,17 @@ class UnlinkEvent:
         self.diagram = diagram
 
 
+class PostloadEvent:
+    """Used to tell the model the state of this element has been loaded.
+
+    This event is used internally and should not be handled outside
+    `gaphor.core.modeling`.
+    """
+
+    def __init__(self, element: Element):
+        self.element = element
+
+
 Id = str
 
 
@@ -115,16 +135,11 @@ class Element:
     @classmethod
     def umlproperties(cls) -> Iterator[umlproperty]:
         """Iterate over all properties."""
-        umlprop = umlproperty
-        for propname in dir(cls):
-            if not propname.startswith("_"):
-                prop = getattr(cls, propname)
-                if isinstance(prop, umlprop):
-                    yield prop
+        return iter(umlproperty_table(cls))
 
     def save(self, save_func):
         """Save the state by calling save_func(name, value)."""
-        for prop in self.umlproperties():
+        for prop in umlproperty_table(type(self)):
             prop.save(self, save_func)
 
     def load(self, name, value):
@@ -142,8 +157,9 @@ class Element:
 
     def postload(self):
         """Fix up the odds and ends."""
-        for prop in self.umlproperties():
+        for prop in umlproperty_table(type(self)):
             prop.postload(self)
+        self.handle(PostloadEvent(self))
 
     def unlink(self):
         """Unlink the element. All the elements references are destroyed.
@@ -162,7 +178,7 @@ class Element:
             self._unlink_lock -= 1
 
     def inner_unlink(self, unlink_event: UnlinkEvent):
-        for prop in self.umlproperties():
+        for prop in umlproperty_table(type(self)):
             prop.unlink(self)
 
         log.debug("unlinking %s", self)
@@ -192,6 +208,11 @@ class DummyEventWatcher:
     def watch(self, path: str, handler: Handler | None = None) -> DummyEventWatcher:
         return self
 
+    def watch_all(
+        self, paths: Iterable[str], handler: Handler | None = None
+    ) -> DummyEventWatcher:
+        return self
+
     def unsubscribe_all(self) -> None:
         pass
 
@@ -220,6 +241,11 @@ class RepositoryProtocol(Protocol):
     def select(self, expression: None) -> Iterator[Element]:
         ...
 
+    def select_by(
+        self, name: str, value: object, type: type[T] | None = None
+    ) -> Iterator[T]:
+        ...
+
     def lookup(self, id: str) -> Element | None:
         ...
 
@@ -236,5 +262,10 @@ class EventWatcherProtocol(Protocol):
     def watch(self, path: str, handler: Handler | None = None) -> EventWatcherProtocol:
         ...
 
+    def watch_all(
+        self, paths: Iterable[str], handler: Handler | None = None
+    ) -> EventWatcherProtocol:
+        ...
+
     def unsubscribe_all(self) -> None:
         ...
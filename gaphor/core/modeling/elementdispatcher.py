@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from typing import Iterable
 
 from gaphor.abc import Service
 from gaphor.core import event_handler
@@ -54,6 +55,25 @@ class EventWatcher:
             dispatcher.subscribe(self._watched_paths[path], self.element, path)
         return self
 
+    def watch_all(
+        self, paths: Iterable[str], handler: Handler | None = None
+    ) -> EventWatcher:
+        """Watch a number of paths with the same handler.
+
+        This interface is fluent (returns self).
+        """
+        handler = handler or self.default_handler
+        if not handler:
+            raise ValueError(f"No handler provided for paths {paths}")
+
+        paths = tuple(paths)
+        for path in paths:
+            self._watched_paths[path] = handler
+
+        if dispatcher := self.element_dispatcher:
+            dispatcher.subscribe_all(handler, self.element, paths)
+        return self
+
     def unsubscribe_all(self, *_args):
         """Unregister handlers.
 
@@ -103,8 +123,14 @@ class ElementDispatcher(Service):
         self._handlers: dict[tuple[Element, umlproperty], dict[Handler, set]] = {}
 
         # Fast resolution when handlers are disconnected
-        # handler: [(element, property), ..]
-        self._reverse: dict[Handler, list[tuple[Element, umlproperty]]] = {}
+        # handler: {(element, property), ..}
+        self._reverse: dict[Handler, set[tuple[Element, umlproperty]]] = {}
+
+        # Keys with remaining paths, registered since the model was loaded
+        self._pending: set[tuple[Element, umlproperty]] = set()
+
+        # Compiled paths: (element type, path): (property, ..)
+        self._paths: dict[tuple[type[Element], str], tuple[umlproperty, ...]] = {}
 
         self.event_manager.subscribe(self.on_model_loaded)
         self.event_manager.subscribe(self.on_element_change_event)
@@ -117,10 +143,19 @@ class ElementDispatcher(Service):
         props = self._path_to_properties(element, path)
         self._add_handlers(element, props, handler)
 
+    def subscribe_all(
+        self, handler: Handler, element: Element, paths: Iterable[str]
+    ) -> None:
+        """Subscribe a handler to a number of paths."""
+        for path in paths:
+            self._add_handlers(
+                element, self._path_to_properties(element, path), handler
+            )
+
     def unsubscribe(self, handler: Handler) -> None:
         """Unregister a handler from the registry."""
         try:
-            reverse = reversed(self._reverse[handler])
+            reverse = self._reverse.pop(handler)
         except KeyError:
             return
 
@@ -129,12 +164,40 @@ class ElementDispatcher(Service):
                 handlers.pop(handler, None)
                 if not handlers:
                     del self._handlers[key]
-        del self._reverse[handler]
+                    self._pending.discard(key)
+        self._release_empty_tables()
+
+    def _release_empty_tables(self) -> None:
+        """Replace emptied tables, since a dict does not shrink when its
+        items are removed, e.g. when a model is flushed."""
+        if not self._handlers:
+            self._handlers = {}
+        if not self._reverse:
+            self._reverse = {}
+
+    def statistics(self) -> dict[str, int]:
+        """The size of the dispatcher tables."""
+        return {
+            "handlers": len(self._reverse),
+            "keys": len(self._handlers),
+            "subscriptions": sum(len(h) for h in self._handlers.values()),
+            "reverse": sum(len(r) for r in self._reverse.values()),
+        }
 
     def _path_to_properties(self, element, path):
         """Given a start element and a path, return a tuple of properties
-        (association, attribute, etc.) representing the path."""
-        c = type(element)
+        (association, attribute, etc.) representing the path.
+
+        Paths are compiled once per element type.
+        """
+        key = (type(element), path)
+        try:
+            return self._paths[key]
+        except KeyError:
+            props = self._paths[key] = self._compile_path(type(element), path)
+            return props
+
+    def _compile_path(self, c, path):
         tpath = []
         for attr in path.split("."):
             cname = ""
@@ -173,15 +236,16 @@ class ElementDispatcher(Service):
             remainders = handlers[handler] = set()
         if remainder:
             remainders.add(remainder)
+            self._pending.add(key)
 
         # Also add them to the reverse table, easing disconnecting
         try:
             reverse = self._reverse[handler]
         except KeyError:
-            reverse = []
+            reverse = set()
             self._reverse[handler] = reverse
 
-        reverse.append(key)
+        reverse.add(key)
 
         # Apply remaining path
         if remainder:
@@ -218,9 +282,15 @@ class ElementDispatcher(Service):
                 property,
                 exc_info=True,
             )
+        if reverse := self._reverse.get(handler):
+            reverse.discard(key)
+            if not reverse:
+                del self._reverse[handler]
 
         if not handlers:
             del self._handlers[key]
+            self._pending.discard(key)
+            self._release_empty_tables()
 
     @event_handler(ElementUpdated)
     def on_element_change_event(self, event):
@@ -250,8 +320,18 @@ class ElementDispatcher(Service):
 
     @event_handler(ModelReady)
     def on_model_loaded(self, event):
-        for (elem, prop), value in list(self._handlers.items()):
+        """Complete the paths registered while the model was loaded.
+
+        No events are emitted while a model is loaded, so paths could
+        not be followed when they were registered. Paths registered
+        before are not affected: a model is loaded in a flushed factory.
+        """
+        for key in list(self._pending):
+            if not (handlers := self._handlers.get(key)):
+                continue
+            elem, prop = key
             prefix = (prop,)
-            for h, remainders in list(value.items()):
-                for remainder in remainders:
+            for h, remainders in list(handlers.items()):
+                for remainder in list(remainders):
                     self._add_handlers(elem, prefix + remainder, h)
+        self._pending.clear()
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import heapq
 from collections import OrderedDict
 from contextlib import contextmanager
+from itertools import count
+from operator import itemgetter
 from typing import Callable, Iterator, Protocol, TypeVar, overload
 
 from gaphor.abc import Service
@@ -13,18 +16,21 @@ from gaphor.core.modeling.element import (
     Element,
     EventWatcherProtocol,
     Handler,
+    PostloadEvent,
     RepositoryProtocol,
     UnlinkEvent,
     generate_id,
 )
 from gaphor.core.modeling.elementdispatcher import ElementDispatcher, EventWatcher
 from gaphor.core.modeling.event import (
+    AttributeUpdated,
     ElementCreated,
     ElementDeleted,
     ModelFlushed,
     ModelReady,
 )
 from gaphor.core.modeling.presentation import Presentation
+from gaphor.core.modeling.properties import attribute, enumeration
 
 T = TypeVar("T", bound=Element)
 P = TypeVar("P", bound=Presentation)
@@ -48,6 +54,45 @@ class RecordingEventManager:
             self.event_manager.handle(*self.events)
 
 
+class AttributeIndex:
+    """Index elements by the value of an attribute, e.g. ``name``.
+
+    Only elements that have an attribute (or enumeration) property
+    with that name, and a value set, are indexed.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._elements: dict[object, dict[Element, None]] = {}
+        self._values: dict[Element, object] = {}
+
+    def value_of(self, element: Element) -> object:
+        prop = getattr(type(element), self.name, None)
+        return prop.get(element) if isinstance(prop, (attribute, enumeration)) else None
+
+    def update(self, element: Element, value: object) -> None:
+        self.remove(element)
+        if value is not None:
+            self._values[element] = value
+            try:
+                self._elements[value][element] = None
+            except KeyError:
+                self._elements[value] = {element: None}
+
+    def remove(self, element: Element) -> None:
+        try:
+            old_value = self._values.pop(element)
+        except KeyError:
+            return
+        elements = self._elements[old_value]
+        del elements[element]
+        if not elements:
+            del self._elements[old_value]
+
+    def select(self, value: object) -> Iterator[Element]:
+        return iter(self._elements.get(value, ()))
+
+
 class ElementFactory(Service):
     """The ElementFactory is used to create elements and do lookups to
     elements.
@@ -68,6 +113,13 @@ class ElementFactory(Service):
         self.event_manager: EventHandler | None = event_manager
         self.element_dispatcher = element_dispatcher
         self._elements: dict[str, Element] = OrderedDict()
+        # Type index: exact type -> {element: creation order}
+        self._elements_by_type: dict[type, dict[Element, int]] = {}
+        # Query cache: type -> indexed (sub)types
+        self._indexed_subtypes: dict[type, list[type]] = {}
+        self._order = count()
+        # Secondary indexes: attribute name -> index
+        self._attribute_indexes: dict[str, AttributeIndex] = {}
         if event_manager:
             event_manager.subscribe(self._on_unlink_event)
 
@@ -106,15 +158,27 @@ class ElementFactory(Service):
         else:
             raise TypeError(f"Type {type} is not a valid model element")
 
+        if not self.event_manager:
+            # Events are blocked, e.g. in bulk_create(): nothing to record.
+            element = type(id=id, **type_args)  # type: ignore[arg-type]
+            self._add_element(element)
+            return element
+
         # Avoid events that reference this element before its created-event is emitted.
         event_recorder = RecordingEventManager(self.event_manager)
         with self.block_events(event_recorder):
             element = type(id=id, **type_args)  # type: ignore[arg-type]
-        self._elements[id] = element
+        self._add_element(element)
         self.handle(ElementCreated(self, element, diagram))
         event_recorder.replay()
         return element
 
+    def _add_element(self, element: Element) -> None:
+        self._elements[element.id] = element
+        self._index_element(element)
+        for index in self._attribute_indexes.values():
+            index.update(element, index.value_of(element))
+
     def size(self) -> int:
         """Return the amount of elements currently in the factory."""
         return len(self._elements)
@@ -149,10 +213,77 @@ class ElementFactory(Service):
         if expression is None:
             yield from self._elements.values()
         elif isinstance(expression, type):
-            yield from (e for e in self._elements.values() if isinstance(e, expression))
+            yield from self._select_type(expression)
         else:
             yield from (e for e in self._elements.values() if expression(e))
 
+    def _select_type(self, type: type[T]) -> Iterator[T]:
+        """Find elements of a type (and subtypes) by means of the type
+        index.
+
+        Elements are returned in order of creation.
+        """
+        try:
+            subtypes = self._indexed_subtypes[type]
+        except KeyError:
+            subtypes = self._indexed_subtypes[type] = [
+                t for t in self._elements_by_type if issubclass(t, type)
+            ]
+
+        indexes = [index for t in subtypes if (index := self._elements_by_type[t])]
+        if len(indexes) == 1:
+            return iter(indexes[0])  # type: ignore[arg-type]
+        return (
+            e  # type: ignore[misc]
+            for e, _ in heapq.merge(
+                *(index.items() for index in indexes), key=itemgetter(1)
+            )
+        )
+
+    def _index_element(self, element: Element) -> None:
+        try:
+            index = self._elements_by_type[type(element)]
+        except KeyError:
+            index = self._elements_by_type[type(element)] = {}
+            self._indexed_subtypes.clear()
+        index[element] = next(self._order)
+
+    def _unindex_element(self, element: Element) -> None:
+        if index := self._elements_by_type.get(type(element)):
+            index.pop(element, None)
+
+    def add_index(self, name: str) -> None:
+        """Keep an index of elements by the value of attribute `name`.
+
+        Adding an index for an attribute that is already indexed has no
+        effect.
+        """
+        if name in self._attribute_indexes:
+            return
+        index = AttributeIndex(name)
+        for element in self._elements.values():
+            index.update(element, index.value_of(element))
+        self._attribute_indexes[name] = index
+
+    def select_by(
+        self, name: str, value: object, type: type[T] | None = None
+    ) -> Iterator[T]:
+        """Iterate elements with attribute `name` set to `value`.
+
+        Optionally the elements can be restricted to `type`. An index
+        for the attribute is created on first use.
+        """
+        try:
+            index = self._attribute_indexes[name]
+        except KeyError:
+            self.add_index(name)
+            index = self._attribute_indexes[name]
+
+        if type is None:
+            yield from index.select(value)  # type: ignore[misc]
+        else:
+            yield from (e for e in index.select(value) if isinstance(e, type))
+
     def lselect(
         self, expression: Callable[[Element], bool] | type[T] | None = None
     ) -> list[Element]:
@@ -204,6 +335,17 @@ class ElementFactory(Service):
         ModelReady event from gaphor.core.modeling.event."""
         self.handle(ModelReady(self))
 
+    @contextmanager
+    def bulk_create(self):
+        """Create many elements at once, e.g. when loading a model.
+
+        No events are emitted while elements are created and their
+        references are set. A ModelReady event is sent when done.
+        """
+        with self.block_events():
+            yield self
+        self.model_ready()
+
     @contextmanager
     def block_events(self, new_event_manager: EventHandler | None = None):
         """Block events from being emitted.
@@ -220,6 +362,14 @@ class ElementFactory(Service):
 
     def handle(self, event: object) -> None:
         """Handle events coming from elements."""
+        if isinstance(event, AttributeUpdated):
+            if index := self._attribute_indexes.get(event.property.name):
+                index.update(event.element, event.new_value)
+        elif isinstance(event, PostloadEvent):
+            for index in self._attribute_indexes.values():
+                index.update(event.element, index.value_of(event.element))
+            return
+
         if self.event_manager:
             self.event_manager.handle(event)
         elif isinstance(event, UnlinkEvent):
@@ -234,6 +384,9 @@ class ElementFactory(Service):
             del self._elements[element.id]
         except KeyError:
             return
+        self._unindex_element(element)
+        for index in self._attribute_indexes.values():
+            index.remove(element)
         if self.event_manager:
             self.event_manager.handle(
                 ElementDeleted(self, event.element, event.diagram)
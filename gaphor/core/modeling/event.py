@@ -27,6 +27,8 @@ class RevertibeEvent:
 class ElementUpdated:
     """Generic event fired when element state changes."""
 
+    __slots__ = ("element", "property")
+
     def __init__(self, element, property):
         self.element = element
         self.property = property
@@ -35,6 +37,8 @@ class ElementUpdated:
 class AttributeUpdated(ElementUpdated):
     """A attribute has changed value."""
 
+    __slots__ = ("old_value", "new_value")
+
     def __init__(self, element, attribute, old_value, new_value):
         """Constructor.
 
@@ -48,10 +52,17 @@ class AttributeUpdated(ElementUpdated):
         self.old_value = old_value
         self.new_value = new_value
 
+    @property
+    def coalesce_key(self):
+        """In a batch, a later update of the attribute supersedes this one."""
+        return (type(self), self.element, self.property)
+
 
 class AssociationUpdated(ElementUpdated):
     """An association element has changed."""
 
+    __slots__ = ()
+
     def __init__(self, element, association):
         """Constructor.
 
@@ -66,6 +77,8 @@ class AssociationUpdated(ElementUpdated):
 class AssociationSet(AssociationUpdated):
     """An association element has been set."""
 
+    __slots__ = ("old_value", "new_value")
+
     def __init__(self, element, association, old_value, new_value):
         """Constructor.
 
@@ -79,10 +92,18 @@ class AssociationSet(AssociationUpdated):
         self.old_value = old_value
         self.new_value = new_value
 
+    @property
+    def coalesce_key(self):
+        """In a batch, a later update of the association supersedes this
+        one."""
+        return (type(self), self.element, self.property)
+
 
 class AssociationAdded(AssociationUpdated):
     """An association element has been added."""
 
+    __slots__ = ("new_value",)
+
     def __init__(self, element, association, new_value):
         """Constructor.
 
@@ -98,6 +119,8 @@ class AssociationAdded(AssociationUpdated):
 class AssociationDeleted(AssociationUpdated):
     """An association element has been deleted."""
 
+    __slots__ = ("old_value",)
+
     def __init__(self, element, association, old_value):
         """Constructor.
 
@@ -113,10 +136,14 @@ class AssociationDeleted(AssociationUpdated):
 class DerivedUpdated(AssociationUpdated):
     """A derived property has changed."""
 
+    __slots__ = ()
+
 
 class DerivedSet(AssociationSet, DerivedUpdated):
     """A generic derived set event."""
 
+    __slots__ = ()
+
     def __init__(self, element, association, old_value, new_value):
         """Constructor.
 
@@ -131,6 +158,8 @@ class DerivedSet(AssociationSet, DerivedUpdated):
 class DerivedAdded(AssociationAdded, DerivedUpdated):
     """A derived property has been added."""
 
+    __slots__ = ()
+
     def __init__(self, element, association, new_value):
         """Constructor.
 
@@ -145,6 +174,8 @@ class DerivedAdded(AssociationAdded, DerivedUpdated):
 class DerivedDeleted(AssociationDeleted, DerivedUpdated):
     """A derived property has been deleted."""
 
+    __slots__ = ()
+
     def __init__(self, element, association, old_value):
         """Constructor.
 
@@ -159,6 +190,8 @@ class DerivedDeleted(AssociationDeleted, DerivedUpdated):
 class RedefinedSet(AssociationSet):
     """A redefined property has been set."""
 
+    __slots__ = ()
+
     def __init__(self, element, association, old_value, new_value):
         """Constructor.
 
@@ -173,6 +206,8 @@ class RedefinedSet(AssociationSet):
 class RedefinedAdded(AssociationAdded):
     """A redefined property has been added."""
 
+    __slots__ = ()
+
     def __init__(self, element, association, new_value):
         """Constructor.
 
@@ -187,6 +222,8 @@ class RedefinedAdded(AssociationAdded):
 class RedefinedDeleted(AssociationDeleted):
     """A redefined property has been deleted."""
 
+    __slots__ = ()
+
     def __init__(self, element, association, old_value):
         """Constructor.
 
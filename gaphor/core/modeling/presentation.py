@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING, Generic, TypeVar
 
 from gaphas.item import Matrices
 
-from gaphor.core.modeling.element import Element, Id, UnlinkEvent
+from gaphor.core.modeling.element import Element, Handler, Id, UnlinkEvent
 from gaphor.core.modeling.event import RevertibeEvent
 from gaphor.core.modeling.properties import relation_many, relation_one
 
@@ -40,8 +40,10 @@ class Presentation(Matrices, Element, Generic[S]):
                 self.diagram.request_update(self)
 
         self._watcher = self.watcher(default_handler=update)
-        self.watch("subject")
-        self.watch("children")
+        self._deferred_watches: list[tuple[tuple[str, ...], Handler | None]] | None = (
+            None if diagram.watches_enabled else []
+        )
+        self.watch_all(("subject", "children"), defer=True)
         self.watch("diagram", self._on_diagram_changed)
         self.watch("parent", self._on_parent_changed)
         self.matrix.add_handler(self._on_matrix_changed)
@@ -55,18 +57,47 @@ class Presentation(Matrices, Element, Generic[S]):
         if self.diagram:
             self.diagram.request_update(self)
 
-    def watch(self, path, handler=None):
+    def watch(self, path, handler=None, defer=False):
         """Watch a certain path of elements starting with the DiagramItem. The
         handler is optional and will default to a simple self.request_update().
 
         Watches should be set in the constructor, so they can be registered
         and unregistered in one shot.
 
+        Watches that only update the item's appearance can be deferred
+        until the diagram is displayed, with `defer=True`.
+
+        This interface is fluent(returns self).
+        """
+        return self.watch_all((path,), handler, defer)
+
+    def watch_all(self, paths, handler=None, defer=False):
+        """Watch a number of paths with the same handler.
+
         This interface is fluent(returns self).
         """
-        self._watcher.watch(path, handler)
+        if defer and self._deferred_watches is not None:
+            self._deferred_watches.append((tuple(paths), handler))
+        else:
+            self._watcher.watch_all(paths, handler)
         return self
 
+    def enable_watches(self):
+        """Subscribe the deferred watches.
+
+        The shapes are updated, since changes made in the meantime have
+        not been noticed.
+        """
+        deferred = self._deferred_watches
+        if deferred is None:
+            return
+
+        self._deferred_watches = None
+        for paths, handler in deferred:
+            self._watcher.watch_all(paths, handler)
+        if update_shapes := getattr(self, "update_shapes", None):
+            update_shapes()
+
     def change_parent(self, new_parent):
         """Change the parent and update the item's matrix so the item visualy
         remains in the same place."""
@@ -136,5 +167,9 @@ class MatrixUpdated(RevertibeEvent):
         super().__init__(element)
         self.old_value = old_value
 
+    @property
+    def coalesce_key(self):
+        return (type(self), self.element)
+
     def revert(self, target):
         target.matrix.set(*self.old_value)
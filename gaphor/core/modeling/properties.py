@@ -121,6 +121,31 @@ T = TypeVar("T")
 Lower = Union[Literal[0], Literal[1], Literal[2]]
 Upper = Union[Literal[1], Literal[2], Literal["*"]]
 
+# Cache of umlproperty's per class: class -> (property, ..)
+_umlproperty_tables: dict[type, tuple[umlproperty, ...]] = {}
+
+
+def umlproperty_table(cls: type) -> tuple[umlproperty, ...]:
+    """Return all properties defined on a class, sorted by name.
+
+    The table is computed once per class. It is invalidated when new
+    properties are created, since a property is assigned to a class
+    right after it has been created.
+    """
+    try:
+        return _umlproperty_tables[cls]
+    except KeyError:
+        pass
+
+    table = tuple(
+        prop
+        for propname in dir(cls)
+        if not propname.startswith("_")
+        and isinstance(prop := getattr(cls, propname), umlproperty)
+    )
+    _umlproperty_tables[cls] = table
+    return table
+
 
 class umlproperty:
     """Superclass for an attribute, enumeration, and association.
@@ -141,6 +166,7 @@ class umlproperty:
         self._dependent_properties: set[derived | redefine] = set()
         self.name = name
         self._name = f"_{name}"
+        _umlproperty_tables.clear()
 
     def __get__(self, obj, class_=None):
         return self.get(obj) if obj else self
@@ -421,16 +447,15 @@ class association(umlproperty):
         c: collection = self._get_many(obj)
         if value in c:
             if from_load:
-                c.items.remove(value)
-                c.items.append(value)
+                c._discard(value)
+                c._add(value)
             return
 
-        c.items.append(value)
+        c._add(value)
         try:
             self._set_opposite(obj, value, from_opposite)
         except Exception:
-            if value in c.items:
-                c.items.remove(value)
+            c._discard(value)
             raise
 
         self.handle(AssociationAdded(obj, self, value))
@@ -447,6 +472,7 @@ class association(umlproperty):
                 # Do not let property start with underscore, or it will not be found
                 # as a umlproperty.
                 setattr(self.type, "GAPHOR__associationstub__%x" % id(self), self.stub)
+                _umlproperty_tables.clear()
             self.stub.set(value, obj)
 
     def delete(self, obj, value, from_opposite=False, do_notify=True):
@@ -480,17 +506,11 @@ class association(umlproperty):
 
         c: collection = self._get_many(obj)
         if c:
-            items = c.items
-            try:
-                items.remove(value)
-            except ValueError:
-                pass
-            else:
-                if do_notify:
-                    self.handle(AssociationDeleted(obj, self, value))
+            if c._discard(value) and do_notify:
+                self.handle(AssociationDeleted(obj, self, value))
 
             # Remove items collection if empty
-            if not items:
+            if not c:
                 delattr(obj, self._name)
 
     def _del_opposite(self, obj, value, from_opposite):
@@ -569,12 +589,15 @@ class associationstub(umlproperty):
 
 
 class unioncache:
-    """Small cache helper object for derivedunions."""
+    """Small cache helper object for derivedunions.
 
-    def __init__(self, owner: object, data: object, version: int) -> None:
+    The cache is stored on the element. It is dropped when one of the
+    subsets of the derived property changes on that element.
+    """
+
+    def __init__(self, owner: object, data: object) -> None:
         self.owner = owner
         self.data = data
-        self.version = version
 
 
 class derived(umlproperty, Generic[T]):
@@ -601,7 +624,6 @@ class derived(umlproperty, Generic[T]):
         *subsets: relation,
     ) -> None:
         super().__init__(name)
-        self.version = 1
         self.type = type
         self.lower = lower
         self.upper = upper
@@ -626,7 +648,7 @@ class derived(umlproperty, Generic[T]):
         )
 
     def postload(self, obj):
-        self.version += 1
+        self.invalidate(obj)
         if self.upper == 1:
             u = self.filter(obj)
             assert (
@@ -649,18 +671,26 @@ class derived(umlproperty, Generic[T]):
             assert (
                 len(u) <= 1
             ), f"Derived union {self.name} of item {obj.id} should have length 1 {tuple(u)}"
-            uc = unioncache(self, u[0] if u else None, self.version)
+            uc = unioncache(self, u[0] if u else None)
         else:
-            uc = unioncache(self, collectionlist(u), self.version)
+            uc = unioncache(self, collectionlist(u))
         setattr(obj, self._name, uc)
         return uc
 
+    def invalidate(self, obj):
+        """Drop the cached union of an element.
+
+        Only the element whose subsets changed is affected.
+        """
+        try:
+            delattr(obj, self._name)
+        except AttributeError:
+            pass
+
     def get(self, obj):
         if self.subsets:
             try:
                 uc = getattr(obj, self._name)
-                if uc.version != self.version:
-                    uc = self._update(obj)
                 assert self is uc.owner
             except AttributeError:
                 uc = self._update(obj)
@@ -700,13 +730,13 @@ class derived(umlproperty, Generic[T]):
             # ), f"Can only handle [0..1] set-events, not {event} for {event.element}"
             old_value = hasattr(event.element, self._name) and self.get(event.element)
             # Make sure unions are created again
-            self.version += 1
+            self.invalidate(event.element)
             new_value = self.get(event.element)
             if old_value != new_value:
                 self.handle(DerivedSet(event.element, self, old_value, new_value))
         else:
             # Make sure unions are created again
-            self.version += 1
+            self.invalidate(event.element)
 
             if isinstance(event, AssociationSet):
                 self.handle(DerivedDeleted(event.element, self, event.old_value))
@@ -783,7 +813,7 @@ class derivedunion(derived[T]):
         if event.property not in self.subsets:
             return
         # Make sure unions are created again
-        self.version += 1
+        self.invalidate(event.element)
 
         if not isinstance(event, AssociationUpdated):
             return
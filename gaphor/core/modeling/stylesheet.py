@@ -65,18 +65,34 @@ class StyleSheet(Element):
     def __init__(self, id=None, model=None):
         super().__init__(id, model)
 
+        self._changed_names: set[str] | None = None
         self.compile_style_sheet()
 
     styleSheet: attribute[str] = attribute("styleSheet", str, DEFAULT_STYLE_SHEET)
 
     def compile_style_sheet(self) -> None:
-        self._compiled_style_sheet = CompiledStyleSheet(
-            SYSTEM_STYLE_SHEET, self.styleSheet
+        compiled_style_sheet = CompiledStyleSheet(SYSTEM_STYLE_SHEET, self.styleSheet)
+        old_style_sheet = getattr(self, "_compiled_style_sheet", None)
+        self._changed_names = (
+            compiled_style_sheet.changed_names(old_style_sheet)
+            if old_style_sheet
+            else None
         )
+        self._compiled_style_sheet = compiled_style_sheet
 
     def match(self, node: StyleNode) -> Style:
         return self._compiled_style_sheet.match(node)
 
+    def changed(self, node: StyleNode) -> bool:
+        """Can the style of the node have changed by the last compilation of
+        the style sheet?
+
+        Only nodes for which the matching rules changed need to be styled
+        again.
+        """
+        changed_names = self._changed_names
+        return changed_names is None or node.name() in changed_names
+
     def postload(self):
         super().postload()
         self.compile_style_sheet()
@@ -134,3 +134,80 @@ def test_swap():
     c.swap("a", "c")
     assert c.items == ["c", "b", "a"]
     assert o.events
+
+
+def test_add_and_discard_keep_insertion_order():
+    c: collection[str] = collection(None, None, str)
+    for v in "abcd":
+        c._add(v)
+
+    assert c._discard("b")
+    assert not c._discard("b")
+    assert "b" not in c
+    assert c.items == ["a", "c", "d"]
+    assert len(c) == 3
+
+
+def test_discard_last_item_keeps_items_list():
+    c: collection[str] = collection(None, None, str)
+    c.items = ["a", "b"]  # type: ignore[assignment]
+    items = c.items
+
+    c._discard("b")
+
+    assert c.items is items
+    assert items == ["a"]
+
+
+def test_iteration_is_not_affected_by_removal():
+    c: collection[str] = collection(None, None, str)
+    c.items = ["a", "b", "c"]  # type: ignore[assignment]
+
+    assert [v for v in c if c._discard(v)] == ["a", "b", "c"]
+    assert not c
+
+
+def test_order():
+    o = MockElement()
+    c: collection[str] = collection(None, o, str)
+    c.items = ["b", "c", "a"]  # type: ignore[assignment]
+
+    c.order(lambda v: v)
+
+    assert c.items == ["a", "b", "c"]
+    assert list(c._members) == ["a", "b", "c"]
+    assert o.events
+
+
+def test_index_after_additions_and_removals():
+    c: collection[int] = collection(None, None, int)
+    for v in range(10):
+        c._add(v)
+
+    assert c.index(5) == 5
+
+    c._discard(2)
+    c._discard(7)
+    c._add(2)
+
+    assert [c.index(v) for v in c] == list(range(9))
+    assert c.index(2) == 8
+
+
+def test_index_of_non_member():
+    c: collection[int] = collection(None, None, int)
+    c._add(1)
+
+    with pytest.raises(ValueError):
+        c.index(2)
+
+
+def test_index_after_many_additions():
+    c: collection[int] = collection(None, None, int)
+    c._add(0)
+    c.index(0)
+
+    for v in range(1, 100):
+        c._add(v)
+
+    assert c.index(99) == 99
@@ -1,7 +1,9 @@
 import gaphas
 import pytest
 
+from gaphor.core import event_handler
 from gaphor.core.modeling import Diagram, Presentation, StyleSheet
+from gaphor.core.modeling.event import AssociationUpdated
 
 
 class Example(gaphas.Element, Presentation):
@@ -72,6 +74,28 @@ def test_diagram_stylesheet(element_factory):
     assert diagram.styleSheet is styleSheet
 
 
+def test_diagram_stylesheet_is_cached(element_factory, monkeypatch):
+    diagram = element_factory.create(Diagram)
+    styleSheet = element_factory.create(StyleSheet)
+    diagram.styleSheet
+
+    monkeypatch.setattr(element_factory, "select", None)
+
+    assert diagram.styleSheet is styleSheet
+
+
+def test_diagram_stylesheet_is_replaced(element_factory):
+    diagram = element_factory.create(Diagram)
+    styleSheet = element_factory.create(StyleSheet)
+    diagram.styleSheet
+
+    styleSheet.unlink()
+    assert diagram.styleSheet is None
+
+    newStyleSheet = element_factory.create(StyleSheet)
+    assert diagram.styleSheet is newStyleSheet
+
+
 class ViewMock:
     def __init__(self):
         self.removed_items = set()
@@ -118,3 +142,128 @@ def test_order_grouped_presentations(diagram):
     example_1.parent = example_2
 
     assert list(diagram.get_all_items()) == [example_2, example_1]
+
+
+def test_order_nested_presentations_depth_first(diagram):
+    example_1 = diagram.create(Example)
+    example_2 = diagram.create(Example)
+    example_3 = diagram.create(Example)
+    example_line = diagram.create(ExampleLine)
+
+    example_3.parent = example_1
+    example_2.parent = example_3
+    example_line.parent = example_2
+
+    assert list(diagram.get_all_items()) == [
+        example_1,
+        example_3,
+        example_2,
+        example_line,
+    ]
+
+
+def test_order_keeps_sibling_order(diagram):
+    example_1 = diagram.create(Example)
+    example_2 = diagram.create(Example)
+    example_3 = diagram.create(Example)
+
+    example_2.parent = example_3
+    example_1.parent = example_3
+
+    assert list(diagram.get_all_items()) == [example_3, example_1, example_2]
+
+
+def test_append_in_order_does_not_reorder(diagram, event_manager):
+    events = []
+
+    @event_handler(AssociationUpdated)
+    def handler(event):
+        if event.property is Diagram.ownedPresentation:
+            events.append(event)
+
+    diagram.create(Example)
+    diagram.create(ExampleLine)
+    event_manager.subscribe(handler)
+
+    diagram.create(ExampleLine)
+
+    assert not [e for e in events if type(e) is AssociationUpdated]
+
+
+class ShapedExample(Example):
+    def __init__(self, diagram, id):
+        super().__init__(diagram, id)
+        self.shape_updates = 0
+        self.watch("subject.comment", self.update_shapes, defer=True)
+        self.watch("subject.ownedElement", self.update_shapes)
+        self.watch("subject.owner", lambda event: self.update_shapes(event), defer=True)
+
+    def update_shapes(self, event=None):
+        self.shape_updates += 1
+
+
+def test_presentation_watches_by_default(diagram):
+    example = diagram.create(ShapedExample)
+
+    assert diagram.watches_enabled
+    assert "subject" in example._watcher._watched_paths
+    assert "subject.comment" in example._watcher._watched_paths
+
+
+def test_deferred_watches(diagram):
+    diagram.defer_watches()
+    example = diagram.create(ShapedExample)
+
+    assert "diagram" in example._watcher._watched_paths
+    assert "parent" in example._watcher._watched_paths
+    assert "subject" not in example._watcher._watched_paths
+    assert "subject.comment" not in example._watcher._watched_paths
+
+
+def test_watches_are_not_deferred_by_default(diagram):
+    diagram.defer_watches()
+    example = diagram.create(ShapedExample)
+
+    assert "subject.ownedElement" in example._watcher._watched_paths
+
+
+def test_deferred_watch_with_any_handler(diagram):
+    diagram.defer_watches()
+    example = diagram.create(ShapedExample)
+
+    assert "subject.owner" not in example._watcher._watched_paths
+
+    diagram.enable_watches()
+
+    assert "subject.owner" in example._watcher._watched_paths
+
+
+def test_enable_deferred_watches(diagram):
+    diagram.defer_watches()
+    example = diagram.create(ShapedExample)
+
+    diagram.enable_watches()
+
+    assert "subject" in example._watcher._watched_paths
+    assert "subject.comment" in example._watcher._watched_paths
+    assert example.shape_updates == 1
+
+
+def test_register_view_enables_watches(diagram):
+    diagram.defer_watches()
+    example = diagram.create(ShapedExample)
+
+    diagram.register_view(object())
+
+    assert diagram.watches_enabled
+    assert "subject.comment" in example._watcher._watched_paths
+
+
+def test_update_now_enables_watches(diagram):
+    diagram.defer_watches()
+    example = diagram.create(ShapedExample)
+
+    diagram.update_now((example,))
+
+    assert diagram.watches_enabled
+    assert "subject.comment" in example._watcher._watched_paths
@@ -8,6 +8,7 @@ from gaphor.core.modeling.diagram import (
     Diagram,
     StyledDiagram,
     StyledItem,
+    StyledItems,
 )
 
 
@@ -53,6 +54,54 @@ def test_diagram_has_no_parent(diagram):
     assert node.parent() is None
 
 
+def test_parent_is_created_once(diagram: Diagram):
+    item = diagram.create(DemoItem)
+    node = StyledItem(item)
+
+    assert node.parent() is node.parent()
+
+
+def test_styled_items_share_parents(diagram: Diagram):
+    parent = diagram.create(DemoItem)
+    child_a = diagram.create(DemoItem)
+    child_b = diagram.create(DemoItem)
+    child_a.parent = parent
+    child_b.parent = parent
+    styled_items = StyledItems(diagram)
+
+    assert styled_items(child_a).parent() is styled_items(child_b).parent()
+    assert styled_items(child_a).parent() is styled_items(parent)
+    assert styled_items(parent).parent() is styled_items(None)
+
+
+def test_styled_items_are_reused(diagram: Diagram):
+    item = diagram.create(DemoItem)
+    styled_items = StyledItems(diagram)
+
+    assert styled_items(item) is styled_items(item)
+    assert styled_items(None).name() == "diagram"
+
+
+def test_style_sheet_changed_for_edited_rules(diagram):
+    style_sheet = StyleSheet()
+    style_sheet.styleSheet = "demo { color: red } other { color: red }"
+    node = StyledItem(diagram.create(DemoItem))
+
+    style_sheet.styleSheet = "demo { color: red } other { color: blue }"
+    unchanged = style_sheet.changed(node)
+    style_sheet.styleSheet = "demo { color: blue } other { color: blue }"
+
+    assert not unchanged
+    assert style_sheet.changed(node)
+
+
+def test_new_style_sheet_is_changed(diagram):
+    style_sheet = StyleSheet()
+    node = StyledItem(diagram.create(DemoItem))
+
+    assert style_sheet.changed(node)
+
+
 def test_style_sheet_has_default_style():
     style_sheet = StyleSheet()
 
@@ -419,3 +419,127 @@ def test_cyclic(element_factory, dispatcher, handler):
 
     a.unlink()
     assert 1 == len(dispatcher._handlers)
+
+
+def test_compiled_path_is_cached(dispatcher, uml_class, element_factory):
+    other_class = element_factory.create(UML.Class)
+
+    props = dispatcher._path_to_properties(uml_class, "ownedOperation.name")
+
+    assert props == (UML.Class.ownedOperation, UML.Operation.name)
+    assert dispatcher._path_to_properties(other_class, "ownedOperation.name") is props
+
+
+def test_compiled_path_with_cast_is_cached(dispatcher, element_factory):
+    association = element_factory.create(UML.Association)
+    path = "memberEnd[Property].aggregation"
+
+    props = dispatcher._path_to_properties(association, path)
+
+    assert props == (UML.Association.memberEnd, UML.Property.aggregation)
+    assert dispatcher._path_to_properties(association, path) is props
+
+
+def test_subscribe_all(dispatcher, uml_class, uml_operation, handler):
+    dispatcher.subscribe_all(
+        handler, uml_class, ("name", "ownedOperation", "ownedOperation.name")
+    )
+
+    uml_class.name = "Klass"
+    uml_class.ownedOperation = uml_operation
+    uml_operation.name = "func"
+
+    assert len(handler.events) == 3
+
+    dispatcher.unsubscribe(handler)
+
+    assert not dispatcher._handlers
+
+
+def test_watch_all(element_factory, dispatcher, handler):
+    a = element_factory.create(A)
+    watcher = EventWatcher(a, dispatcher, handler)
+    watcher.watch_all(("one", "one.two"))
+
+    a.one = element_factory.create(A)
+    a.one.two = element_factory.create(A)
+
+    assert len(handler.events) == 2
+
+    watcher.unsubscribe_all()
+
+    assert not dispatcher._handlers
+
+
+def test_register_handler_twice_has_no_duplicates(dispatcher, uml_class, handler):
+    dispatcher.subscribe(handler, uml_class, "ownedOperation.name")
+    statistics = dispatcher.statistics()
+
+    dispatcher.subscribe(handler, uml_class, "ownedOperation.name")
+
+    assert dispatcher.statistics() == statistics
+    assert statistics == {"handlers": 1, "keys": 1, "subscriptions": 1, "reverse": 1}
+
+
+def test_model_loaded_completes_paths(
+    element_factory, dispatcher, uml_class, uml_operation, handler
+):
+    with element_factory.block_events():
+        dispatcher.subscribe(handler, uml_class, "ownedOperation.name")
+        uml_class.ownedOperation = uml_operation
+
+    assert dispatcher.statistics()["keys"] == 1
+
+    element_factory.model_ready()
+
+    assert dispatcher.statistics()["keys"] == 2
+    assert not dispatcher._pending
+
+    uml_operation.name = "func"
+
+    assert len(handler.events) == 1
+
+
+def test_model_loaded_does_not_change_tables(element_factory, dispatcher, handler):
+    a = element_factory.create(A)
+    watcher = EventWatcher(a, dispatcher, handler)
+    watcher.watch("one.two.one")
+    a.one = element_factory.create(A)
+    a.one.two = element_factory.create(A)
+    a.one.two[0].one = element_factory.create(A)
+    statistics = dispatcher.statistics()
+
+    element_factory.model_ready()
+    element_factory.model_ready()
+
+    assert dispatcher.statistics() == statistics
+
+
+def test_removed_path_is_removed_from_reverse_table(
+    element_factory, dispatcher, handler
+):
+    a = element_factory.create(A)
+    watcher = EventWatcher(a, dispatcher, handler)
+    watcher.watch("one.two")
+    a.one = element_factory.create(A)
+
+    assert dispatcher.statistics()["reverse"] == 2
+
+    del a.one
+
+    assert dispatcher.statistics()["reverse"] == 1
+    assert not dispatcher._pending - set(dispatcher._handlers)
+
+
+def test_emptied_tables_are_released(element_factory, dispatcher, handler):
+    a = element_factory.create(A)
+    watcher = EventWatcher(a, dispatcher, handler)
+    watcher.watch("one.two")
+    a.one = element_factory.create(A)
+    handlers, reverse = dispatcher._handlers, dispatcher._reverse
+
+    watcher.unsubscribe_all()
+
+    assert dispatcher._handlers == {}
+    assert dispatcher._handlers is not handlers
+    assert dispatcher._reverse is not reverse
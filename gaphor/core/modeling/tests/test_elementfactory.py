@@ -4,6 +4,7 @@ from collections.abc import Container, Iterable
 import pytest
 
 from gaphor.core import event_handler
+from gaphor.core.modeling.element import Element
 from gaphor.core.modeling.event import (
     ElementCreated,
     ElementDeleted,
@@ -12,7 +13,7 @@ from gaphor.core.modeling.event import (
     ServiceEvent,
 )
 from gaphor.core.modeling.presentation import Presentation
-from gaphor.UML import Operation, Parameter
+from gaphor.UML import Class, Classifier, Operation, Parameter, Type
 
 
 def test_element_factory_is_an_iterable(element_factory):
@@ -90,6 +91,83 @@ def test_unlink(element_factory):
     assert not list(element_factory.values()), list(element_factory.values())
 
 
+def test_select_by_type(element_factory):
+    p = element_factory.create(Parameter)
+    o = element_factory.create(Operation)
+
+    assert list(element_factory.select(Parameter)) == [p]
+    assert list(element_factory.select(Operation)) == [o]
+    assert element_factory.lselect(Class) == []
+
+
+def test_select_by_type_includes_subtypes_in_order_of_creation(element_factory):
+    c1 = element_factory.create(Class)
+    o = element_factory.create(Operation)
+    t = element_factory.create(Type)
+    c2 = element_factory.create(Class)
+
+    assert element_factory.lselect(Classifier) == [c1, c2]
+    assert element_factory.lselect(Type) == [c1, t, c2]
+    assert element_factory.lselect(Element) == [c1, o, t, c2]
+
+
+def test_select_by_type_after_unlink(element_factory):
+    c1 = element_factory.create(Class)
+    c2 = element_factory.create(Class)
+
+    c1.unlink()
+
+    assert element_factory.lselect(Class) == [c2]
+
+
+def test_select_by_type_after_flush(element_factory):
+    element_factory.create(Class)
+    element_factory.flush()
+
+    assert element_factory.lselect(Class) == []
+
+
+def test_select_by_name(element_factory):
+    c = element_factory.create(Class)
+    c.name = "foo"
+    o = element_factory.create(Operation)
+    o.name = "foo"
+
+    assert list(element_factory.select_by("name", "foo")) == [c, o]
+    assert list(element_factory.select_by("name", "foo", Class)) == [c]
+    assert list(element_factory.select_by("name", "bar")) == []
+
+
+def test_select_by_name_follows_updates(element_factory):
+    element_factory.add_index("name")
+    c = element_factory.create(Class)
+    c.name = "foo"
+    c.name = "bar"
+
+    assert list(element_factory.select_by("name", "foo")) == []
+    assert list(element_factory.select_by("name", "bar")) == [c]
+
+
+def test_select_by_name_after_unlink(element_factory):
+    element_factory.add_index("name")
+    c = element_factory.create(Class)
+    c.name = "foo"
+
+    c.unlink()
+
+    assert list(element_factory.select_by("name", "foo")) == []
+
+
+def test_select_by_name_after_load(element_factory):
+    element_factory.add_index("name")
+    with element_factory.block_events():
+        c = element_factory.create(Class)
+        c.load("name", "foo")
+        c.postload()
+
+    assert list(element_factory.select_by("name", "foo")) == [c]
+
+
 # Event handlers are registered as persisting top level handlers, since no
 # unsubscribe functionality is provided.
 handled = False
@@ -152,6 +230,32 @@ def test_no_create_events_when_blocked(element_factory):
     assert events == [], events
 
 
+def test_bulk_create_only_emits_model_ready(element_factory):
+    with element_factory.bulk_create():
+        p = element_factory.create(Parameter)
+        p.name = "p"
+    assert len(events) == 1, events
+    assert isinstance(last_event, ModelReady)
+
+
+def test_bulk_create_does_not_emit_model_ready_on_error(element_factory):
+    with pytest.raises(ValueError):
+        with element_factory.bulk_create():
+            element_factory.create(Parameter)
+            raise ValueError()
+    assert events == [], events
+
+
+def test_bulk_create_indexes_elements(element_factory):
+    element_factory.add_index("name")
+    with element_factory.bulk_create():
+        c = element_factory.create(Class)
+        c.name = "foo"
+
+    assert list(element_factory.select(Class)) == [c]
+    assert list(element_factory.select_by("name", "foo")) == [c]
+
+
 class TriggerUnlink:
     def __init__(self, element):
         self.element = element
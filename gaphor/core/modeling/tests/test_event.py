@@ -0,0 +1,26 @@
+import inspect
+
+import pytest
+
+from gaphor.core.modeling import event
+
+
+def element_updated_types():
+    return [
+        cls
+        for _, cls in inspect.getmembers(event, inspect.isclass)
+        if issubclass(cls, event.ElementUpdated)
+    ]
+
+
+@pytest.mark.parametrize("event_type", element_updated_types())
+def test_element_updated_events_have_no_instance_dict(event_type):
+    assert "__dict__" not in dir(event_type)
+
+
+def test_derived_events_are_association_events():
+    derived_set = event.DerivedSet(None, None, "old", "new")
+
+    assert isinstance(derived_set, event.AssociationSet)
+    assert isinstance(derived_set, event.DerivedUpdated)
+    assert (derived_set.old_value, derived_set.new_value) == ("old", "new")
@@ -645,3 +645,33 @@ def test_composite():
     a.unlink()
     assert a.is_unlinked
     assert b.is_unlinked
+
+
+def test_umlproperties_are_updated_when_property_is_added():
+    class A(Element):
+        pass
+
+    assert set(A.umlproperties()) == set(Element.umlproperties())
+
+    A.name = attribute("name", str)
+
+    assert A.name in A.umlproperties()
+
+
+def test_umlproperties_contain_association_stub():
+    class A(Element):
+        pass
+
+    class B(Element):
+        pass
+
+    A.one = association("one", B, 0, 1)
+    a = A()
+    b = B()
+    b_properties = set(B.umlproperties())
+
+    a.one = b
+    b.unlink()
+
+    assert set(B.umlproperties()) - b_properties == {A.one.stub}
+    assert a.one is None
@@ -1,7 +1,20 @@
 from __future__ import annotations
 
 import operator
-from typing import Callable, Dict, Iterator, Literal, Protocol, Sequence, Tuple, Union
+from functools import lru_cache
+from itertools import chain
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    Literal,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    Union,
+)
+from weakref import WeakKeyDictionary
 
 import tinycss2
 
@@ -20,7 +33,7 @@ from gaphor.core.styling.properties import (
     TextDecoration,
     VerticalAlign,
 )
-from gaphor.core.styling.selectors import compile_selector_list
+from gaphor.core.styling.selectors import Dependencies, compile_selectors
 
 
 class StyleNode(Protocol):
@@ -45,6 +58,19 @@ Rule = Union[
     Tuple[Literal["error"], Union[tinycss2.ast.ParseError, SelectorError]],
 ]
 
+CompiledRule = Union[
+    Tuple[
+        Tuple[Callable[[object], bool], Tuple[int, int, int], Optional[str]],
+        Dict[str, object],
+    ],
+    Tuple[Literal["error"], Union[tinycss2.ast.ParseError, SelectorError]],
+]
+
+
+# Maximum number of compiled rules and style sheets kept between compilations
+RULE_CACHE_SIZE = 4096
+STYLE_SHEET_CACHE_SIZE = 8
+
 
 def merge_styles(*styles: Style) -> Style:
     style = Style()
@@ -69,18 +95,115 @@ def merge_styles(*styles: Style) -> Style:
 
 
 class CompiledStyleSheet:
+    """A style sheet, ready to match nodes.
+
+    Selectors are grouped by the element name of their rightmost compound
+    selector, so only selectors for the node's name and selectors for any
+    element are evaluated.
+
+    Matched styles are cached by the properties of the node the selectors
+    depend on: its name, state, the attributes used in selectors and,
+    if there are combinators, the same for its ancestors. Styles that
+    depend on child nodes are not cached.
+
+    The key of a parent node is remembered for as long as the node
+    exists, so siblings sharing a parent node (see ``StyledItems``) do
+    not walk their ancestors again. Style nodes are expected to live no
+    longer than one update or paint pass.
+    """
+
     def __init__(self, *css: str):
-        self.selectors = [
-            (selspec[0], selspec[1], order, declarations)
-            for order, (selspec, declarations) in enumerate(parse_style_sheets(*css))
-            if selspec != "error"
+        self.dependencies = Dependencies()
+        rules = []
+        for sheet in css:
+            sheet_rules, sheet_dependencies = compile_style_sheet_cached(sheet)
+            rules.extend(sheet_rules)
+            self.dependencies.update(sheet_dependencies)
+        self.selectors = []
+        # Selectors by the element name they apply to, None for any element
+        self._selectors_by_name: dict[str | None, list] = {}
+        for order, (selspec, declarations) in enumerate(rules):
+            if selspec == "error":
+                continue
+            pred, specificity, name = selspec
+            selector = (pred, specificity, order, declarations)
+            self.selectors.append(selector)
+            self._selectors_by_name.setdefault(name, []).append(selector)
+        self._attributes = tuple(sorted(self.dependencies.attributes))
+        self._cache: dict[tuple, Style] = {}
+        self._parent_keys: WeakKeyDictionary[StyleNode, tuple] = WeakKeyDictionary()
+
+    def changed_names(self, other: CompiledStyleSheet) -> set[str] | None:
+        """The element names for which the matching rules differ from the
+        rules in ``other``.
+
+        Returns ``None`` if rules for any element have changed.
+        """
+        if self._rules_for(None) != other._rules_for(None):
+            return None
+        names = self._selectors_by_name.keys() | other._selectors_by_name.keys()
+        return {
+            name
+            for name in names
+            if name and self._rules_for(name) != other._rules_for(name)
+        }
+
+    def _rules_for(self, name: str | None) -> list:
+        """The rules that can match an element, in style sheet order."""
+        selectors_by_name = self._selectors_by_name
+        candidates = chain(
+            selectors_by_name.get(name, ()) if name else (),
+            selectors_by_name.get(None, ()),
+        )
+        return [
+            (pred, specificity, declarations)
+            for pred, specificity, _, declarations in sorted(
+                candidates, key=operator.itemgetter(2)
+            )
         ]
 
     def match(self, node: StyleNode) -> Style:
+        if self.dependencies.descendants:
+            return self._match(node)
+
+        key = self._key(node)
+        cache = self._cache
+        try:
+            return cache[key]
+        except KeyError:
+            if len(cache) >= STYLE_CACHE_SIZE:
+                cache.clear()
+            style = cache[key] = self._match(node)
+            return style
+
+    def _key(self, node: StyleNode) -> tuple:
+        parent = node.parent() if self.dependencies.ancestors else None
+        return (
+            node.name(),
+            tuple(node.state()),
+            tuple(node.attribute(name) for name in self._attributes),
+            parent and self._parent_key(parent),
+        )
+
+    def _parent_key(self, parent: StyleNode) -> tuple:
+        parent_keys = self._parent_keys
+        try:
+            return parent_keys[parent]
+        except KeyError:
+            key = parent_keys[parent] = self._key(parent)
+            return key
+        except TypeError:
+            return self._key(parent)
+
+    def _match(self, node: StyleNode) -> Style:
+        selectors_by_name = self._selectors_by_name
+        candidates = chain(
+            selectors_by_name.get(node.name(), ()), selectors_by_name.get(None, ())
+        )
         results = sorted(
             (
                 (specificity, order, declarations)
-                for pred, specificity, order, declarations in self.selectors
+                for pred, specificity, order, declarations in candidates
                 if pred(node)
             ),
             key=MATCH_SORT_KEY,
@@ -88,12 +211,29 @@ class CompiledStyleSheet:
         return merge_styles(*(decl for _, _, decl in results))  # type: ignore[arg-type]
 
 
-def parse_style_sheets(*css: str) -> Iterator[Rule]:
+def parse_style_sheets(
+    *css: str, dependencies: Dependencies | None = None
+) -> Iterator[Rule]:
     for sheet in css:
-        yield from parse_style_sheet(sheet)
+        yield from parse_style_sheet(sheet, dependencies)
 
 
-def parse_style_sheet(css: str) -> Iterator[Rule]:
+def parse_style_sheet(
+    css: str, dependencies: Dependencies | None = None
+) -> Iterator[Rule]:
+    for rule in compile_style_sheet(css, dependencies):
+        if rule[0] == "error":
+            yield rule  # type: ignore[misc]
+        else:
+            (pred, specificity, _), declarations = rule
+            yield (pred, specificity), declarations
+
+
+def compile_style_sheet(
+    css: str, dependencies: Dependencies | None = None
+) -> Iterator[CompiledRule]:
+    """Like ``parse_style_sheet()``, but selectors also contain the element
+    name they apply to."""
     rules = tinycss2.parse_stylesheet(
         css or "", skip_comments=True, skip_whitespace=True
     )
@@ -106,18 +246,56 @@ def parse_style_sheet(css: str) -> Iterator[Rule]:
             continue
 
         try:
-            selectors = compile_selector_list(rule.prelude)
+            selectors, selector_dependencies = compile_rule_selectors(
+                tinycss2.serialize(rule.prelude)
+            )
         except SelectorError as e:
             yield "error", e
             continue
 
-        declaration = {
-            prop: value
-            for prop, value in parse_declarations(rule.content)
-            if prop != "error" and value is not None
-        }
+        if dependencies is not None:
+            dependencies.update(selector_dependencies)
+
+        declaration = compile_rule_declarations(tinycss2.serialize(rule.content))
 
         yield from ((selector, declaration) for selector in selectors)
 
 
+@lru_cache(maxsize=RULE_CACHE_SIZE)
+def compile_rule_selectors(prelude: str) -> tuple[tuple, Dependencies]:
+    """Compile the selectors of a rule.
+
+    Compiled selectors are cached by their text, so rules that did not
+    change reuse their predicates when a style sheet is recompiled.
+    """
+    dependencies = Dependencies()
+    selectors = tuple(compile_selectors(prelude, dependencies))
+    return selectors, dependencies
+
+
+@lru_cache(maxsize=RULE_CACHE_SIZE)
+def compile_rule_declarations(content: str) -> Dict[str, object]:
+    return {
+        prop: value
+        for prop, value in parse_declarations(content)
+        if prop != "error" and value is not None
+    }
+
+
+@lru_cache(maxsize=STYLE_SHEET_CACHE_SIZE)
+def compile_style_sheet_cached(
+    css: str,
+) -> tuple[tuple[CompiledRule, ...], Dependencies]:
+    """Compile a complete style sheet, like ``compile_style_sheet()``.
+
+    The system style sheet is compiled only once this way.
+    """
+    dependencies = Dependencies()
+    rules = tuple(compile_style_sheet(css, dependencies))
+    return rules, dependencies
+
+
 MATCH_SORT_KEY = operator.itemgetter(0, 1)
+
+# Maximum number of matched styles kept by a compiled style sheet
+STYLE_CACHE_SIZE = 4096
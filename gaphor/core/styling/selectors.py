@@ -4,6 +4,8 @@ Based on cssselect2.compiler, written by Simon Sapin and Guillaume
 Ayoub.
 """
 
+from __future__ import annotations
+
 import re
 from functools import singledispatch
 
@@ -13,17 +15,65 @@ from gaphor.core.styling import parser
 split_whitespace = re.compile("[^ \t\r\n\f]+").findall
 
 
-def compile_selector_list(input):
+class Dependencies:
+    """The parts of a node, besides its name and state, that selectors
+    depend on."""
+
+    def __init__(self):
+        self.attributes: set[str] = set()
+        self.ancestors = False
+        self.descendants = False
+
+    def update(self, other: Dependencies) -> None:
+        self.attributes.update(other.attributes)
+        self.ancestors = self.ancestors or other.ancestors
+        self.descendants = self.descendants or other.descendants
+
+
+def compile_selector_list(input, dependencies: Dependencies | None = None):
     """Compile a (comma-separated) list of selectors.
 
     Based on cssselect2.compiler.compile_selector_list().
 
-    Returns a list of compiled selectors.
+    Returns a list of compiled selectors. If ``dependencies`` is provided,
+    the node properties the selectors depend on are added to it.
     """
     return [
-        (compile_node(selector), selector.specificity)
-        for selector in parser.parse(input)
+        (pred, specificity)
+        for pred, specificity, _ in compile_selectors(input, dependencies)
+    ]
+
+
+def compile_selectors(input, dependencies: Dependencies | None = None):
+    """Compile a (comma-separated) list of selectors.
+
+    Like ``compile_selector_list()``, but each compiled selector also
+    contains the element name the selector applies to, or ``None`` if it
+    applies to any element.
+    """
+    selectors = list(parser.parse(input))
+    compiled = [
+        (compile_node(selector), selector.specificity, selector_name(selector))
+        for selector in selectors
     ]
+    if dependencies is not None:
+        for selector in selectors:
+            collect_dependencies(selector, dependencies)
+    return compiled
+
+
+def selector_name(selector) -> str | None:
+    """The element name of the rightmost compound selector."""
+    while isinstance(selector, parser.CombinedSelector):
+        selector = selector.right
+    return next(
+        (
+            sel.lower_local_name
+            for sel in selector.simple_selectors
+            if isinstance(sel, parser.LocalNameSelector)
+        ),
+        None,
+    )
 
 
 @singledispatch
@@ -48,9 +98,9 @@ def compile_name_selector(selector: parser.LocalNameSelector):
 
 def ancestors(el):
     p = el.parent()
-    if p:
+    while p:
         yield p
-        yield from ancestors(p)
+        p = p.parent()
 
 
 def descendants(el):
@@ -138,3 +188,54 @@ def compile_functional_pseudo_class_selector(
         return lambda el: any(sel(el) for sel, _ in sub_selectors)
     elif name == "not":
         return lambda el: not any(sel(el) for sel, _ in sub_selectors)
+
+
+@singledispatch
+def collect_dependencies(selector, dependencies: Dependencies) -> None:
+    """Add the node properties a selector depends on.
+
+    Name and pseudo-class selectors only depend on the node's name and
+    state.
+    """
+
+
+@collect_dependencies.register
+def compound_selector_dependencies(
+    selector: parser.CompoundSelector, dependencies: Dependencies
+):
+    for sel in selector.simple_selectors:
+        collect_dependencies(sel, dependencies)
+
+
+@collect_dependencies.register
+def combined_selector_dependencies(
+    selector: parser.CombinedSelector, dependencies: Dependencies
+):
+    dependencies.ancestors = True
+    collect_dependencies(selector.left, dependencies)
+    collect_dependencies(selector.right, dependencies)
+
+
+@collect_dependencies.register
+def attribute_selector_dependencies(
+    selector: parser.AttributeSelector, dependencies: Dependencies
+):
+    dependencies.attributes.add(selector.lower_name)
+
+
+@collect_dependencies.register
+def pseudo_class_selector_dependencies(
+    selector: parser.PseudoClassSelector, dependencies: Dependencies
+):
+    if selector.name == "empty":
+        dependencies.descendants = True
+
+
+@collect_dependencies.register
+def functional_pseudo_class_selector_dependencies(
+    selector: parser.FunctionalPseudoClassSelector, dependencies: Dependencies
+):
+    if selector.name == "has":
+        dependencies.descendants = True
+    for sel in parser.parse(selector.arguments):
+        collect_dependencies(sel, dependencies)
@@ -250,3 +250,165 @@ def test_broken_line_style():
     props = compiled_style_sheet.match(Node("mytype"))
 
     assert props.get("line-style") is None
+
+
+class CountingNode(Node):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.name_calls = 0
+
+    def name(self):
+        self.name_calls += 1
+        return super().name()
+
+
+def test_matched_style_is_cached():
+    css = "mytype { color: red } other { color: blue }"
+    compiled_style_sheet = CompiledStyleSheet(css)
+    node = CountingNode("mytype")
+
+    props = compiled_style_sheet.match(node)
+    calls = node.name_calls
+
+    assert compiled_style_sheet.match(node) is props
+    assert node.name_calls == calls + 1
+
+
+def test_style_cache_depends_on_referenced_attributes():
+    css = "mytype[name=a] { color: red }"
+    compiled_style_sheet = CompiledStyleSheet(css)
+
+    props_a = compiled_style_sheet.match(Node("mytype", attributes={"name": "a"}))
+    props_b = compiled_style_sheet.match(Node("mytype", attributes={"name": "b"}))
+
+    assert compiled_style_sheet.dependencies.attributes == {"name"}
+    assert props_a.get("color") == (1, 0, 0, 1)
+    assert props_b.get("color") is None
+
+
+def test_style_cache_depends_on_state():
+    css = "mytype:hover { color: red }"
+    compiled_style_sheet = CompiledStyleSheet(css)
+
+    props = compiled_style_sheet.match(Node("mytype"))
+    hover_props = compiled_style_sheet.match(Node("mytype", state=("hover",)))
+
+    assert props.get("color") is None
+    assert hover_props.get("color") == (1, 0, 0, 1)
+
+
+def test_style_cache_depends_on_ancestors():
+    css = "outer mytype { color: red }"
+    compiled_style_sheet = CompiledStyleSheet(css)
+
+    props = compiled_style_sheet.match(Node("mytype", parent=Node("other")))
+    nested_props = compiled_style_sheet.match(
+        Node("mytype", parent=Node("other", parent=Node("outer")))
+    )
+
+    assert compiled_style_sheet.dependencies.ancestors
+    assert props.get("color") is None
+    assert nested_props.get("color") == (1, 0, 0, 1)
+
+
+def test_shared_parent_key_is_computed_once():
+    css = "outer mytype { color: red }"
+    compiled_style_sheet = CompiledStyleSheet(css)
+    outer = CountingNode("outer")
+    parent = Node("other", parent=outer)
+
+    compiled_style_sheet.match(Node("mytype", parent=parent))
+    calls = outer.name_calls
+    props = compiled_style_sheet.match(Node("mytype", parent=parent))
+
+    assert props.get("color") == (1, 0, 0, 1)
+    assert outer.name_calls == calls
+
+
+@pytest.mark.parametrize("selector", ["mytype:empty", "mytype:has(child)"])
+def test_style_depending_on_children_is_not_cached(selector):
+    css = f"{selector} {{ color: red }}"
+    compiled_style_sheet = CompiledStyleSheet(css)
+    node = Node("mytype")
+
+    props = compiled_style_sheet.match(node)
+    Node("child", parent=node)
+
+    assert compiled_style_sheet.dependencies.descendants
+    assert compiled_style_sheet.match(node) is not props
+
+
+def test_dependencies_in_functional_pseudo_class():
+    css = "mytype:not([name], outer > inner) { color: red }"
+    compiled_style_sheet = CompiledStyleSheet(css)
+
+    assert compiled_style_sheet.dependencies.attributes == {"name"}
+    assert compiled_style_sheet.dependencies.ancestors
+
+
+def test_only_selectors_for_node_name_are_evaluated():
+    other_rules = " ".join(f"other{n} {{ color: blue }}" for n in range(10))
+    css = f"{other_rules} * {{ color: red }} mytype {{ font-size: 42 }}"
+    compiled_style_sheet = CompiledStyleSheet(css)
+    node = CountingNode("mytype")
+
+    props = compiled_style_sheet.match(node)
+
+    assert props.get("color") == (1, 0, 0, 1)
+    assert props.get("font-size") == 42
+    assert node.name_calls < 10
+
+
+def test_rule_order_is_kept_across_selector_names():
+    css = "mytype { color: blue } * { color: red }"
+    compiled_style_sheet = CompiledStyleSheet(css)
+
+    props = compiled_style_sheet.match(Node("mytype"))
+
+    # Type selector is more specific than universal selector
+    assert props.get("color") == (0, 0, 1, 1)
+
+
+def test_unchanged_rules_reuse_compiled_selectors():
+    old_style_sheet = CompiledStyleSheet("mytype { color: red }")
+    new_style_sheet = CompiledStyleSheet("mytype { color: red } other { color: blue }")
+
+    assert old_style_sheet.selectors[0][0] is new_style_sheet.selectors[0][0]
+
+
+def test_changed_names_for_changed_rule():
+    old_style_sheet = CompiledStyleSheet("mytype { color: red } other { color: red }")
+    new_style_sheet = CompiledStyleSheet("mytype { color: blue } other { color: red }")
+
+    assert new_style_sheet.changed_names(old_style_sheet) == {"mytype"}
+
+
+def test_changed_names_for_added_and_removed_rules():
+    old_style_sheet = CompiledStyleSheet("mytype { color: red }")
+    new_style_sheet = CompiledStyleSheet("outer mytype, other { color: red }")
+
+    assert new_style_sheet.changed_names(old_style_sheet) == {"mytype", "other"}
+
+
+def test_changed_names_for_unchanged_style_sheet():
+    css = "mytype { color: red } * { color: blue }"
+
+    assert CompiledStyleSheet(css).changed_names(CompiledStyleSheet(css)) == set()
+
+
+def test_changed_names_for_universal_rule():
+    old_style_sheet = CompiledStyleSheet("mytype { color: red }")
+    new_style_sheet = CompiledStyleSheet("mytype { color: red } * { color: blue }")
+
+    assert new_style_sheet.changed_names(old_style_sheet) is None
+
+
+def test_changed_names_for_reordered_rules():
+    old_style_sheet = CompiledStyleSheet(
+        "mytype { color: red } diagram * { color: blue }"
+    )
+    new_style_sheet = CompiledStyleSheet(
+        "diagram * { color: blue } mytype { color: red }"
+    )
+
+    assert new_style_sheet.changed_names(old_style_sheet) == {"mytype"}
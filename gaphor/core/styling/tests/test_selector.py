@@ -1,6 +1,6 @@
 import pytest
 
-from gaphor.core.styling import parse_style_sheet
+from gaphor.core.styling import compile_style_sheet, parse_style_sheet
 
 
 class Node:
@@ -299,3 +299,23 @@ def test_has_and_is_selector():
             children=[Node("foo", children=[Node("bar", state=("hover",))])],
         )
     )
+
+
+@pytest.mark.parametrize(
+    "css,name",
+    [
+        ["* {}", None],
+        ["node {}", "node"],
+        ["Node {}", "node"],
+        ["node[name] {}", "node"],
+        ["[name] {}", None],
+        ["outer node {}", "node"],
+        ["node > * {}", None],
+        ["outer > inner:hover {}", "inner"],
+        [":is(node) {}", None],
+    ],
+)
+def test_selector_name(css, name):
+    (_, _, selector_name), _ = next(compile_style_sheet(css))
+
+    assert selector_name == name
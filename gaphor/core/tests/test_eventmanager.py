@@ -0,0 +1,202 @@
+import pytest
+
+from gaphor.core import event_handler
+from gaphor.core.eventmanager import EventManager
+from gaphor.core.modeling.event import AttributeUpdated
+from gaphor.transaction import Transaction
+
+
+class Event:
+    def __init__(self, name):
+        self.name = name
+
+
+class UpdateEvent(Event):
+    @property
+    def coalesce_key(self):
+        return (type(self), self.name)
+
+
+@pytest.fixture
+def event_manager():
+    return EventManager()
+
+
+@pytest.fixture
+def batches(event_manager):
+    batches = []
+
+    @event_handler(Event, batch=True)
+    def handler(events):
+        batches.append([e.name for e in events])
+
+    event_manager.subscribe(handler)
+    yield batches
+    event_manager.unsubscribe(handler)
+
+
+def test_batch_handler_receives_events_after_they_are_handled(event_manager, batches):
+    event_manager.handle(Event("a"), Event("b"))
+    event_manager.handle(Event("c"))
+
+    assert batches == [["a", "b"], ["c"]]
+
+
+def test_batch_handler_receives_events_at_end_of_batch(event_manager, batches):
+    with event_manager.batch():
+        event_manager.handle(Event("a"), Event("b"))
+        assert batches == []
+
+    assert batches == [["a", "b"]]
+
+
+def test_nested_batches(event_manager, batches):
+    with event_manager.batch():
+        with event_manager.batch():
+            event_manager.handle(Event("a"))
+        event_manager.handle(Event("b"))
+        assert batches == []
+
+    assert batches == [["a", "b"]]
+
+
+def test_transaction_is_a_batch(event_manager, batches):
+    with Transaction(event_manager):
+        event_manager.handle(Event("a"), Event("b"))
+        assert batches == []
+
+    assert batches == [["a", "b"]]
+
+
+def test_updates_are_coalesced(event_manager):
+    batches = []
+
+    @event_handler(Event, batch=True)
+    def handler(events):
+        batches.append(events)
+
+    event_manager.subscribe(handler)
+    first = UpdateEvent("a")
+    last = UpdateEvent("a")
+
+    with event_manager.batch():
+        event_manager.handle(first, Event("b"), UpdateEvent("c"), last)
+
+    assert [e.name for e in batches[0]] == ["a", "b", "c"]
+    assert batches[0][0] is last
+
+
+def test_coalesced_update_has_value_from_before_the_batch(event_manager):
+    batches = []
+
+    @event_handler(AttributeUpdated, batch=True)
+    def handler(events):
+        batches.append(events)
+
+    event_manager.subscribe(handler)
+    element = object()
+    first = AttributeUpdated(element, "name", "a", "b")
+    last = AttributeUpdated(element, "name", "b", "c")
+
+    with event_manager.batch():
+        event_manager.handle(first, last)
+
+    ((event,),) = batches
+    assert event.old_value == "a"
+    assert event.new_value == "c"
+    assert last.old_value == "b"
+
+
+def test_regular_handlers_receive_every_event_immediately(event_manager):
+    events = []
+
+    @event_handler(Event)
+    def handler(event):
+        events.append(event.name)
+
+    event_manager.subscribe(handler)
+
+    with event_manager.batch():
+        event_manager.handle(UpdateEvent("a"), UpdateEvent("a"))
+        assert events == ["a", "a"]
+
+
+def test_events_emitted_by_batch_handler_are_handled(event_manager):
+    handled = []
+
+    @event_handler(UpdateEvent, batch=True)
+    def batch_handler(events):
+        event_manager.handle(Event("from batch"))
+
+    @event_handler(Event)
+    def handler(event):
+        handled.append(event.name)
+
+    event_manager.subscribe(batch_handler)
+    event_manager.subscribe(handler)
+
+    with event_manager.batch():
+        event_manager.handle(UpdateEvent("a"))
+
+    assert handled == ["a", "from batch"]
+
+
+def test_unsubscribe_batch_handler(event_manager):
+    batches = []
+
+    @event_handler(Event, batch=True)
+    def handler(events):
+        batches.append(events)
+
+    event_manager.subscribe(handler)
+    event_manager.unsubscribe(handler)
+    event_manager.handle(Event("a"))
+
+    assert batches == []
+
+
+def test_handler_subscribed_after_dispatch_receives_events(event_manager):
+    events = []
+
+    @event_handler(Event)
+    def handler(event):
+        events.append(event.name)
+
+    event_manager.handle(UpdateEvent("a"))
+    event_manager.subscribe(handler)
+    event_manager.handle(UpdateEvent("b"))
+
+    assert events == ["b"]
+
+
+def test_unsubscribed_handler_does_not_receive_events(event_manager):
+    events = []
+
+    @event_handler(UpdateEvent)
+    def handler(event):
+        events.append(event.name)
+
+    event_manager.subscribe(handler)
+    event_manager.handle(UpdateEvent("a"))
+    event_manager.unsubscribe(handler)
+    event_manager.handle(UpdateEvent("b"))
+
+    assert events == ["a"]
+
+
+def test_handlers_for_event_subtypes_are_called_first(event_manager):
+    events = []
+
+    @event_handler(Event)
+    def handler(event):
+        events.append("event")
+
+    @event_handler(UpdateEvent)
+    def update_handler(event):
+        events.append("update")
+
+    event_manager.subscribe(handler)
+    event_manager.subscribe(update_handler)
+    event_manager.handle(UpdateEvent("a"))
+
+    assert events == ["update", "event"]
@@ -30,7 +30,7 @@ class CommentItem(ElementPresentation):
             style={"padding": (offset, ear + offset, offset, offset)},
             draw=partial(draw_border, ear=ear),
         )
-        self.watch("subject[Comment].body")
+        self.watch("subject[Comment].body", defer=True)
 
 
 def draw_border(box, context, bounding_box, ear):
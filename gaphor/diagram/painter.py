@@ -8,21 +8,79 @@ and handles).
 
 from __future__ import annotations
 
-from cairo import LINE_JOIN_ROUND
+from typing import Iterable
+from weakref import WeakKeyDictionary
+
+from cairo import LINE_JOIN_ROUND, Content, Context, Matrix, RecordingSurface
 from gi.repository import GLib, Pango, PangoCairo
 
-from gaphor.core.modeling.diagram import DrawContext, StyledDiagram, StyledItem
+from gaphor.core.modeling import Presentation
+from gaphor.core.modeling.diagram import (
+    DrawContext,
+    StyledDiagram,
+    StyledItem,
+    StyledItems,
+)
+from gaphor.core.styling import Style
 from gaphor.diagram.selection import Selection
 
 
+class RenderCache:
+    """Recorded drawings of items.
+
+    An item is drawn on a recording surface once. The recording is
+    replayed for as long as the item is painted with the same style,
+    selection state and zoom level, until it's invalidated.
+    """
+
+    def __init__(self):
+        self._recordings: WeakKeyDictionary[
+            Presentation, tuple[tuple, RecordingSurface]
+        ] = WeakKeyDictionary()
+
+    def get(self, item: Presentation, key: tuple) -> RecordingSurface | None:
+        recording = self._recordings.get(item)
+        return recording[1] if recording and recording[0] == key else None
+
+    def set(self, item: Presentation, key: tuple, surface: RecordingSurface) -> None:
+        self._recordings[item] = (key, surface)
+
+    def invalidate(self, items: Iterable[Presentation]) -> None:
+        """Forget the recordings of items and their ancestors.
+
+        Ancestors are updated along with their children.
+        """
+        recordings = self._recordings
+        for item in items:
+            while item:
+                recordings.pop(item, None)
+                item = item.parent
+
+    def clear(self) -> None:
+        self._recordings.clear()
+
+
 class ItemPainter:
-    def __init__(self, selection: Selection | None = None):
+    def __init__(
+        self,
+        selection: Selection | None = None,
+        render_cache: RenderCache | None = None,
+    ):
         self.selection: Selection = selection or Selection()
+        self.render_cache = render_cache
 
-    def paint_item(self, item, cr):
+    def paint_item(self, item, cr, styled_items: StyledItems | None = None):
         selection = self.selection
         diagram = item.diagram
-        style = diagram.style(StyledItem(item, selection))
+        style = diagram.style(
+            styled_items(item) if styled_items else StyledItem(item, selection)
+        )
+        state = (
+            item in selection.selected_items,
+            item is selection.focused_item,
+            item is selection.hovered_item,
+            item is selection.dropzone_item,
+        )
 
         cr.save()
         try:
@@ -30,24 +88,64 @@ class ItemPainter:
             cr.set_source_rgba(*style["color"])
             cr.transform(item.matrix_i2c.to_cairo())
 
-            item.draw(
-                DrawContext(
-                    cairo=cr,
-                    style=style,
-                    selected=(item in selection.selected_items),
-                    focused=(item is selection.focused_item),
-                    hovered=(item is selection.hovered_item),
-                    dropzone=(item is selection.dropzone_item),
-                )
-            )
+            # Only plain cairo contexts can be recorded
+            if self.render_cache is not None and isinstance(cr, Context):
+                self._draw_recorded(item, cr, style, state)
+            else:
+                self._draw(item, cr, style, state)
 
         finally:
             cr.restore()
 
+    def _draw(self, item, cr, style: Style, state: tuple[bool, bool, bool, bool]):
+        selected, focused, hovered, dropzone = state
+        item.draw(
+            DrawContext(
+                cairo=cr,
+                style=style,
+                selected=selected,
+                focused=focused,
+                hovered=hovered,
+                dropzone=dropzone,
+            )
+        )
+
+    def _draw_recorded(self, item, cr, style, state):
+        """Draw the item on a recording surface, at the current zoom level,
+        and replay it.
+
+        Only the translation is left out of the recording, so it can
+        be reused while scrolling.
+        """
+        render_cache = self.render_cache
+        assert render_cache is not None
+        xx, yx, xy, yy, x0, y0 = cr.get_matrix()
+        tolerance = cr.get_tolerance()
+        key = (style, state, xx, yx, xy, yy, tolerance)
+
+        recording = render_cache.get(item, key)
+        if not recording:
+            recording = RecordingSurface(Content.COLOR_ALPHA, None)
+            recording_cr = Context(recording)
+            recording_cr.set_matrix(Matrix(xx, yx, xy, yy))
+            recording_cr.set_tolerance(tolerance)
+            recording_cr.set_font_options(cr.get_font_options())
+            recording_cr.set_line_join(LINE_JOIN_ROUND)
+            recording_cr.set_source_rgba(*style["color"])
+            self._draw(item, recording_cr, style, state)
+            render_cache.set(item, key, recording)
+
+        cr.set_matrix(Matrix(x0=x0, y0=y0))
+        cr.set_source_surface(recording)
+        cr.paint()
+
     def paint(self, items, cr):
         """Draw the items."""
+        styled_items = None
         for item in items:
-            self.paint_item(item, cr)
+            if not styled_items or styled_items.diagram is not item.diagram:
+                styled_items = StyledItems(item.diagram, self.selection)
+            self.paint_item(item, cr, styled_items)
 
 
 class DiagramTypePainter:
@@ -78,6 +78,10 @@ class HandlePositionEvent(RevertibeEvent):
         self.index = index
         self.old_value = old_value
 
+    @property
+    def coalesce_key(self):
+        return (type(self), self.element, self.index)
+
     def revert(self, target):
         target.handles()[self.index].pos = self.old_value
         target.request_update()
@@ -0,0 +1,104 @@
+import cairo
+import gaphas
+import pytest
+
+from gaphor.core.modeling import Presentation
+from gaphor.diagram.painter import ItemPainter, RenderCache
+
+
+class DrawCountingItem(gaphas.Element, Presentation):
+    def __init__(self, diagram, id=None):
+        super().__init__(connections=diagram.connections, diagram=diagram, id=id)
+        self.draw_count = 0
+
+    def draw(self, context):
+        self.draw_count += 1
+        context.cairo.rectangle(0, 0, 10, 10)
+        context.cairo.fill()
+
+
+@pytest.fixture
+def item(diagram):
+    return diagram.create(DrawCountingItem)
+
+
+@pytest.fixture
+def render_cache():
+    return RenderCache()
+
+
+@pytest.fixture
+def painter(render_cache):
+    return ItemPainter(render_cache=render_cache)
+
+
+@pytest.fixture
+def cr():
+    return cairo.Context(cairo.ImageSurface(cairo.FORMAT_ARGB32, 100, 100))
+
+
+def test_item_is_drawn_once(item, painter, cr):
+    painter.paint([item], cr)
+    painter.paint([item], cr)
+
+    assert item.draw_count == 1
+
+
+def test_item_is_drawn_without_render_cache(item, cr):
+    painter = ItemPainter()
+
+    painter.paint([item], cr)
+    painter.paint([item], cr)
+
+    assert item.draw_count == 2
+
+
+def test_item_is_drawn_again_after_invalidation(item, painter, render_cache, cr):
+    painter.paint([item], cr)
+    render_cache.invalidate([item])
+    painter.paint([item], cr)
+
+    assert item.draw_count == 2
+
+
+def test_parent_is_invalidated_with_child(diagram, item, painter, render_cache, cr):
+    child = diagram.create(DrawCountingItem)
+    child.parent = item
+
+    painter.paint([item], cr)
+    render_cache.invalidate([child])
+    painter.paint([item], cr)
+
+    assert item.draw_count == 2
+
+
+def test_item_is_drawn_again_for_new_selection_state(item, painter, cr):
+    painter.paint([item], cr)
+    painter.selection.hovered_item = item
+    painter.paint([item], cr)
+
+    assert item.draw_count == 2
+
+
+def test_item_is_drawn_again_when_zoomed(item, painter, cr):
+    painter.paint([item], cr)
+    cr.scale(2, 2)
+    painter.paint([item], cr)
+
+    assert item.draw_count == 2
+
+
+def test_recording_is_reused_when_scrolled(item, painter, cr):
+    painter.paint([item], cr)
+    cr.translate(20, 30)
+    painter.paint([item], cr)
+
+    assert item.draw_count == 1
+
+
+def test_recording_is_painted(item, painter, cr):
+    painter.paint([item], cr)
+
+    cr.get_target().flush()
+    data = cr.get_target().get_data()
+    assert any(data)
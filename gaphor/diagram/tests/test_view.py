@@ -0,0 +1,110 @@
+import cairo
+import pytest
+from gaphas.painter import BoundingBoxPainter
+from gi.repository import Gtk
+
+from gaphor.diagram.painter import ItemPainter
+from gaphor.diagram.selection import Selection
+from gaphor.diagram.view import DiagramView
+from gaphor.UML.classes import ClassItem
+
+
+class RecordingPainter:
+    def __init__(self):
+        self.painted = []
+
+    def paint(self, items, cr):
+        self.painted.append(items)
+
+    def painted_items(self):
+        return {item for items in self.painted for item in items}
+
+
+@pytest.fixture
+def painter():
+    return RecordingPainter()
+
+
+@pytest.fixture
+def view(diagram, painter):
+    view = DiagramView(selection=Selection())
+    view._qtree.resize((-100, -100, 1000, 1000))
+    view.painter = painter
+    view.bounding_box_painter = BoundingBoxPainter(ItemPainter(view.selection))
+    view.model = diagram
+    view.set_size_request(800, 800)
+    return view
+
+
+@pytest.fixture(autouse=True)
+def window(view):
+    if Gtk.get_major_version() == 3:
+        window = Gtk.Window.new(Gtk.WindowType.TOPLEVEL)
+        window.add(view)
+        window.show_all()
+    else:
+        window = Gtk.Window.new()
+        window.set_child(view)
+        window.show()
+    view.update_back_buffer()
+    yield window
+    window.destroy()
+
+
+@pytest.fixture
+def items(diagram, view, painter):
+    item_a = diagram.create(ClassItem)
+    item_b = diagram.create(ClassItem)
+    item_b.matrix.translate(400, 400)
+    view.request_update((item_a, item_b))
+    view.update_back_buffer()
+    painter.painted.clear()
+    return item_a, item_b
+
+
+def test_updated_item_is_repainted(diagram, view, painter, items):
+    item_a, _ = items
+
+    item_a.matrix.translate(10, 0)
+    diagram.request_update(item_a)
+
+    assert painter.painted_items() == {item_a}
+
+
+def test_items_in_dirty_region_are_repainted(diagram, view, painter, items):
+    item_a, item_b = items
+
+    item_a.matrix.translate(400, 400)
+    diagram.request_update(item_a)
+
+    assert painter.painted_items() == {item_a, item_b}
+
+
+def test_selection_change_is_repainted(view, painter, items):
+    _, item_b = items
+
+    view.selection.dropzone_item = item_b
+    view.update_dirty_regions()
+
+    assert painter.painted == [[item_b]]
+
+
+def test_nothing_is_repainted_without_changes(view, painter, items):
+    view.update_dirty_regions()
+
+    assert painter.painted == []
+
+
+def test_paint_regions(view, painter, items):
+    item_a, _ = items
+    surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, 800, 800)
+
+    view.paint_regions(cairo.Context(surface), [view.get_item_bounding_box(item_a)])
+
+    assert painter.painted == [[item_a]]
+
+
+def test_whole_view_is_repainted_after_scrolling(view, painter, items):
+    view.matrix.translate(-10, -10)
+
+    assert painter.painted_items() == set(items)
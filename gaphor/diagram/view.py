@@ -0,0 +1,212 @@
+"""A diagram view that repaints only the parts that changed."""
+
+from __future__ import annotations
+
+from typing import Iterable, Sequence
+
+import cairo
+from gaphas.decorators import g_async
+from gaphas.geometry import Rectangle, rectangle_intersects
+from gaphas.item import Item
+from gaphas.painter import DefaultPainter, Painter
+from gaphas.view import GtkView
+from gi.repository import GLib, Gtk
+
+from gaphor.diagram.painter import RenderCache
+
+# Space around the bounding box of dirty items, in view coordinates,
+# to include handles
+DIRTY_REGION_MARGIN = 8
+
+# If more regions are dirty, the whole view is repainted
+MAX_DIRTY_REGIONS = 64
+
+
+class DiagramView(GtkView):
+    """A view that repaints only the regions of updated items.
+
+    An updated item is repainted in its old and new bounding box, as are
+    items of which the selection state changed. Painting is clipped to
+    those regions, and painters only receive the items in them.
+
+    The whole view is repainted by ``GtkView.update_back_buffer()``. Its
+    painter records the back buffer, so the dirty regions can be repainted
+    in place afterwards. Scrolling, zooming and resizing the view, and
+    calls to ``update_back_buffer()``, e.g. from tools that draw guides or
+    a rubberband, repaint the whole view.
+
+    If a render cache is provided, the recordings of updated items are
+    invalidated.
+    """
+
+    __gtype_name__ = "GaphorDiagramView"
+
+    def __init__(
+        self, model=None, selection=None, render_cache: RenderCache | None = None
+    ):
+        super().__init__(selection=selection)
+        self.painter = DefaultPainter(self)
+        self.render_cache = render_cache
+        self._dirty_regions: list[Rectangle] = []
+        self._painted_surface: cairo.Surface | None = None
+        self._painted_size: tuple[int, int] | None = None
+        self._painted_matrix: tuple[float, ...] | None = None
+        self._painted_selection: set[tuple[str, Item]] = set()
+        self._paint_tolerance: float | None = None
+        if model:
+            self.model = model
+
+    @property
+    def painter(self) -> Painter:
+        """The painter, wrapped to record the back buffer on a full
+        repaint."""
+        return self._back_buffer_painter
+
+    @painter.setter
+    def painter(self, painter: Painter) -> None:
+        self._back_buffer_painter = _BackBufferPainter(self, painter)
+
+    def request_update(
+        self, items: Iterable[Item], removed_items: Iterable[Item] = ()
+    ) -> None:
+        if self.render_cache:
+            items = tuple(items)
+            self.render_cache.invalidate(items)
+            self.render_cache.invalidate(removed_items)
+        if removed_items:
+            self._add_dirty_regions(removed_items)
+        super().request_update(items, removed_items)
+
+    @g_async(single=True)
+    def update(self) -> None:
+        """Update the view, and repaint the regions of the updated items."""
+        model = self.model
+        if not model:
+            return
+
+        dirty_items = self.all_dirty_items()
+        model.update_now(dirty_items)
+
+        dirty_items |= self.all_dirty_items()
+        self._add_dirty_regions(dirty_items)
+        self.update_bounding_box(dirty_items)
+        self._add_dirty_regions(dirty_items)
+        self.update_scrolling()
+        self.update_dirty_regions()
+
+    @g_async(single=True, priority=GLib.PRIORITY_HIGH_IDLE)
+    def update_dirty_regions(self) -> None:
+        """Repaint the dirty regions of the view.
+
+        The whole view is repainted if it has not been painted yet, or
+        if it has been scrolled, zoomed or resized since.
+        """
+        selection = self._selection_state()
+        self._add_dirty_regions(item for _, item in selection ^ self._painted_selection)
+
+        allocation = self.get_allocation()
+        if (
+            not self._painted_surface
+            or self._painted_size != (allocation.width, allocation.height)
+            or self._painted_matrix != self.matrix.tuple()
+            or len(self._dirty_regions) > MAX_DIRTY_REGIONS
+        ):
+            self.update_back_buffer()
+            return
+
+        regions = self._dirty_regions
+        self._dirty_regions = []
+        self._painted_selection = selection
+        if not regions or not self.model:
+            return
+
+        self.paint_regions(cairo.Context(self._painted_surface), regions)
+        if Gtk.get_major_version() != 3:
+            self.queue_draw()
+        elif window := self.get_window():
+            window.invalidate_rect(allocation, True)
+
+    def paint_regions(self, cr: cairo.Context, regions: Sequence[Rectangle]) -> None:
+        """Paint the parts of the view in ``regions``, in view coordinates."""
+        assert self.model
+
+        for region in regions:
+            cr.rectangle(*region)
+        cr.clip()
+
+        cr.save()
+        cr.set_operator(cairo.OPERATOR_CLEAR)
+        cr.paint()
+        cr.restore()
+
+        allocation = self.get_allocation()
+        Gtk.render_background(
+            self.get_style_context(), cr, 0, 0, allocation.width, allocation.height
+        )
+
+        cr.set_matrix(self.matrix.to_cairo())
+        cr.save()
+        if self._paint_tolerance is not None:
+            cr.set_tolerance(self._paint_tolerance)
+        bounds = Rectangle(*regions[0])
+        for region in regions[1:]:
+            bounds += region
+        items = [
+            item
+            for item in self.get_items_in_rectangle(bounds)
+            if any(
+                rectangle_intersects(self.get_item_bounding_box(item), region)
+                for region in regions
+            )
+        ]
+        self._back_buffer_painter.painter.paint(items, cr)
+        cr.restore()
+
+    def _back_buffer_painted(self, cr: cairo.Context) -> None:
+        """Record the state of a full repaint of the view, done with
+        ``cr``."""
+        allocation = self.get_allocation()
+        self._dirty_regions = []
+        self._painted_surface = cr.get_target()
+        self._painted_size = (allocation.width, allocation.height)
+        self._painted_matrix = self.matrix.tuple()
+        self._painted_selection = self._selection_state()
+        self._paint_tolerance = cr.get_tolerance()
+
+    def _add_dirty_regions(self, items: Iterable[Item]) -> None:
+        regions = self._dirty_regions
+        for item in items:
+            if len(regions) > MAX_DIRTY_REGIONS:
+                return
+            try:
+                bounds = self.get_item_bounding_box(item)
+            except KeyError:
+                continue  # No bounding box yet
+            bounds.expand(DIRTY_REGION_MARGIN)
+            regions.append(bounds)
+
+    def _selection_state(self) -> set[tuple[str, Item]]:
+        """The items that are painted differently because of the
+        selection."""
+        selection = self.selection
+        state = {("selected", item) for item in selection.selected_items}
+        state.update(
+            ("grayed_out", item) for item in getattr(selection, "grayed_out_items", ())
+        )
+        for name in ("focused_item", "hovered_item", "dropzone_item"):
+            if item := getattr(selection, name, None):
+                state.add((name, item))
+        return state
+
+
+class _BackBufferPainter:
+    """Paint the view with ``painter``, and let the view know it has been
+    repainted as a whole."""
+
+    def __init__(self, view: DiagramView, painter: Painter):
+        self.view = view
+        self.painter = painter
+
+    def paint(self, items: Sequence[Item], cr: cairo.Context) -> None:
+        self.view._back_buffer_painted(cr)
+        self.painter.paint(items, cr)
@@ -85,9 +85,7 @@ class DiagramDirective(sphinx.util.docutils.SphinxDirective):
         )
 
         if not diagram:
-            diagram = next(
-                model.select(lambda e: isinstance(e, Diagram) and e.name == name), None
-            )
+            diagram = next(model.select_by("name", name, Diagram), None)
 
         if not diagram:
             return self.logging_error_node(
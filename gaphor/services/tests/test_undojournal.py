@@ -0,0 +1,255 @@
+import pytest
+
+from gaphor import UML
+from gaphor.core.modeling import Element
+from gaphor.diagram.copypaste import serialize
+from gaphor.services.undojournal import UndoJournal, decode, encode
+from gaphor.services.undomanager import (
+    JOURNAL_STACK_DEPTH,
+    REVERT_ASSOCIATION_SET,
+    REVERT_ATTRIBUTE,
+    STACK_DEPTH,
+    UNDO_CREATE,
+    UndoManager,
+)
+from gaphor.transaction import Transaction
+from gaphor.UML.classes import ClassItem
+
+
+@pytest.fixture
+def journal(element_factory, tmp_path):
+    journal = UndoJournal(element_factory, tmp_path / "undo.journal")
+    yield journal
+    journal.close()
+
+
+@pytest.fixture
+def undo_manager(event_manager, element_factory, journal):
+    undo_manager = UndoManager(
+        event_manager,
+        element_factory,
+        stack_depth=1000,
+        memory_budget=0,
+        journal=journal,
+    )
+    yield undo_manager
+    undo_manager.shutdown()
+
+
+def model_state(element_factory):
+    state = {}
+    for element in element_factory.select():
+        data = {}
+
+        def save_func(name, value, data=data):
+            data[name] = serialize(value)
+
+        element.save(save_func)
+        state[element.id] = (type(element), data)
+    return state
+
+
+def edit_model(n, event_manager, element_factory, diagram):
+    """Make changes to the model, yield after each transaction."""
+    with Transaction(event_manager):
+        klass = element_factory.create(UML.Class)
+        klass.package = diagram.owner
+    yield
+
+    with Transaction(event_manager):
+        klass.name = f"Class{n}"
+        klass.isAbstract = n % 2
+    yield
+
+    with Transaction(event_manager):
+        item = diagram.create(ClassItem, subject=klass)
+    yield
+
+    with Transaction(event_manager):
+        for _ in range(10):
+            item.matrix.translate(10, n)
+        item.handles()[2].pos = (200, 100 + n)
+    yield
+
+    if n % 3 == 0:
+        with Transaction(event_manager):
+            item.unlink()
+        yield
+
+
+def test_round_trip_operations(element_factory, journal):
+    klass = element_factory.create(UML.Class)
+    package = element_factory.create(UML.Package)
+    actions = [
+        (UNDO_CREATE, klass.id, None, None),
+        (REVERT_ATTRIBUTE, klass.id, UML.Class.name, "name"),
+        (REVERT_ATTRIBUTE, klass.id, UML.Class.name, None),
+        (REVERT_ASSOCIATION_SET, klass.id, UML.Class.package, package.id),
+    ]
+
+    key = journal.write(actions)
+
+    assert list(journal.read(key)) == list(reversed(actions))
+
+
+def test_undo_action_can_not_be_stored():
+    with pytest.raises(TypeError):
+        encode(lambda: None)
+
+
+def test_local_element_type_can_not_be_stored(element_factory, journal):
+    class A(Element):
+        pass
+
+    a = element_factory.create(A)
+
+    assert journal.write([(UNDO_CREATE, a.id, None, None)]) is not None
+    assert journal.write([(2, a.id, A, None)]) is None
+
+
+def test_transaction_is_paged_out(
+    event_manager, element_factory, diagram, undo_manager
+):
+    with Transaction(event_manager):
+        element_factory.create(UML.Class)
+    with Transaction(event_manager):
+        element_factory.create(UML.Class)
+
+    paged, latest = undo_manager._undo_stack[-2:]
+
+    assert not paged._actions
+    assert paged.size == 0
+    assert latest._actions
+
+
+def test_transaction_with_undo_action_stays_in_memory(
+    event_manager, element_factory, undo_manager
+):
+    with Transaction(event_manager):
+        undo_manager.add_undo_action(lambda: None)
+    with Transaction(event_manager):
+        element_factory.create(UML.Class)
+
+    assert len(undo_manager._undo_stack) == 1
+
+
+def test_undo_and_redo_long_history(
+    event_manager, element_factory, diagram, undo_manager
+):
+    states = [model_state(element_factory)]
+    for n in range(20):
+        for _ in edit_model(n, event_manager, element_factory, diagram):
+            states.append(model_state(element_factory))
+
+    assert len(undo_manager._undo_stack) == len(states) - 1
+    assert all(tx._journal for tx in undo_manager._undo_stack[:-1])
+
+    for state in reversed(states[:-1]):
+        undo_manager.undo_transaction()
+        assert model_state(element_factory) == state
+
+    assert not undo_manager.can_undo()
+
+    for state in states[1:]:
+        undo_manager.redo_transaction()
+        assert model_state(element_factory) == state
+
+    assert not undo_manager.can_redo()
+
+
+def test_reset_clears_journal(event_manager, element_factory, undo_manager, journal):
+    with Transaction(event_manager):
+        element_factory.create(UML.Class)
+    with Transaction(event_manager):
+        element_factory.create(UML.Class)
+
+    undo_manager.reset()
+
+    assert journal._file.seek(0, 2) == 0
+
+
+def test_decode_attribute_value(element_factory):
+    klass = element_factory.create(UML.Class)
+
+    record = encode((REVERT_ATTRIBUTE, klass.id, UML.Class.isAbstract, True))
+    operation = decode(record, element_factory.lookup)
+
+    assert operation == (REVERT_ATTRIBUTE, klass.id, UML.Class.isAbstract, 1)
+
+
+def test_discarded_transactions_are_compacted(element_factory, journal):
+    klass = element_factory.create(UML.Class)
+    actions = [(REVERT_ATTRIBUTE, klass.id, UML.Class.name, "name")]
+    first = journal.write(actions)
+    second = journal.write(actions)
+    last = journal.write(actions)
+
+    journal.discard(first)
+    journal.discard(second)
+
+    assert journal._file.seek(0, 2) == journal._entries[last][1]
+    assert list(journal.read(last)) == actions
+
+
+def test_trimmed_transactions_are_removed_from_journal(
+    event_manager, element_factory, journal
+):
+    undo_manager = UndoManager(
+        event_manager, element_factory, stack_depth=3, memory_budget=0, journal=journal
+    )
+    for _ in range(20):
+        with Transaction(event_manager):
+            element_factory.create(UML.Class)
+
+    paged = [tx for tx in undo_manager._undo_stack if tx._journal]
+
+    assert len(paged) == 2
+    assert len(journal._entries) == 2
+    assert journal._file.seek(0, 2) <= 2 * sum(
+        length for _, length in journal._entries.values()
+    )
+    undo_manager.shutdown()
+
+
+def test_shutdown_removes_journal(event_manager, element_factory, tmp_path):
+    path = tmp_path / "undo.journal"
+    journal = UndoJournal(element_factory, path)
+    undo_manager = UndoManager(event_manager, element_factory, journal=journal)
+
+    undo_manager.shutdown()
+
+    assert journal._file.closed
+    assert not path.exists()
+
+
+def test_journal_is_enabled_from_environment(
+    event_manager, element_factory, monkeypatch
+):
+    monkeypatch.setenv("GAPHOR_UNDO_JOURNAL", "1")
+    undo_manager = UndoManager(event_manager, element_factory)
+    journal = undo_manager._journal
+
+    assert isinstance(journal, UndoJournal)
+    assert undo_manager._stack_depth == JOURNAL_STACK_DEPTH
+
+    undo_manager.shutdown()
+
+    assert journal._file.closed
+
+
+def test_journal_is_disabled_by_default(event_manager, element_factory, monkeypatch):
+    monkeypatch.delenv("GAPHOR_UNDO_JOURNAL", raising=False)
+    undo_manager = UndoManager(event_manager, element_factory)
+
+    assert undo_manager._journal is None
+    assert undo_manager._stack_depth == STACK_DEPTH
+
+    undo_manager.shutdown()
+
+
+def test_decode_operation_of_missing_element(element_factory):
+    klass = element_factory.create(UML.Class)
+    record = encode((REVERT_ATTRIBUTE, klass.id, UML.Class.name, "name"))
+
+    with pytest.raises(ValueError):
+        decode(record, lambda id: None)
@@ -1,13 +1,19 @@
 """Test the UndoManager."""
 import pytest
 
+from gaphor import UML
 from gaphor.core import event_handler
 from gaphor.core.modeling import Element
 from gaphor.core.modeling.event import AssociationUpdated
 from gaphor.core.modeling.properties import association, attribute, derivedunion
-from gaphor.services.undomanager import NotInTransactionException
+from gaphor.services.undomanager import (
+    REVERT_ATTRIBUTE,
+    NotInTransactionException,
+    UndoManager,
+)
 from gaphor.tests.raises import raises_exception_group
 from gaphor.transaction import Transaction
+from gaphor.UML.classes import ClassItem
 
 
 def test_nested_transactions(event_manager, undo_manager):
@@ -429,3 +435,117 @@ def test_redo_stack(event_manager, element_factory, undo_manager):
     assert element_factory.size() == 2
 
     assert element_factory.lookup(p.id)
+
+
+def test_attribute_change_is_recorded_as_operation(
+    event_manager, element_factory, undo_manager
+):
+    class A(Element):
+        attr = attribute("attr", str, default="default")
+
+    with Transaction(event_manager):
+        a = element_factory.create(A)
+
+    undo_manager.begin_transaction()
+    a.attr = "five"
+
+    assert undo_manager._current_transaction._actions == [
+        (REVERT_ATTRIBUTE, a.id, A.attr, "default")
+    ]
+    undo_manager.commit_transaction()
+
+
+def test_undo_stack_depth(event_manager, element_factory):
+    undo_manager = UndoManager(event_manager, element_factory, stack_depth=3)
+
+    for _ in range(5):
+        with Transaction(event_manager):
+            element_factory.create(Element)
+
+    assert len(undo_manager._undo_stack) == 3
+    undo_manager.shutdown()
+
+
+def test_undo_stack_memory_budget(event_manager, element_factory):
+    undo_manager = UndoManager(event_manager, element_factory, memory_budget=1)
+
+    for _ in range(3):
+        with Transaction(event_manager):
+            element_factory.create(Element)
+
+    assert len(undo_manager._undo_stack) == 1
+
+    undo_manager.undo_transaction()
+
+    assert element_factory.size() == 2
+    undo_manager.shutdown()
+
+
+def test_redo_stack_memory_budget(event_manager, element_factory):
+    undo_manager = UndoManager(event_manager, element_factory)
+
+    for _ in range(3):
+        with Transaction(event_manager):
+            element_factory.create(Element)
+
+    undo_manager._memory_budget = 1
+    undo_manager.undo_transaction()
+    undo_manager.undo_transaction()
+
+    assert len(undo_manager._redo_stack) == 1
+    assert undo_manager.can_undo()
+    undo_manager.shutdown()
+
+
+def test_dragging_a_handle_records_one_undo_action(
+    event_manager, element_factory, diagram, undo_manager
+):
+    with Transaction(event_manager):
+        item = diagram.create(ClassItem, subject=element_factory.create(UML.Class))
+    handle = item.handles()[0]
+    orig_pos = tuple(handle.pos)
+
+    with Transaction(event_manager):
+        for n in range(100):
+            handle.pos = (n, n)
+
+    assert len(undo_manager._undo_stack[-1]._actions) == 1
+
+    undo_manager.undo_transaction()
+
+    assert tuple(handle.pos) == orig_pos
+
+
+def test_moving_an_item_records_one_undo_action(
+    event_manager, element_factory, diagram, undo_manager
+):
+    with Transaction(event_manager):
+        item = diagram.create(ClassItem, subject=element_factory.create(UML.Class))
+    orig_matrix = tuple(item.matrix)
+
+    with Transaction(event_manager):
+        for _ in range(100):
+            item.matrix.translate(1, 1)
+
+    assert len(undo_manager._undo_stack[-1]._actions) == 1
+
+    undo_manager.undo_transaction()
+
+    assert tuple(item.matrix) == orig_matrix
+
+    undo_manager.redo_transaction()
+
+    assert tuple(item.matrix) == (1, 0, 0, 1, 100, 100)
+
+
+def test_committed_transaction_has_no_coalesce_keys(
+    event_manager, element_factory, diagram, undo_manager
+):
+    with Transaction(event_manager):
+        item = diagram.create(ClassItem, subject=element_factory.create(UML.Class))
+
+    with Transaction(event_manager):
+        item.matrix.translate(1, 1)
+        item.handles()[0].pos = (1, 1)
+
+    assert not undo_manager._undo_stack[-1]._coalesce_keys
@@ -0,0 +1,204 @@
+"""An on-disk journal for the undo history.
+
+Old transactions can be paged out to a journal, so the undo history can
+grow without using more memory. Each transaction is appended to the
+journal file as one line of JSON and is read back when it is undone.
+Model values are stored using the encoding from `gaphor.diagram.copypaste`.
+
+Only undo operations can be stored. Transactions that contain other undo
+actions (callables) are kept in memory.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import tempfile
+from itertools import count
+from typing import Callable, Iterator, List
+
+from gaphor.core.modeling.element import Element
+from gaphor.diagram.copypaste import deserialize, serialize
+from gaphor.services.undomanager import (
+    REVERT_ATTRIBUTE,
+    REVERT_EVENT,
+    UNDO_CREATE,
+    UNDO_DELETE,
+    Operation,
+    UndoAction,
+)
+
+
+class UndoJournal:
+    """A file to which undo transactions are appended.
+
+    If no filename is provided, an anonymous temporary file is used. The
+    file is removed when the journal is closed.
+
+    Transactions that are no longer needed should be discarded. Once
+    they take more space than the remaining transactions, the journal is
+    compacted.
+    """
+
+    def __init__(self, element_factory, filename=None):
+        self.element_factory = element_factory
+        self._filename = filename
+        self._file = open(filename, "w+b") if filename else tempfile.TemporaryFile()
+        # Transaction key -> (offset, length)
+        self._entries: dict[int, tuple[int, int]] = {}
+        self._keys = count()
+        self._size = 0
+        self._discarded = 0
+
+    def close(self):
+        if self._file.closed:
+            return
+        self._file.close()
+        if self._filename:
+            os.remove(self._filename)
+
+    def clear(self):
+        """Forget all transactions."""
+        self._file.truncate(0)
+        self._entries.clear()
+        self._size = 0
+        self._discarded = 0
+
+    def write(self, actions: List[UndoAction]) -> int | None:
+        """Append a transaction.
+
+        Returns the key of the transaction in the journal, or `None` if
+        the actions can not be stored.
+        """
+        try:
+            line = json.dumps([encode(a) for a in actions], separators=(",", ":"))
+        except (TypeError, ValueError):
+            return None
+        data = line.encode("utf-8") + b"\n"
+        offset = self._file.seek(self._size)
+        self._file.write(data)
+        self._file.flush()
+        self._size += len(data)
+        key = next(self._keys)
+        self._entries[key] = (offset, len(data))
+        return key
+
+    def read(self, key: int) -> Iterator[Operation]:
+        """Read the operations of a transaction, in the order in which they
+        should be undone.
+
+        Operations are decoded one at a time, since they can refer to
+        elements that are recreated by a preceding operation.
+        """
+        offset, length = self._entries[key]
+        self._file.seek(offset)
+        records = json.loads(self._file.read(length))
+        for record in reversed(records):
+            yield decode(record, self.element_factory.lookup)
+
+    def discard(self, key: int) -> None:
+        """Forget a transaction."""
+        if self._file.closed or key not in self._entries:
+            return
+        _, length = self._entries.pop(key)
+        self._discarded += length
+        if not self._entries:
+            self.clear()
+        elif self._discarded > self._size - self._discarded:
+            self.compact()
+
+    def compact(self) -> None:
+        """Move the remaining transactions to the start of the file, and
+        truncate it."""
+        size = 0
+        for key, (offset, length) in sorted(
+            self._entries.items(), key=lambda entry: entry[1][0]
+        ):
+            if offset != size:
+                self._file.seek(offset)
+                data = self._file.read(length)
+                self._file.seek(size)
+                self._file.write(data)
+                self._entries[key] = (size, length)
+            size += length
+        self._file.truncate(size)
+        self._file.flush()
+        self._size = size
+        self._discarded = 0
+
+
+def encode(action: UndoAction) -> list:
+    if callable(action):
+        raise TypeError(f"Undo action {action} can not be stored")
+
+    operation, element_id, prop, value = action
+    if operation == UNDO_CREATE:
+        return [operation, element_id]
+    elif operation == UNDO_DELETE:
+        return [operation, element_id, type_name(prop), value]
+    elif operation == REVERT_EVENT:
+        return [operation, element_id, type_name(type(value)), encode_event(value)]
+    elif operation == REVERT_ATTRIBUTE and value is not None:
+        value = serialize(value)
+    return [operation, element_id, prop.name, value]
+
+
+def decode(record: list, lookup: Callable[[str], Element | None]) -> Operation:
+    operation, element_id, *args = record
+    if operation == UNDO_CREATE:
+        return (operation, element_id, None, None)
+
+    name, value = args
+    if operation == UNDO_DELETE:
+        return (operation, element_id, lookup_type(name), value)
+    elif operation == REVERT_EVENT:
+        return (operation, element_id, None, decode_event(name, value, lookup))
+
+    element = lookup(element_id)
+    if element is None:
+        raise ValueError(f"Element with id {element_id} not found in model")
+    prop = getattr(type(element), name)
+    if operation == REVERT_ATTRIBUTE and value is not None:
+        value = prop.type(next(deserialize(value, lookup)))
+    return (operation, element_id, prop, value)
+
+
+def encode_event(event) -> dict:
+    state = {}
+    for cls in type(event).__mro__:
+        for name in getattr(cls, "__slots__", ()):
+            state[name] = getattr(event, name)
+    state.update(getattr(event, "__dict__", {}))
+
+    return {
+        name: serialize(value) if isinstance(value, Element) else ("j", value)
+        for name, value in state.items()
+    }
+
+
+def decode_event(name: str, state: dict, lookup: Callable[[str], Element | None]):
+    cls = lookup_type(name)
+    event = cls.__new__(cls)
+    for attr, (vtype, value) in state.items():
+        if vtype == "r":
+            value = lookup(value)
+        elif isinstance(value, list):
+            value = tuple(value)
+        setattr(event, attr, value)
+    return event
+
+
+def type_name(cls: type) -> str:
+    name = f"{cls.__module__}:{cls.__qualname__}"
+    if lookup_type(name) is not cls:
+        raise TypeError(f"Type {cls} can not be stored")
+    return name
+
+
+def lookup_type(name: str) -> type:
+    module_name, _, qualname = name.partition(":")
+    obj = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr, None)
+    return obj  # type: ignore[return-value]
@@ -3,6 +3,8 @@
 Undoing and redoing actions is managed through the UndoManager.
 
 An undo action should be a callable object (called with no arguments).
+Changes to the model are recorded in a compact form: a tuple of operation,
+element id, property and old value.
 
 An undo action should return a callable object that acts as redo function.
 If None is returned the undo action is considered to be the redo action as well.
@@ -11,7 +13,10 @@ NOTE: it would be nice to use actions in conjunction with functools.partial.
 """
 
 import logging
-from typing import Callable, List, Optional
+import os
+import sys
+import weakref
+from typing import Any, Callable, Hashable, List, Optional, Set, Tuple, Union
 
 from gaphor.abc import ActionProvider, Service
 from gaphor.action import action
@@ -43,6 +48,57 @@ from gaphor.transaction import Transaction, transactional
 logger = logging.getLogger(__name__)
 
 
+# Undo operations are stored as tuples:
+#
+#   (operation, element id, property, value)
+#
+# The value is the state to go back to. Other undo actions are callables.
+[
+    REVERT_EVENT,  # value is a RevertibeEvent
+    UNDO_CREATE,
+    UNDO_DELETE,  # property is the element type, value (diagram id, data) or None
+    REVERT_ATTRIBUTE,  # value is the old value
+    REVERT_ASSOCIATION_SET,  # value is the old value id, or None
+    REVERT_ASSOCIATION_ADD,  # value is the added element id
+    REVERT_ASSOCIATION_DELETE,  # value is the deleted element id
+] = range(7)
+
+# Number of transactions kept in the undo history
+STACK_DEPTH = 20
+
+# Number of transactions kept if old transactions are paged out to a journal
+JOURNAL_STACK_DEPTH = 200
+
+Operation = Tuple[int, str, Any, Any]
+UndoAction = Union[Callable[[], None], Operation]
+
+
+def describe(action: UndoAction) -> str:
+    """A human readable description of an undo action."""
+    if callable(action):
+        return action.__doc__ or repr(action)
+
+    operation, element_id, prop, value = action
+    if operation == REVERT_EVENT:
+        return f"Reverse event {value.__class__.__name__} for element {element_id}."
+    elif operation == UNDO_CREATE:
+        return f"Undo create element {element_id}."
+    elif operation == UNDO_DELETE:
+        return f"Recreate element {prop} ({element_id})."
+    elif operation == REVERT_ASSOCIATION_ADD:
+        return f"{element_id}.{prop.name} delete {value}."
+    elif operation == REVERT_ASSOCIATION_DELETE:
+        return f"{element_id}.{prop.name} add {value}."
+    return f"Revert {element_id}.{prop.name} to {value}."
+
+
+def action_size(action: UndoAction) -> int:
+    """Approximate memory used by an undo action, in bytes."""
+    if callable(action):
+        return sys.getsizeof(action)
+    return sys.getsizeof(action) + sys.getsizeof(action[3])
+
+
 class ActionStack:
     """A transaction.
 
@@ -54,21 +110,70 @@ class ActionStack:
     """
 
     def __init__(self):
-        self._actions: List[Callable[[], None]] = []
-
-    def add(self, action):
+        self._actions: List[UndoAction] = []
+        self._coalesce_keys: Set[Hashable] = set()
+        self._journal = None
+        self._journal_key = 0
+        self.size = 0
+
+    def add(self, action, coalesce_key=None):
+        """Add an undo action.
+
+        Of the actions with the same `coalesce_key` only the first is
+        kept: it restores the state from before the transaction.
+        """
+        if coalesce_key is not None:
+            if coalesce_key in self._coalesce_keys:
+                return
+            self._coalesce_keys.add(coalesce_key)
+        elif not callable(action) and action[0] == REVERT_EVENT:
+            # Other events, like splitting a line segment, may renumber handles
+            self._coalesce_keys.clear()
         self._actions.append(action)
+        self.size += action_size(action)
+
+    def close(self):
+        """Stop recording actions.
+
+        The coalesce keys refer to elements, and are no longer needed.
+        """
+        self._coalesce_keys.clear()
+
+    def page_out(self, journal) -> bool:
+        """Move the actions to an undo journal, to free memory.
+
+        The actions are removed from the journal once this transaction
+        is released.
+
+        Returns `False` if the actions can not be stored.
+        """
+        if self._journal is not None:
+            return True
+        key = journal.write(self._actions)
+        if key is None:
+            return False
+        weakref.finalize(self, journal.discard, key)
+        self._journal = journal
+        self._journal_key = key
+        self._actions = []
+        self.size = 0
+        return True
 
     def can_execute(self):
-        return bool(self._actions)
+        return self._journal is not None or bool(self._actions)
 
     @transactional
-    def execute(self):
-        self._actions.reverse()
+    def execute(self, perform):
+        if self._journal is not None:
+            actions = self._journal.read(self._journal_key)
+        else:
+            self._actions.reverse()
+            actions = iter(self._actions)
 
-        for act in self._actions:
-            logger.debug(act.__doc__)
-            act()
+        for act in actions:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(describe(act))
+            perform(act)
 
 
 class UndoManagerStateChanged(ServiceEvent):
@@ -90,12 +195,37 @@ class UndoManager(Service, ActionProvider):
     performed action.
     """
 
-    def __init__(self, event_manager, element_factory):
+    def __init__(
+        self,
+        event_manager,
+        element_factory,
+        stack_depth=None,
+        memory_budget=32 * 1024 * 1024,
+        journal=None,
+    ):
+        """The undo history is limited to `stack_depth` transactions, and
+        about `memory_budget` bytes.
+
+        With an `UndoJournal`, transactions that exceed the memory budget
+        are paged out to disk instead of being dropped. The last
+        transaction is always kept in memory. If the environment variable
+        `GAPHOR_UNDO_JOURNAL` is set, a journal in a temporary file is
+        used.
+        """
+        if journal is None and os.getenv("GAPHOR_UNDO_JOURNAL"):
+            from gaphor.services.undojournal import UndoJournal
+
+            journal = UndoJournal(element_factory)
+        if stack_depth is None:
+            stack_depth = JOURNAL_STACK_DEPTH if journal else STACK_DEPTH
+
         self.event_manager = event_manager
         self.element_factory: RepositoryProtocol = element_factory
         self._undo_stack: List[ActionStack] = []
         self._redo_stack: List[ActionStack] = []
-        self._stack_depth = 20
+        self._stack_depth = stack_depth
+        self._memory_budget = memory_budget
+        self._journal = journal
         self._current_transaction = None
         self._undoing = 0
 
@@ -112,6 +242,8 @@ class UndoManager(Service, ActionProvider):
         self.event_manager.unsubscribe(self.commit_transaction)
         self.event_manager.unsubscribe(self.rollback_transaction)
         self._unregister_undo_handlers()
+        if self._journal:
+            self._journal.close()
 
     def clear_undo_stack(self):
         self._undo_stack = []
@@ -124,6 +256,8 @@ class UndoManager(Service, ActionProvider):
     def reset(self, event=None):
         self.clear_redo_stack()
         self.clear_undo_stack()
+        if self._journal:
+            self._journal.clear()
         self._action_executed()
 
     @event_handler(TransactionBegin)
@@ -132,10 +266,14 @@ class UndoManager(Service, ActionProvider):
         assert not self._current_transaction
         self._current_transaction = ActionStack()
 
-    def add_undo_action(self, action, requires_transaction=True):
-        """Add an action to undo."""
+    def add_undo_action(self, action, requires_transaction=True, coalesce_key=None):
+        """Add an action to undo.
+
+        Within a transaction, only the first action for a `coalesce_key`
+        is recorded.
+        """
         if self._current_transaction:
-            self._current_transaction.add(action)
+            self._current_transaction.add(action, coalesce_key)
             self._action_executed()
         elif requires_transaction:
             undo_stack = list(self._undo_stack)
@@ -143,7 +281,7 @@ class UndoManager(Service, ActionProvider):
 
             try:
                 with Transaction(self.event_manager):
-                    action()
+                    self._perform(action)
             finally:
                 # Restore stacks and act like nothing happened
                 self._redo_stack = redo_stack
@@ -155,11 +293,11 @@ class UndoManager(Service, ActionProvider):
     def commit_transaction(self, event=None):
         assert self._current_transaction
 
+        self._current_transaction.close()
         if self._current_transaction.can_execute():
             self.clear_redo_stack()
             self._undo_stack.append(self._current_transaction)
-            while len(self._undo_stack) > self._stack_depth:
-                del self._undo_stack[0]
+            self._trim(self._undo_stack)
 
         self._current_transaction = None
 
@@ -178,7 +316,7 @@ class UndoManager(Service, ActionProvider):
         try:
             with Transaction(self.event_manager):
                 try:
-                    erroneous_tx.execute()
+                    erroneous_tx.execute(self._perform)
                 except Exception:
                     logger.error("Could not rollback transaction", exc_info=True)
                     raise
@@ -212,7 +350,7 @@ class UndoManager(Service, ActionProvider):
         try:
             self._undoing += 1
             with Transaction(self.event_manager):
-                transaction.execute()
+                transaction.execute(self._perform)
         finally:
             # Restore stacks and put latest tx on the redo stack
             self._redo_stack = redo_stack
@@ -221,8 +359,7 @@ class UndoManager(Service, ActionProvider):
             self._undo_stack = undo_stack
             self._undoing -= 1
 
-        while len(self._redo_stack) > self._stack_depth:
-            del self._redo_stack[0]
+        self._trim(self._redo_stack)
 
         self._action_executed()
 
@@ -240,7 +377,7 @@ class UndoManager(Service, ActionProvider):
         try:
             self._undoing += 1
             with Transaction(self.event_manager):
-                transaction.execute()
+                transaction.execute(self._perform)
         finally:
             self._redo_stack = redo_stack
             self._undoing -= 1
@@ -266,6 +403,63 @@ class UndoManager(Service, ActionProvider):
         self.event_manager.handle(ActionEnabled("win.edit-redo", self.can_redo()))
         self.event_manager.handle(UndoManagerStateChanged(self))
 
+    def _trim(self, stack: List[ActionStack]) -> None:
+        """Drop, or page out, the oldest transactions, keeping the latest
+        one."""
+        del stack[: -max(self._stack_depth, 1)]
+
+        size = sum(tx.size for tx in stack)
+        drop = 0
+        for index, tx in enumerate(stack[:-1]):
+            if size <= self._memory_budget:
+                break
+            size -= tx.size
+            if not (self._journal and tx.page_out(self._journal)):
+                drop = index + 1
+        del stack[:drop]
+
+    def _perform(self, action: UndoAction) -> None:
+        if callable(action):
+            action()
+            return
+
+        operation, element_id, prop, value = action
+        if operation == UNDO_DELETE:
+            self._recreate(element_id, prop, value)
+            return
+
+        element = self.lookup(element_id)
+        if operation == REVERT_EVENT:
+            value.revert(element)
+        elif operation == UNDO_CREATE:
+            element.unlink()
+        elif operation == REVERT_ATTRIBUTE:
+            prop.set(element, value)
+        elif operation == REVERT_ASSOCIATION_SET:
+            prop.set(element, value and self.lookup(value), from_opposite=True)
+        elif operation == REVERT_ASSOCIATION_ADD:
+            prop.delete(element, self.lookup(value), from_opposite=True)
+        elif operation == REVERT_ASSOCIATION_DELETE:
+            prop.set(element, self.lookup(value), from_opposite=True)
+
+    def _recreate(self, element_id, element_type, presentation_data):
+        if not presentation_data:
+            self.element_factory.create_as(element_type, element_id)
+            return
+
+        diagram_id, data = presentation_data
+        # If diagram is not there, for some reason, recreate it.
+        # It's probably removed in the same transaction.
+        try:
+            diagram: Diagram = self.lookup(diagram_id)  # type: ignore[assignment]
+        except ValueError:
+            diagram = self.element_factory.create_as(Diagram, diagram_id)
+
+        element = diagram.create_as(element_type, element_id)
+        for name, ser in data.items():
+            for value in deserialize(ser, lambda ref: None):
+                element.load(name, value)
+
     def lookup(self, id: str) -> Element:
         element: Optional[Element] = self.element_factory.lookup(id)
         if not element:
@@ -296,143 +490,71 @@ class UndoManager(Service, ActionProvider):
 
     @event_handler(RevertibeEvent)
     def undo_reversible_event(self, event: RevertibeEvent):
-        element_id = event.element.id
-
-        def undo_reversible_event():
-            element = self.lookup(element_id)
-            event.revert(element)
-
-        undo_reversible_event.__doc__ = (
-            f"Reverse event {event.__class__.__name__} for element {event.element}."
-        )
-
         self.add_undo_action(
-            undo_reversible_event, requires_transaction=event.requires_transaction
+            (REVERT_EVENT, event.element.id, None, event),
+            requires_transaction=event.requires_transaction,
+            coalesce_key=getattr(event, "coalesce_key", None),
         )
 
     @event_handler(ElementCreated)
     def undo_create_element_event(self, event: ElementCreated):
-        element_id = event.element.id
-
-        def undo_create_event():
-            element = self.lookup(element_id)
-            element.unlink()
-
-        undo_create_event.__doc__ = f"Undo create element {event.element}."
-        del event
-
-        self.add_undo_action(undo_create_event)
+        self.add_undo_action((UNDO_CREATE, event.element.id, None, None))
 
     @event_handler(ElementDeleted)
     def undo_delete_element_event(self, event: ElementDeleted):
-        element_type = type(event.element)
-        element_id = event.element.id
-
+        presentation_data = None
         if isinstance(event.element, Presentation):
-            diagram_id = event.diagram.id
             data = {}
 
             def save_func(name, value):
                 data[name] = serialize(value)
 
             event.element.save(save_func)
+            presentation_data = (event.diagram.id, data)
 
-            def undo_delete_event():
-                # If diagram is not there, for some reason, recreate it.
-                # It's probably removed in the same transaction.
-                try:
-                    diagram: Diagram = self.lookup(diagram_id)  # type: ignore[assignment]
-                except ValueError:
-                    diagram = self.element_factory.create_as(Diagram, diagram_id)
-
-                element = diagram.create_as(element_type, element_id)
-                for name, ser in data.items():
-                    for value in deserialize(ser, lambda ref: None):
-                        element.load(name, value)
-
-        else:
-
-            def undo_delete_event():
-                self.element_factory.create_as(element_type, element_id)
-
-        undo_delete_event.__doc__ = f"Recreate element {element_type} ({element_id})."
-        del event
-
-        self.add_undo_action(undo_delete_event)
+        self.add_undo_action(
+            (UNDO_DELETE, event.element.id, type(event.element), presentation_data)
+        )
 
     @event_handler(AttributeUpdated)
     def undo_attribute_change_event(self, event: AttributeUpdated):
-        attribute = event.property
-        element_id = event.element.id
-        value = event.old_value
-
-        def undo_attribute_change_event():
-            element = self.lookup(element_id)
-            attribute.set(element, value)
-
-        undo_attribute_change_event.__doc__ = (
-            f"Revert {event.element}.{attribute.name} to {value}."
+        self.add_undo_action(
+            (REVERT_ATTRIBUTE, event.element.id, event.property, event.old_value)
         )
-        del event
-
-        self.add_undo_action(undo_attribute_change_event)
 
     @event_handler(AssociationSet)
     def undo_association_set_event(self, event: AssociationSet):
         association = event.property
         if type(association) is not association_property:
             return
-        element_id = event.element.id
-        value_id = event.old_value and event.old_value.id
-
-        def undo_association_set_event():
-            element = self.lookup(element_id)
-            value = value_id and self.lookup(value_id)
-            association.set(element, value, from_opposite=True)
-
-        undo_association_set_event.__doc__ = (
-            f"Revert {event.element}.{association.name} to {event.old_value}."
+        self.add_undo_action(
+            (
+                REVERT_ASSOCIATION_SET,
+                event.element.id,
+                association,
+                event.old_value and event.old_value.id,
+            )
         )
-        del event
-
-        self.add_undo_action(undo_association_set_event)
 
     @event_handler(AssociationAdded)
     def undo_association_add_event(self, event: AssociationAdded):
         association = event.property
         if type(association) is not association_property:
             return
-        element_id = event.element.id
-        value_id = event.new_value.id
-
-        def undo_association_add_event():
-            element = self.lookup(element_id)
-            value = self.lookup(value_id)
-            association.delete(element, value, from_opposite=True)
-
-        undo_association_add_event.__doc__ = (
-            f"{event.element}.{association.name} delete {event.new_value}."
+        self.add_undo_action(
+            (REVERT_ASSOCIATION_ADD, event.element.id, association, event.new_value.id)
         )
-        del event
-
-        self.add_undo_action(undo_association_add_event)
 
     @event_handler(AssociationDeleted)
     def undo_association_delete_event(self, event: AssociationDeleted):
         association = event.property
         if type(association) is not association_property:
             return
-        element_id = event.element.id
-        value_id = event.old_value.id
-
-        def undo_association_delete_event():
-            element = self.lookup(element_id)
-            value = self.lookup(value_id)
-            association.set(element, value, from_opposite=True)
-
-        undo_association_delete_event.__doc__ = (
-            f"{event.element}.{association.name} add {event.old_value}."
+        self.add_undo_action(
+            (
+                REVERT_ASSOCIATION_DELETE,
+                event.element.id,
+                association,
+                event.old_value.id,
+            )
         )
-        del event
-
-        self.add_undo_action(undo_association_delete_event)
@@ -15,8 +15,10 @@ Each element has a type, which corresponds to a class name in one of the
 ModelingLanguage modules. Elements also have a unique ID, by which they are
 referered to in the dictionary returned by parse().
 
-The generator parse_generator(filename, loader) may be used if the loading
-takes a long time. The yielded values are the percentage of the file read.
+For loading large models, read_generator(filename, reader) streams elements
+through an ElementReader: elements become available while the file is being
+parsed, so they do not all have to be kept in memory. The yielded values are
+the percentage of the file read.
 """
 
 from __future__ import annotations
@@ -25,12 +27,12 @@ import io
 import logging
 import os
 from collections import OrderedDict
-from typing import IO
-from xml.sax import handler
+from typing import Callable, NoReturn
+from xml.parsers import expat
 
 from gaphor.storage.upgrade_canvasitem import upgrade_canvasitem
 
-__all__ = ["parse", "ParserException"]
+__all__ = ["parse", "ElementReader", "read_generator", "ParserException"]
 
 log = logging.getLogger(__name__)
 
@@ -75,6 +77,9 @@ class canvas(base):
 
 XMLNS = "http://gaphor.sourceforge.net/model"
 
+# Block size used when streaming a model file
+BLOCK_SIZE = 64 * 1024
+
 
 class ParserException(Exception):
     pass
@@ -97,228 +102,6 @@ class ParserException(Exception):
 State = int
 
 
-class GaphorLoader(handler.ContentHandler):
-    """Create a list of elements.
-
-    an element may contain a canvas and a canvas may contain canvas
-    items. Each element can have values and references to other
-    elements.
-    """
-
-    def __init__(self):
-        handler.ContentHandler.__init__(self)
-        # make sure all variables are initialized:
-        self.startDocument()
-
-    def push(self, element, state):
-        """Add an element to the item stack."""
-        self._stack.append((element, state))
-
-    def pop(self):
-        """Return the last item on the stack.
-
-        The item is removed from the stack.
-        """
-        return self._stack.pop()[0]
-
-    def peek(self, depth=1):
-        """Return the last item on the stack.
-
-        The item is not removed.
-        """
-        return self._stack[-1 * depth][0]
-
-    def state(self):
-        """Return the current state of the parser."""
-        try:
-            return self._stack[-1][1]
-        except IndexError:
-            return ROOT
-
-    def startDocument(self):
-        """Start of document: all our attributes are initialized."""
-        self.version = None
-        self.gaphor_version = None
-        self.elements: dict[str, element] = OrderedDict()
-        self._stack: list[tuple[element | canvas, State]] = []
-        self.text = ""
-        self._start_element_handlers = (
-            self.start_element,
-            self.start_canvas,
-            self.start_canvas_item,
-            self.start_attribute,
-            self.start_reference,
-            self.start_attribute_value,
-            self.start_root,
-            self.invalid_tag,
-        )
-
-    def endDocument(self):
-        if len(self._stack) != 0:
-            raise ParserException("Invalid XML document.")
-
-    def startElement(self, name, attrs):
-        self.text = ""
-
-        state = self.state()
-
-        for h in self._start_element_handlers:
-            if h(state, name, attrs):
-                break
-
-    def start_element(self, state, name, attrs):
-        # Read an element class. The name of the tag is the class name:
-        if state == GAPHOR:
-            if "id" not in attrs:
-                log.exception(f"File corrupt: Element {name} has no id")
-            id = attrs["id"]
-            e = element(id, name)
-            if id in self.elements.keys():
-                log.exception(
-                    f"File corrupt: duplicate element. Remove element {name} with id {id} and try again"
-                )
-            self.elements[id] = e
-            self.push(e, name == "Diagram" and DIAGRAM or ELEMENT)
-            return True
-
-    def start_canvas(self, state, name, attrs):
-        # NB. Only used for pre-2.5 models.
-        # Special treatment for the <canvas> tag in a Diagram:
-        if state == DIAGRAM and name == "canvas":
-            c = canvas()
-            self.push(c, CANVAS)
-            return True
-
-    def start_canvas_item(self, state, name, attrs):
-        # NB. Only used for pre-2.5 models.
-        # Items in a canvas are referenced by the <item> tag:
-        if state in (CANVAS, ITEM) and name == "item":
-            id = attrs["id"]
-            ci = element(id, attrs["type"])
-            assert id not in self.elements.keys(), f"{id} already defined"
-            parent_or_canvas = self.peek()
-            if state == ITEM:
-                ci.references["parent"] = parent_or_canvas.id
-                ci.references["diagram"] = parent_or_canvas.references["diagram"]
-            else:
-                ci.references["diagram"] = self.peek(2).id
-            self.elements[id] = ci
-            self.push(ci, ITEM)
-            return True
-
-    def start_attribute(self, state, name, attrs):
-        # Store the attribute name on the stack, so we can use it later
-        # to store the <ref>, <reflist> or <val> content:
-        if state in (ELEMENT, DIAGRAM, CANVAS, ITEM):
-            # handle 'normal' attributes
-            self.push(name, ATTR)
-            return True
-
-    def start_reference(self, state, name, attrs):
-        # Reference list:
-        if state == ATTR and name == "reflist":
-            self.push(self.peek(), REFLIST)
-            return True
-
-        # Reference with multiplicity 1:
-        elif state == ATTR and name == "ref":
-            n = self.peek(1)
-            self.peek(2).references[n] = attrs["refid"]
-            self.push(None, REF)
-            return True
-
-        # Reference with multiplicity *:
-        elif state == REFLIST and name == "ref":
-            n = self.peek(1)
-            # Fetch the element instance from the stack
-            r = self.peek(3).references
-            refid = attrs["refid"]
-            try:
-                r[n].append(refid)
-            except KeyError:
-                r[n] = [refid]
-            self.push(None, REF)
-            return True
-
-    def start_attribute_value(self, state, name, attrs):
-        # We need to get the text within the <val> tag:
-        if state == ATTR and name == "val":
-            self.push(None, VAL)
-            return True
-
-    def start_root(self, state, name, attrs):
-        # The <gaphor> tag is the toplevel tag:
-        if state == ROOT and name == "gaphor":
-            assert attrs["version"] in ("3.0",)
-            self.version = attrs["version"]
-            self.gaphor_version = attrs.get("gaphor-version")
-            if not self.gaphor_version:
-                self.gaphor_version = attrs.get("gaphor_version")
-            self.push(None, GAPHOR)
-            return True
-
-    def invalid_tag(self, state, name, attrs):
-        raise ParserException(f"Invalid XML: tag <{name}> not known (state = {state})")
-
-    def endElement(self, name):
-        # Put the text on the value
-        if self.state() == VAL:
-            # Two levels up: the attribute name
-            n = self.peek(2)
-            # Three levels up: the element instance
-            self.peek(3).values[n] = self.text
-        elif self.state() == ITEM:
-            item = self.pop()
-            new_canvasitems = upgrade_canvasitem(item, self.gaphor_version)
-            for new_item in new_canvasitems:
-                self.elements[new_item.id] = new_item
-            return
-        self.pop()
-
-    def startElementNS(self, name, qname, attrs):
-        if not name[0] or name[0] == XMLNS:
-            a = {key[1]: val for key, val in list(attrs.items())}
-            self.startElement(name[1], a)
-
-    def endElementNS(self, name, qname):
-        if not name[0] or name[0] == XMLNS:
-            self.endElement(name[1])
-
-    def characters(self, content):
-        """Read characters."""
-        self.text = self.text + content
-
-
-def parse(filename) -> dict[str, element]:
-    """Parse a file and return a dictionary ID:element."""
-    loader = GaphorLoader()
-
-    for _ in parse_generator(filename, loader):
-        pass
-    return loader.elements
-
-
-def parse_generator(filename, loader):
-    """The generator based version of parse().
-
-    parses the file filename and load it with ContentHandler loader.
-    """
-    assert isinstance(loader, GaphorLoader), "loader should be a GaphorLoader"
-    from xml.sax import make_parser
-
-    parser = make_parser()
-
-    parser.setFeature(handler.feature_namespaces, 1)
-    parser.setContentHandler(loader)
-
-    try:
-        # returns only a progress percentage
-        yield from parse_file(filename, parser)
-    except UnicodeDecodeError:
-        # Fall back on default encoding
-        yield from parse_file(filename, parser, encoding=None)
-
-
 class ProgressGenerator:
     """A generator that yields the progress of taking from a file input object
     and feeding it into an output object.
@@ -365,26 +148,208 @@ class ProgressGenerator:
             yield (read_size * 100) / self.file_size
 
 
-def parse_file(filename, parser, encoding: str | None = "utf-8"):
-    """Parse the supplied file using the supplied parser.
+class ElementReader:
+    """Read elements from a model file, one at a time.
+
+    ElementReader appends each element to ``loaded`` as soon as it is read
+    completely. A consumer should take the elements from there while the
+    file is being parsed. Canvas items (Gaphor < 2.5) are made available
+    right after their diagram.
 
-    The parser parameter should be a GaphorLoader instance.  The
-    filename parameter can be an open file descriptor instance or the
-    name of a file.  The progress percentage of the parser is yielded.
+    Element ids should be unique. A duplicate id is logged, and the element
+    is read anyway: the last element with an id takes precedence.
     """
 
-    is_fd = True
+    def __init__(self):
+        self.version: str | None = None
+        self.gaphor_version: str | None = None
+        self.loaded: list[element] = []
+        self._states: list[State] = [ROOT]
+        # The elements, canvas and canvas items that are being read
+        self._owners: list[element | canvas] = []
+        self._attribute = ""
+        self._canvas_items: list[element] = []
+        self._ids: set[str] = set()
+        self._text: list[str] = []
+        # Handlers for a start tag, by parser state. They return the new state.
+        self._start_handlers: dict[State, Callable[[str, dict[str, str]], State]] = {
+            ROOT: self._start_root,
+            GAPHOR: self._start_element,
+            ELEMENT: self._start_attribute,
+            DIAGRAM: self._start_diagram_content,
+            CANVAS: self._start_canvas_content,
+            ITEM: self._start_canvas_content,
+            ATTR: self._start_value,
+            REFLIST: self._start_reference,
+        }
+        # Handlers for an end tag, by the state it ends
+        self._end_handlers: dict[State, Callable[[], None]] = {
+            ELEMENT: self._end_element,
+            DIAGRAM: self._end_element,
+            CANVAS: self._owners.pop,
+            ITEM: self._end_canvas_item,
+            VAL: self._end_value,
+        }
+        self._parser = parser = expat.ParserCreate(namespace_separator=" ")
+        parser.buffer_text = True
+        parser.buffer_size = BLOCK_SIZE
+        parser.StartElementHandler = self.start_element
+        parser.EndElementHandler = self.end_element
+
+    def feed(self, data: str) -> None:
+        self._parser.Parse(data, False)
+
+    def close(self) -> None:
+        self._parser.Parse("", True)
+        if len(self._states) != 1:
+            raise ParserException("Invalid XML document.")
 
+    def start_element(self, name, attrs):
+        ns, _, name = name.rpartition(" ")
+        if ns and ns != XMLNS:
+            return
+        if any(" " in key for key in attrs):
+            attrs = {key.rpartition(" ")[2]: val for key, val in attrs.items()}
+
+        state = self._states[-1]
+        try:
+            handler = self._start_handlers[state]
+        except KeyError:
+            self._invalid_tag(state, name)
+        self._states.append(handler(name, attrs))
+
+    def end_element(self, name):
+        ns, _, name = name.rpartition(" ")
+        if ns and ns != XMLNS:
+            return
+
+        if handler := self._end_handlers.get(self._states.pop()):
+            handler()
+
+    def _start_root(self, name, attrs):
+        # The <gaphor> tag is the toplevel tag:
+        if name != "gaphor":
+            self._invalid_tag(ROOT, name)
+        assert attrs["version"] in ("3.0",)
+        self.version = attrs["version"]
+        self.gaphor_version = attrs.get("gaphor-version") or attrs.get("gaphor_version")
+        return GAPHOR
+
+    def _start_element(self, name, attrs):
+        # Read an element class. The name of the tag is the class name:
+        if "id" not in attrs:
+            log.error(f"File corrupt: Element {name} has no id")
+        self._owners.append(element(self._check_id(attrs["id"], name), name))
+        return DIAGRAM if name == "Diagram" else ELEMENT
+
+    def _start_attribute(self, name, attrs):
+        # Remember the attribute name, to store the <ref>, <reflist> or
+        # <val> content
+        self._attribute = name
+        return ATTR
+
+    def _start_diagram_content(self, name, attrs):
+        if name == "canvas":
+            # NB. Only used for pre-2.5 models.
+            self._owners.append(canvas())
+            return CANVAS
+        return self._start_attribute(name, attrs)
+
+    def _start_canvas_content(self, name, attrs):
+        if name != "item":
+            return self._start_attribute(name, attrs)
+
+        # NB. Only used for pre-2.5 models.
+        item = element(self._check_id(attrs["id"], attrs["type"]), attrs["type"])
+        parent_or_canvas = self._owners[-1]
+        if isinstance(parent_or_canvas, element):
+            item.references["parent"] = parent_or_canvas.id
+            item.references["diagram"] = parent_or_canvas.references["diagram"]
+        else:
+            item.references["diagram"] = self._owners[-2].id
+        self._canvas_items.append(item)
+        self._owners.append(item)
+        return ITEM
+
+    def _start_value(self, name, attrs):
+        if name == "val":
+            # Only text within a <val> tag is of interest. It is collected
+            # in chunks, and joined at the end of the element.
+            self._text.clear()
+            self._parser.CharacterDataHandler = self._text.append
+            return VAL
+        elif name == "ref":
+            # Reference with multiplicity 1:
+            self._owners[-1].references[self._attribute] = attrs["refid"]
+            return REF
+        elif name == "reflist":
+            return REFLIST
+        self._invalid_tag(ATTR, name)
+
+    def _start_reference(self, name, attrs):
+        # Reference with multiplicity *:
+        if name != "ref":
+            self._invalid_tag(REFLIST, name)
+        references = self._owners[-1].references
+        if isinstance(refids := references.get(self._attribute), list):
+            refids.append(attrs["refid"])
+        else:
+            references[self._attribute] = [attrs["refid"]]
+        return REF
+
+    def _invalid_tag(self, state: State, name: str) -> NoReturn:
+        raise ParserException(f"Invalid XML: tag <{name}> not known (state = {state})")
+
+    def _check_id(self, id: str, name: str) -> str:
+        if id in self._ids:
+            log.error(
+                f"File corrupt: duplicate element. Remove element {name} with id {id} and try again"
+            )
+        self._ids.add(id)
+        return id
+
+    def _end_value(self):
+        self._parser.CharacterDataHandler = None
+        self._owners[-1].values[self._attribute] = "".join(self._text)
+
+    def _end_element(self):
+        elem = self._owners.pop()
+        assert isinstance(elem, element)
+        self.loaded.append(elem)
+        if self._canvas_items:
+            self.loaded.extend(self._canvas_items)
+            self._canvas_items.clear()
+
+    def _end_canvas_item(self):
+        item = self._owners.pop()
+        self._canvas_items.extend(upgrade_canvasitem(item, self.gaphor_version))
+
+
+def read_generator(filename, reader: ElementReader, encoding: str | None = "utf-8"):
+    """Stream a model file into an ElementReader.
+
+    The filename parameter can be an open file descriptor instance or
+    the name of a file. The progress percentage of the parser is
+    yielded.
+    """
     if isinstance(filename, io.IOBase):
-        file_obj: IO | io.IOBase = filename
+        yield from ProgressGenerator(filename, reader, BLOCK_SIZE)
+        reader.close()
     else:
-        is_fd = False
-        file_obj = open(filename, "r", encoding=encoding)
+        with open(filename, encoding=encoding) as file_obj:
+            yield from ProgressGenerator(file_obj, reader, BLOCK_SIZE)
+            reader.close()
 
-    try:
-        yield from ProgressGenerator(file_obj, parser)
-    finally:
-        parser.close()
 
-        if not is_fd:
-            file_obj.close()
+def parse(filename) -> dict[str, element]:
+    """Parse a file and return a dictionary ID:element."""
+    reader = ElementReader()
+    try:
+        for _ in read_generator(filename, reader):
+            pass
+    except UnicodeDecodeError:
+        # Fall back on default encoding
+        reader = ElementReader()
+        for _ in read_generator(filename, reader, encoding=None):
+            pass
+    return OrderedDict((e.id, e) for e in reader.loaded)
@@ -9,10 +9,12 @@ __all__ = ["load", "save"]
 import io
 import logging
 import os.path
+from contextlib import closing
 from functools import partial
 
 from gaphor import application
 from gaphor.core.modeling.collection import collection
+from gaphor.core.modeling.diagram import Diagram
 from gaphor.core.modeling.element import Element
 from gaphor.core.modeling.presentation import Presentation
 from gaphor.core.modeling.stylesheet import StyleSheet
@@ -165,19 +167,11 @@ def _load_elements_and_canvasitems(
     def create_element(elem):
         if elem.element:
             return
-        if version_lower_than(gaphor_version, (2, 1, 0)):
-            elem = upgrade_element_owned_comment_to_comment(elem)
-        if version_lower_than(gaphor_version, (2, 3, 0)):
-            elem = upgrade_package_owned_classifier_to_owned_type(elem)
-            elem = upgrade_implementation_to_interface_realization(elem)
-            elem = upgrade_feature_parameters_to_owned_parameter(elem)
-            elem = upgrade_parameter_owner_formal_param(elem)
-        if version_lower_than(gaphor_version, (2, 5, 0)):
-            elem = upgrade_diagram_element(elem)
-        if version_lower_than(gaphor_version, (2, 6, 0)):
-            elem = upgrade_generalization_arrow_direction(elem)
+        elem = upgrade_element(elem, gaphor_version)
         if version_lower_than(gaphor_version, (2, 9, 0)):
-            elem = upgrade_flow_item_to_control_flow_item(elem, elements)
+            elem = upgrade_flow_item_to_control_flow_item(
+                elem, lambda id: elements[id].type
+            )
 
         cls = modeling_language.lookup_element(elem.type)
         assert cls, f"Type {elem.type} cannot be loaded: no such element"
@@ -188,6 +182,8 @@ def _load_elements_and_canvasitems(
             elem.element = factory.create_as(cls, elem.id, diagram_elem.element)
         else:
             elem.element = factory.create_as(cls, elem.id)
+            if isinstance(elem.element, Diagram):
+                elem.element.defer_watches()
 
     for id, elem in list(elements.items()):
         yield from update_status_queue()
@@ -243,45 +239,140 @@ def load_generator(filename, factory, modeling_language):
     """
     if isinstance(filename, io.IOBase):
         log.info("Loading file from file descriptor")
-    else:
-        log.info(f"Loading file {os.fsdecode(os.path.basename(filename))}")
-    try:
-        # Use the incremental parser and yield the percentage of the file.
-        loader = parser.GaphorLoader()
-        for percentage in parser.parse_generator(filename, loader):
-            if percentage:
-                yield percentage / 2
-            else:
-                yield percentage
-        elements = loader.elements
-        gaphor_version = loader.gaphor_version
-
-    except OSError:
-        log.exception("File could no be parsed")
-        raise
+        yield from _stream_generator(filename, factory, modeling_language)
+        return
 
-    if version_lower_than(gaphor_version, (0, 17, 0)):
-        raise ValueError(
-            f"Gaphor model version should be at least 0.17.0 (found {gaphor_version})"
+    log.info(f"Loading file {os.fsdecode(os.path.basename(filename))}")
+    try:
+        yield from _stream_generator(filename, factory, modeling_language)
+    except UnicodeDecodeError:
+        # Fall back on default encoding
+        yield from _stream_generator(
+            filename, factory, modeling_language, encoding=None
         )
 
-    log.info(f"Read {len(elements)} elements from file")
 
-    factory.flush()
-    with factory.block_events():
+def _stream_generator(filename, factory, modeling_language, encoding="utf-8"):
+    """Create model elements while the file is being parsed.
+
+    Elements are created as soon as they are read. References are
+    resolved once the whole file has been read.
+    """
+    reader = parser.ElementReader()
+    with closing(parser.read_generator(filename, reader, encoding)) as progress:
         try:
-            for percentage in load_elements_generator(
-                elements, factory, modeling_language, gaphor_version
-            ):
-                if percentage:
-                    yield percentage / 2 + 50
-                else:
-                    yield percentage
-            yield 100
-        except Exception as e:
-            log.warning(f"file {filename} could not be loaded ({e})")
+            # Read up to the <gaphor> tag, so we know what we're dealing with
+            for percentage in progress:
+                if reader.version:
+                    break
+                yield percentage * 0.8
+        except OSError:
+            log.exception("File could no be parsed")
             raise
-    factory.model_ready()
+
+        gaphor_version = reader.gaphor_version
+        if version_lower_than(gaphor_version, (0, 17, 0)):
+            raise ValueError(
+                f"Gaphor model version should be at least 0.17.0 (found {gaphor_version})"
+            )
+
+        factory.flush()
+        with factory.bulk_create():
+            try:
+                yield from _load_streamed_elements(
+                    reader, progress, factory, modeling_language, gaphor_version
+                )
+                yield 100
+            except Exception as e:
+                log.warning(f"file {filename} could not be loaded ({e})")
+                raise
+
+
+def _load_streamed_elements(
+    reader, progress, factory, modeling_language, gaphor_version
+):
+    # Parsed elements by id, in file order, with their model element
+    elements = {}
+    # Presentations can only be created once their diagram exists
+    deferred = []
+    upgrade_flow_items = version_lower_than(gaphor_version, (2, 9, 0))
+
+    def create_element(elem):
+        cls = modeling_language.lookup_element(elem.type)
+        assert cls, f"Type {elem.type} cannot be loaded: no such element"
+        if issubclass(cls, Presentation):
+            diagram = factory.lookup(elem.references["diagram"])
+            if diagram is None:
+                return False
+            elem.element = factory.create_as(cls, elem.id, diagram)
+        else:
+            elem.element = factory.create_as(cls, elem.id)
+            if isinstance(elem.element, Diagram):
+                elem.element.defer_watches()
+
+        for name, value in elem.values.items():
+            elem.element.load(name, value)
+        # Values are no longer needed, only references have to be resolved
+        elem.values = {}
+        return True
+
+    def create_loaded_elements():
+        loaded, reader.loaded = reader.loaded, []
+        for elem in loaded:
+            elem = upgrade_element(elem, gaphor_version)
+            if duplicate := elements.get(elem.id):
+                # The last element with an id takes precedence
+                _discard_element(duplicate, deferred)
+            elements[elem.id] = elem
+            if (upgrade_flow_items and elem.type == "FlowItem") or not create_element(
+                elem
+            ):
+                deferred.append(elem)
+
+    for percentage in progress:
+        create_loaded_elements()
+        yield percentage * 0.8
+    create_loaded_elements()
+
+    for elem in deferred:
+        if upgrade_flow_items:
+            elem = upgrade_flow_item_to_control_flow_item(
+                elem, lambda id: type(factory[id]).__name__
+            )
+        if not create_element(elem):
+            raise KeyError(elem.references["diagram"])
+
+    size = len(elements) * 2
+    for n, elem in enumerate(elements.values(), start=1):
+        if n % 30 == 0:
+            yield n * 20 / size + 80
+        _load_references(elem, factory)
+
+    upgrade_ensure_style_sheet_is_present(factory)
+
+    for n, elem in enumerate(elements.values(), start=len(elements) + 1):
+        if n % 30 == 0:
+            yield n * 20 / size + 80
+        elem.element.postload()
+
+
+def _discard_element(elem, deferred):
+    if elem in deferred:
+        deferred.remove(elem)
+    if elem.element:
+        elem.element.unlink()
+
+
+def _load_references(elem, factory):
+    for name, refids in elem.references.items():
+        for refid in refids if isinstance(refids, list) else (refids,):
+            ref = factory.lookup(refid)
+            if ref is None:
+                log.error(
+                    f"Invalid ID for reference ({refid}) for element {elem.type}.{name}"
+                )
+            else:
+                elem.element.load(name, ref)
 
 
 def version_lower_than(gaphor_version, version):
@@ -295,6 +386,22 @@ def version_lower_than(gaphor_version, version):
     return tuple(map(int, parts[:2])) < version[:2]
 
 
+def upgrade_element(elem, gaphor_version):
+    """Apply the upgrades that only concern the element itself."""
+    if version_lower_than(gaphor_version, (2, 1, 0)):
+        elem = upgrade_element_owned_comment_to_comment(elem)
+    if version_lower_than(gaphor_version, (2, 3, 0)):
+        elem = upgrade_package_owned_classifier_to_owned_type(elem)
+        elem = upgrade_implementation_to_interface_realization(elem)
+        elem = upgrade_feature_parameters_to_owned_parameter(elem)
+        elem = upgrade_parameter_owner_formal_param(elem)
+    if version_lower_than(gaphor_version, (2, 5, 0)):
+        elem = upgrade_diagram_element(elem)
+    if version_lower_than(gaphor_version, (2, 6, 0)):
+        elem = upgrade_generalization_arrow_direction(elem)
+    return elem
+
+
 # since 2.2.0
 def upgrade_ensure_style_sheet_is_present(factory):
     style_sheet = next(factory.select(StyleSheet), None)
@@ -383,10 +490,10 @@ def upgrade_generalization_arrow_direction(elem):
 
 
 # since 2.9.0
-def upgrade_flow_item_to_control_flow_item(elem, elements):
+def upgrade_flow_item_to_control_flow_item(elem, type_of):
     if elem.type == "FlowItem":
         if subject_id := elem.references.get("subject"):
-            subject_type = elements[subject_id].type
+            subject_type = type_of(subject_id)
         else:
             subject_type = "ControlFlow"
 
@@ -1,6 +1,8 @@
 from io import StringIO
 
-from gaphor.storage.parser import parse
+import pytest
+
+from gaphor.storage.parser import ElementReader, ParserException, parse, read_generator
 
 
 def test_parsing_v2_1_model_with_grouped_item(test_models):
@@ -59,3 +61,87 @@ def test_parsing_of_xml_external_entities_should_fail(test_models):
 
     assert elements
     assert elements["0"].values["name"] == ""
+
+
+def read(filename):
+    reader = ElementReader()
+    elements = []
+    for _ in read_generator(filename, reader):
+        elements.extend(reader.loaded)
+        reader.loaded.clear()
+    return elements + reader.loaded
+
+
+def test_reading_canvas_items_right_after_their_diagram(test_models):
+    elements = read(test_models / "node-component-v2.1.gaphor")
+
+    assert [e.type for e in elements[:4]] == [
+        "Package",
+        "Diagram",
+        "NodeItem",
+        "ComponentItem",
+    ]
+
+
+def test_reading_of_xml_external_entities_should_fail():
+    model = StringIO(
+        """<?xml version="1.0" encoding="utf-8"?>
+        <!DOCTYPE gaphor [
+        <!ENTITY xxe SYSTEM "https://gaphor.org/latest.txt" >]>
+        <gaphor xmlns="http://gaphor.sourceforge.net/model" version="3.0" gaphor-version="2.9.2">
+         <Package id="0">
+          <name>
+           <val>&xxe;</val>
+          </name>
+         </Package>
+        </gaphor>"""
+    )
+    elements = read(model)
+
+    assert elements[0].values["name"] == ""
+
+
+def test_reading_invalid_tag_should_fail():
+    model = StringIO(
+        """<?xml version="1.0" encoding="utf-8"?>
+        <gaphor xmlns="http://gaphor.sourceforge.net/model" version="3.0" gaphor-version="2.9.2">
+         <Package id="0">
+          <name>
+           <foo/>
+          </name>
+         </Package>
+        </gaphor>"""
+    )
+
+    with pytest.raises(ParserException):
+        read(model)
+
+
+DUPLICATE_ID_MODEL = """<?xml version="1.0" encoding="utf-8"?>
+        <gaphor xmlns="http://gaphor.sourceforge.net/model" version="3.0" gaphor-version="2.9.2">
+         <Package id="0">
+          <name>
+           <val>first</val>
+          </name>
+         </Package>
+         <Class id="0">
+          <name>
+           <val>second</val>
+          </name>
+         </Class>
+        </gaphor>"""
+
+
+def test_reading_duplicate_id_is_logged(caplog):
+    elements = read(StringIO(DUPLICATE_ID_MODEL))
+
+    assert [e.type for e in elements] == ["Package", "Class"]
+    assert "duplicate element" in caplog.text
+
+
+def test_parsing_duplicate_id_keeps_last_element():
+    elements = parse(StringIO(DUPLICATE_ID_MODEL))
+
+    assert len(elements) == 1
+    assert elements["0"].type == "Class"
+    assert elements["0"].values["name"] == "second"
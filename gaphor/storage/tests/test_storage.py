@@ -6,10 +6,11 @@ from io import StringIO
 import pytest
 
 from gaphor import UML
-from gaphor.core.modeling import Comment, Diagram, StyleSheet
+from gaphor.core.modeling import Comment, Diagram, Element, StyleSheet
+from gaphor.core.modeling.collection import collection
 from gaphor.diagram.general import CommentItem
 from gaphor.diagram.tests.fixtures import connect
-from gaphor.storage import storage
+from gaphor.storage import parser, storage
 from gaphor.UML.classes import AssociationItem, ClassItem, InterfaceItem
 
 
@@ -290,3 +291,125 @@ def test_save_with_invalidreference(element_factory, saver, caplog):
     assert p.id in data
     assert c.id not in data
     assert "Model has unknown reference" in caplog.text
+
+
+def model_state(element_factory):
+    def element_state(element):
+        saved = []
+
+        def save_func(name, value):
+            if isinstance(value, Element):
+                value = value.id
+            elif isinstance(value, collection):
+                value = [v.id for v in value]
+            saved.append((name, value))
+
+        element.save(save_func)
+        return type(element).__name__, saved
+
+    return {e.id: element_state(e) for e in element_factory.values()}
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        "action-issue.gaphor",
+        "association-ends.gaphor",
+        "dbus.gaphor",
+        "decision-fork-nodes.gaphor",
+        "interaction.gaphor",
+        "node-component-v2.1.gaphor",
+        "simple-items.gaphor",
+    ],
+)
+def test_streaming_load_matches_load_of_parsed_elements(
+    element_factory, modeling_language, test_models, model
+):
+    path = test_models / model
+    reader = parser.ElementReader()
+    for _ in parser.read_generator(path, reader):
+        pass
+    with element_factory.block_events():
+        storage.load_elements(
+            {e.id: e for e in reader.loaded},
+            element_factory,
+            modeling_language,
+            reader.gaphor_version,
+        )
+    expected = model_state(element_factory)
+
+    storage.load(path, element_factory, modeling_language)
+
+    assert model_state(element_factory) == expected
+
+
+def test_load_presentation_before_its_diagram(element_factory, loader):
+    loader(
+        """<?xml version="1.0" encoding="utf-8"?>
+        <gaphor xmlns="http://gaphor.sourceforge.net/model" version="3.0" gaphor-version="2.12.0">
+         <CommentItem id="2">
+          <diagram>
+           <ref refid="1"/>
+          </diagram>
+          <subject>
+           <ref refid="3"/>
+          </subject>
+         </CommentItem>
+         <Diagram id="1">
+          <ownedPresentation>
+           <reflist>
+            <ref refid="2"/>
+           </reflist>
+          </ownedPresentation>
+         </Diagram>
+         <Comment id="3">
+          <body>
+           <val>A comment</val>
+          </body>
+         </Comment>
+        </gaphor>"""
+    )
+
+    item = element_factory.lookup("2")
+
+    assert isinstance(item, CommentItem)
+    assert item.diagram is element_factory.lookup("1")
+    assert item.subject.body == "A comment"
+
+
+def test_load_model_with_duplicate_id(element_factory, loader):
+    loader(
+        """<?xml version="1.0" encoding="utf-8"?>
+        <gaphor xmlns="http://gaphor.sourceforge.net/model" version="3.0" gaphor-version="2.12.0">
+         <Package id="1">
+          <name>
+           <val>first</val>
+          </name>
+         </Package>
+         <Class id="1">
+          <name>
+           <val>second</val>
+          </name>
+         </Class>
+        </gaphor>"""
+    )
+
+    assert element_factory.lselect(UML.Package) == []
+    assert element_factory.lookup("1").name == "second"
+
+
+def test_loaded_diagram_defers_watches(create, element_factory, saver, loader):
+    create(ClassItem, UML.Class)
+
+    data = saver()
+    loader(data)
+
+    diagram = element_factory.lselect(Diagram)[0]
+    item = element_factory.lselect(ClassItem)[0]
+
+    assert not diagram.watches_enabled
+    assert "subject[Class].ownedAttribute" not in item._watcher._watched_paths
+
+    diagram.enable_watches()
+
+    assert "subject[Class].ownedAttribute" in item._watcher._watched_paths
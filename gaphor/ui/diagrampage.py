@@ -7,16 +7,15 @@ from gaphas.guide import GuidePainter
 from gaphas.painter import FreeHandPainter, HandlePainter, PainterChain
 from gaphas.segment import LineSegmentPainter
 from gaphas.tool.rubberband import RubberbandPainter, RubberbandState
-from gaphas.view import GtkView
 from gi.repository import Gdk, GdkPixbuf, Gtk
 
 from gaphor.core import event_handler, gettext
 from gaphor.core.modeling import StyleSheet
-from gaphor.core.modeling.diagram import Diagram, StyledDiagram
+from gaphor.core.modeling.diagram import Diagram, StyledDiagram, StyledItem
 from gaphor.core.modeling.event import AttributeUpdated, ElementDeleted
 from gaphor.diagram.diagramtoolbox import get_tool_def, tooliter
 from gaphor.diagram.drop import drop
-from gaphor.diagram.painter import DiagramTypePainter, ItemPainter
+from gaphor.diagram.painter import DiagramTypePainter, ItemPainter, RenderCache
 from gaphor.diagram.selection import Selection
 from gaphor.diagram.tools import (
     apply_default_tool_set,
@@ -25,6 +24,7 @@ from gaphor.diagram.tools import (
 )
 from gaphor.diagram.tools.magnet import MagnetPainter
 from gaphor.diagram.tools.placement import create_item, open_editor
+from gaphor.diagram.view import DiagramView
 from gaphor.event import Notification
 from gaphor.transaction import Transaction
 from gaphor.ui.event import DiagramSelectionChanged, ToolSelected
@@ -38,7 +38,7 @@ def placement_icon_base():
         return GdkPixbuf.Pixbuf.new_from_file_at_scale(str(f), 64, 64, True)
 
 
-GtkView.set_css_name("diagramview")
+DiagramView.set_css_name("diagramview")
 
 
 if Gtk.get_major_version() == 3:
@@ -115,7 +115,7 @@ class DiagramPage:
         self.diagram = diagram
         self.modeling_language = modeling_language
 
-        self.view: Optional[GtkView] = None
+        self.view: Optional[DiagramView] = None
         self.widget: Optional[Gtk.Widget] = None
         self.diagram_css: Optional[Gtk.CssProvider] = None
 
@@ -140,7 +140,7 @@ class DiagramPage:
         """
         assert self.diagram
 
-        view = GtkView(selection=Selection())
+        view = DiagramView(selection=Selection(), render_cache=RenderCache())
         if Gtk.get_major_version() == 3:
             view.add_events(Gdk.EventMask.SMOOTH_SCROLL_MASK)
             view.drag_dest_set(
@@ -227,9 +227,11 @@ class DiagramPage:
         if event.property is StyleSheet.styleSheet:
             self.set_drawing_style()
 
+            style_sheet = event.element
             diagram = self.diagram
             for item in diagram.get_all_items():
-                diagram.request_update(item)
+                if style_sheet.changed(StyledItem(item)):
+                    diagram.request_update(item)
         elif event.property is Diagram.name and self.view:
             self.view.update_back_buffer()
 
@@ -283,7 +285,7 @@ class DiagramPage:
 
         view = self.view
 
-        item_painter = ItemPainter(view.selection)
+        item_painter = ItemPainter(view.selection, view.render_cache)
 
         if sloppiness := style.get("line-style", 0.0):
             item_painter = FreeHandPainter(item_painter, sloppiness=sloppiness)
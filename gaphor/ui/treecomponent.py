@@ -202,9 +202,10 @@ class TreeComponent(UIComponent, ActionProvider):
         self.model.add_element(element)
         self.select_element(element)
 
-    @event_handler(AttributeUpdated)
-    def on_attribute_changed(self, event: AttributeUpdated):
-        self.model.sync(event.element)
+    @event_handler(AttributeUpdated, batch=True)
+    def on_attribute_changed(self, events: list[AttributeUpdated]):
+        for element in dict.fromkeys(event.element for event in events):
+            self.model.sync(element)
         self.sorter.changed(Gtk.SorterChange.DIFFERENT)
 
     @event_handler(ModelReady, ModelFlushed)
@@ -0,0 +1,53 @@
+# flake8: noqa F401,F811
+"""Benchmark moving many items on a diagram, with batched event delivery."""
+
+import time
+
+import pytest
+
+from gaphor import UML
+from gaphor.conftest import diagram, element_factory, event_manager, modeling_language
+from gaphor.core import Transaction, event_handler
+from gaphor.core.modeling.event import ElementUpdated, RevertibeEvent
+from gaphor.UML.classes import ClassItem
+
+
+@pytest.mark.slow
+def test_move_items_with_batch_handler(
+    diagram, element_factory, event_manager, record_property
+):
+    with Transaction(event_manager):
+        items = [
+            diagram.create(ClassItem, subject=element_factory.create(UML.Class))
+            for _ in range(200)
+        ]
+
+    updated = []
+    batch_updated = []
+
+    @event_handler(ElementUpdated, RevertibeEvent)
+    def on_update(event):
+        updated.append(event.element)
+
+    @event_handler(ElementUpdated, RevertibeEvent, batch=True)
+    def on_updates(events):
+        batch_updated.extend(event.element for event in events)
+
+    event_manager.subscribe(on_update)
+    event_manager.subscribe(on_updates)
+
+    start = time.perf_counter()
+    with Transaction(event_manager):
+        # Drag all items, step by step
+        for _ in range(50):
+            for item in items:
+                item.matrix.translate(1, 1)
+                item.handles()[0].pos = (0, 0)
+    move_time = time.perf_counter() - start
+
+    record_property("move_time", move_time)
+    record_property("events", len(updated))
+    record_property("batched_events", len(batch_updated))
+
+    assert set(batch_updated) == set(items)
+    assert len(batch_updated) < len(updated) / 10
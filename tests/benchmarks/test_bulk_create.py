@@ -0,0 +1,34 @@
+"""Benchmark creating elements in bulk."""
+
+import time
+
+import pytest
+
+from gaphor import UML
+from gaphor.core.modeling import ElementFactory
+from gaphor.core.modeling.elementfactory import RecordingEventManager
+
+
+def create_classes(element_factory, count):
+    start = time.perf_counter()
+    for n in range(count):
+        element_factory.create_as(UML.Class, str(n))
+    return time.perf_counter() - start
+
+
+@pytest.mark.slow
+def test_bulk_create_versus_recorded_create(record_property):
+    recorded_factory = ElementFactory()
+    # Events are recorded per element, and dropped afterwards
+    with recorded_factory.block_events(RecordingEventManager(None)):
+        recorded_time = create_classes(recorded_factory, 100_000)
+
+    bulk_factory = ElementFactory()
+    with bulk_factory.bulk_create():
+        bulk_time = create_classes(bulk_factory, 100_000)
+
+    record_property("recorded_create_time", recorded_time)
+    record_property("bulk_create_time", bulk_time)
+
+    assert bulk_factory.size() == recorded_factory.size()
+    assert bulk_time < recorded_time
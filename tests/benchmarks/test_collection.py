@@ -0,0 +1,116 @@
+# flake8: noqa F401,F811
+"""Benchmark populating and tearing down a package with many members."""
+
+import time
+
+import pytest
+
+from gaphor import UML
+from gaphor.conftest import element_factory, event_manager, modeling_language
+from gaphor.core.modeling.collection import collectionlist
+
+MEMBERS = 20000
+
+
+class listcollection:
+    """The list based membership test and removal used before."""
+
+    def __init__(self):
+        self.items = collectionlist()
+
+    def __contains__(self, obj):
+        return obj in self.items
+
+    def discard(self, value):
+        try:
+            self.items.remove(value)
+        except ValueError:
+            pass
+
+
+@pytest.mark.slow
+def test_populate_and_tear_down_package(element_factory, record_property):
+    package = element_factory.create(UML.Package)
+    classes = [element_factory.create(UML.Class) for _ in range(MEMBERS)]
+
+    start = time.perf_counter()
+    for c in classes:
+        c.package = package
+    populate_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    assert all(c in package.ownedType for c in classes)
+    contains_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for c in classes[::2]:
+        c.unlink()
+    package.unlink()
+    teardown_time = time.perf_counter() - start
+
+    record_property("populate_time", populate_time)
+    record_property("contains_time", contains_time)
+    record_property("teardown_time", teardown_time)
+
+    assert not element_factory.lselect()
+
+
+@pytest.mark.slow
+def test_membership_and_removal(record_property):
+    values = [object() for _ in range(MEMBERS)]
+
+    def run(c, add, discard):
+        start = time.perf_counter()
+        for v in values:
+            if v not in c:
+                add(v)
+        for v in values[::-1][::2]:
+            discard(v)
+        for v in values:
+            discard(v)
+        return time.perf_counter() - start
+
+    old = listcollection()
+    list_time = run(old, old.items.append, old.discard)
+
+    new = UML.Package().ownedType
+    collection_time = run(new, new._add, new._discard)
+
+    record_property("list_time", list_time)
+    record_property("collection_time", collection_time)
+
+    assert not new
+    assert collection_time < list_time
+
+
+@pytest.mark.slow
+def test_alternate_removal_and_index(element_factory, record_property):
+    package = element_factory.create(UML.Package)
+    classes = [element_factory.create(UML.Class) for _ in range(MEMBERS)]
+    for c in classes:
+        c.package = package
+    removed = classes[: MEMBERS // 2 : 2]
+    indexed = classes[MEMBERS // 2 :: 10]
+
+    def run(index, remove):
+        start = time.perf_counter()
+        for c, other in zip(removed, indexed):
+            remove(c)
+            index(other)
+        return time.perf_counter() - start
+
+    items = list(classes)
+    list_time = run(items.index, items.remove)
+
+    owned_type = package.ownedType
+
+    def remove(c):
+        c.package = None
+
+    collection_time = run(owned_type.index, remove)
+
+    record_property("list_time", list_time)
+    record_property("collection_time", collection_time)
+
+    assert list(owned_type) == items
+    assert collection_time < list_time
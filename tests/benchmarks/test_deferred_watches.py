@@ -0,0 +1,63 @@
+# flake8: noqa F401,F811
+"""Benchmark loading a model with many diagrams."""
+
+import time
+from io import StringIO
+
+import pytest
+
+from gaphor import UML
+from gaphor.conftest import element_factory, event_manager, modeling_language
+from gaphor.core.eventmanager import EventManager
+from gaphor.core.modeling import Diagram, ElementFactory
+from gaphor.core.modeling.elementdispatcher import ElementDispatcher
+from gaphor.storage import storage
+from gaphor.UML.classes import ClassItem
+
+DIAGRAMS = 500
+ITEMS = 10
+
+
+def create_model(element_factory):
+    with element_factory.block_events():
+        for _ in range(DIAGRAMS):
+            diagram = element_factory.create(Diagram)
+            for _ in range(ITEMS):
+                diagram.create(ClassItem, subject=element_factory.create(UML.Class))
+
+    f = StringIO()
+    storage.save(f, element_factory)
+    return f.getvalue()
+
+
+def load(data, modeling_language):
+    event_manager = EventManager()
+    element_dispatcher = ElementDispatcher(event_manager, modeling_language)
+    element_factory = ElementFactory(event_manager, element_dispatcher)
+
+    start = time.perf_counter()
+    storage.load(StringIO(data), element_factory, modeling_language)
+    load_time = time.perf_counter() - start
+
+    table_size = len(element_dispatcher._handlers)
+    element_factory.shutdown()
+    return load_time, table_size
+
+
+@pytest.mark.slow
+def test_load_many_diagrams(
+    element_factory, modeling_language, monkeypatch, record_property
+):
+    data = create_model(element_factory)
+
+    deferred_time, deferred_table_size = load(data, modeling_language)
+    with monkeypatch.context() as m:
+        m.setattr(Diagram, "defer_watches", lambda self: None)
+        eager_time, eager_table_size = load(data, modeling_language)
+
+    record_property("eager_load_time", eager_time)
+    record_property("eager_dispatcher_table_size", eager_table_size)
+    record_property("deferred_load_time", deferred_time)
+    record_property("deferred_dispatcher_table_size", deferred_table_size)
+
+    assert deferred_table_size < eager_table_size
@@ -0,0 +1,42 @@
+"""Benchmark reading derived unions while the model is being edited."""
+
+import time
+
+import pytest
+
+from gaphor import UML
+from gaphor.core.eventmanager import EventManager
+from gaphor.core.modeling import ElementFactory
+from gaphor.core.modeling.properties import derivedunion
+
+
+@pytest.mark.slow
+def test_owned_element_reads_during_bulk_edit(monkeypatch, record_property):
+    element_factory = ElementFactory(EventManager())
+    packages = [element_factory.create(UML.Package) for _ in range(200)]
+    for package in packages:
+        for _ in range(10):
+            element_factory.create(UML.Class).package = package
+
+    updates = 0
+    _update = derivedunion._update
+
+    def counting_update(self, obj):
+        nonlocal updates
+        updates += 1
+        return _update(self, obj)
+
+    monkeypatch.setattr(derivedunion, "_update", counting_update)
+
+    start = time.perf_counter()
+    for package in packages:
+        # Edit one package, then read the owned elements of all packages
+        package.ownedType[0].ownedAttribute = element_factory.create(UML.Property)
+        for p in packages:
+            assert len(p.ownedElement) == 10
+    elapsed = time.perf_counter() - start
+
+    record_property("union_updates", updates)
+    record_property("elapsed", elapsed)
+
+    assert updates < len(packages) * 10
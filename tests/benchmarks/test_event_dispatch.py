@@ -0,0 +1,44 @@
+"""Benchmark dispatching events through the event manager."""
+
+import time
+
+import pytest
+from generic.event import Manager
+
+from gaphor.core import event_handler
+from gaphor.core.eventmanager import EventManager
+from gaphor.core.modeling.event import AssociationAdded, ElementUpdated
+
+EVENTS = 1_000_000
+
+
+@pytest.mark.slow
+def test_dispatch_a_million_events(record_property):
+    count = 0
+
+    @event_handler(ElementUpdated)
+    def handler(event):
+        nonlocal count
+        count += 1
+
+    event = AssociationAdded(None, None, None)
+
+    manager = Manager()
+    manager.subscribe(handler, ElementUpdated)
+    start = time.perf_counter()
+    for _ in range(EVENTS):
+        manager.handle(event)
+    generic_time = time.perf_counter() - start
+
+    event_manager = EventManager()
+    event_manager.subscribe(handler)
+    start = time.perf_counter()
+    for _ in range(EVENTS):
+        event_manager.handle(event)
+    event_manager_time = time.perf_counter() - start
+
+    record_property("generic_dispatch_time", generic_time)
+    record_property("event_manager_dispatch_time", event_manager_time)
+
+    assert count == 2 * EVENTS
+    assert event_manager_time < generic_time
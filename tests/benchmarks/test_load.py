@@ -0,0 +1,76 @@
+# flake8: noqa F401,F811
+"""Benchmark loading models, streamed versus parsed up front."""
+
+import time
+import tracemalloc
+
+import pytest
+
+from gaphor.conftest import models
+from gaphor.core.eventmanager import EventManager
+from gaphor.core.modeling import ElementFactory
+from gaphor.core.modeling.elementdispatcher import ElementDispatcher
+from gaphor.core.modeling.modelinglanguage import (
+    CoreModelingLanguage,
+    MockModelingLanguage,
+)
+from gaphor.RAAML.modelinglanguage import RAAMLModelingLanguage
+from gaphor.storage import parser, storage
+from gaphor.SysML.modelinglanguage import SysMLModelingLanguage
+from gaphor.UML.modelinglanguage import UMLModelingLanguage
+
+
+def parse_and_load(path, element_factory, modeling_language):
+    reader = parser.ElementReader()
+    for _ in parser.read_generator(path, reader):
+        pass
+    element_factory.flush()
+    with element_factory.block_events():
+        storage.load_elements(
+            {e.id: e for e in reader.loaded},
+            element_factory,
+            modeling_language,
+            reader.gaphor_version,
+        )
+    element_factory.model_ready()
+
+
+def measure(load, path):
+    event_manager = EventManager()
+    modeling_language = MockModelingLanguage(
+        CoreModelingLanguage(),
+        UMLModelingLanguage(),
+        SysMLModelingLanguage(),
+        RAAMLModelingLanguage(),
+    )
+    element_factory = ElementFactory(
+        event_manager, ElementDispatcher(event_manager, modeling_language)
+    )
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    load(path, element_factory, modeling_language)
+    load_time = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    size = element_factory.size()
+    element_factory.shutdown()
+    return load_time, peak, size
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("model", ["UML.gaphor", "RAAML_full.gaphor"])
+def test_streaming_load_versus_parse_and_load(models, model, record_property):
+    path = models / model
+
+    parse_time, parse_peak, parse_size = measure(parse_and_load, path)
+    stream_time, stream_peak, stream_size = measure(storage.load, path)
+
+    record_property("parse_and_load_time", parse_time)
+    record_property("parse_and_load_peak_memory", parse_peak)
+    record_property("streaming_load_time", stream_time)
+    record_property("streaming_load_peak_memory", stream_peak)
+
+    assert stream_size == parse_size
+    assert stream_peak < parse_peak
@@ -0,0 +1,56 @@
+# flake8: noqa F401,F811
+"""Benchmark painting a diagram of fixed size in a growing model."""
+
+import time
+
+import cairo
+import pytest
+
+from gaphor import UML
+from gaphor.conftest import element_factory, event_manager, modeling_language
+from gaphor.core.modeling import Diagram, StyleSheet
+from gaphor.diagram.painter import ItemPainter
+from gaphor.transaction import Transaction
+from gaphor.UML.classes import ClassItem
+
+DIAGRAM_ITEMS = 50
+MODEL_SIZES = [1_000, 10_000, 100_000]
+
+
+def paint_time(diagram):
+    surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, 800, 600)
+    cr = cairo.Context(surface)
+    painter = ItemPainter()
+    items = list(diagram.get_all_items())
+
+    def paint():
+        start = time.perf_counter()
+        painter.paint(items, cr)
+        return time.perf_counter() - start
+
+    return min(paint() for _ in range(3))
+
+
+@pytest.mark.slow
+def test_paint_time_does_not_depend_on_model_size(
+    element_factory, event_manager, record_property
+):
+    with Transaction(event_manager):
+        element_factory.create(StyleSheet)
+        diagram = element_factory.create(Diagram)
+        for _ in range(DIAGRAM_ITEMS):
+            diagram.create(ClassItem, subject=element_factory.create(UML.Class))
+    diagram.update_now(diagram.get_all_items())
+
+    times = []
+    model_size = len(element_factory.lselect())
+    for size in MODEL_SIZES:
+        with element_factory.block_events():
+            for _ in range(size - model_size):
+                element_factory.create(UML.Class)
+        model_size = size
+
+        times.append(paint_time(diagram))
+        record_property(f"paint_time_{size}", times[-1])
+
+    assert times[-1] < times[0] * 2
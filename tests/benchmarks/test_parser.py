@@ -0,0 +1,51 @@
+# flake8: noqa F401,F811
+"""Stress test loading models with large values."""
+
+import time
+from io import StringIO
+
+import pytest
+
+from gaphor.conftest import element_factory, event_manager, modeling_language
+from gaphor.storage import storage
+
+LINE = "A long note, split in many lines.\n"
+
+
+def model_with_note(size):
+    note = LINE * (size // len(LINE))
+    return note, (
+        """<?xml version="1.0" encoding="utf-8"?>
+        <gaphor xmlns="http://gaphor.sourceforge.net/model" version="3.0" gaphor-version="2.12.0">
+         <Comment id="0">
+          <body>
+           <val>"""
+        + note
+        + """</val>
+          </body>
+         </Comment>
+        </gaphor>"""
+    )
+
+
+def load_time(size, element_factory, modeling_language):
+    note, model = model_with_note(size)
+    start = time.perf_counter()
+    storage.load(StringIO(model), element_factory, modeling_language)
+    duration = time.perf_counter() - start
+    assert element_factory.lookup("0").body == note
+    return duration
+
+
+@pytest.mark.slow
+def test_load_time_grows_linearly_with_value_size(
+    element_factory, modeling_language, record_property
+):
+    small = load_time(2_000_000, element_factory, modeling_language)
+    large = load_time(8_000_000, element_factory, modeling_language)
+
+    record_property("load_time_2mb", small)
+    record_property("load_time_8mb", large)
+
+    # Four times the data, allow for some noise. Quadratic growth would be 16x.
+    assert large < small * 8
@@ -0,0 +1,58 @@
+# flake8: noqa F401,F811
+"""Benchmark ordering the presentations of a diagram with many items."""
+
+import time
+
+import gaphas
+import pytest
+
+from gaphor.conftest import diagram, element_factory, event_manager, modeling_language
+from gaphor.UML.classes import ClassItem, DependencyItem, PackageItem
+
+PACKAGES = 100
+CLASSES = 20
+LINES = 1000
+
+
+def is_ordered(diagram):
+    """Items are ordered depth-first, with lines last."""
+    items = list(diagram.get_all_items())
+    lines = [isinstance(item, gaphas.Line) for item in items]
+    if lines != sorted(lines):
+        return False
+    position = {item: n for n, item in enumerate(items)}
+    return all(
+        position[item.parent] < position[item]
+        for item in items
+        if item.parent and not isinstance(item, gaphas.Line)
+    )
+
+
+@pytest.mark.slow
+def test_order_large_diagram(diagram, record_property):
+    start = time.perf_counter()
+    packages = [diagram.create(PackageItem) for _ in range(PACKAGES)]
+    classes = [
+        diagram.create(ClassItem, parent=package)
+        for package in packages
+        for _ in range(CLASSES)
+    ]
+    for n in range(LINES):
+        diagram.create(DependencyItem, parent=packages[n % PACKAGES])
+    create_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    diagram.create(ClassItem)
+    place_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for item in classes[:100]:
+        item.parent = packages[-1]
+    reparent_time = (time.perf_counter() - start) / 100
+
+    record_property("items", len(diagram.ownedPresentation))
+    record_property("create_time", create_time)
+    record_property("place_time", place_time)
+    record_property("reparent_time", reparent_time)
+
+    assert is_ordered(diagram)
@@ -0,0 +1,50 @@
+# flake8: noqa F401,F811
+"""Benchmark loading the same model repeatedly in one session."""
+
+import gc
+import time
+import tracemalloc
+
+import pytest
+
+from gaphor.conftest import element_factory, event_manager, modeling_language, models
+from gaphor.core.modeling import Diagram
+from gaphor.storage import storage
+
+LOADS = 5
+
+
+def load_model(element_factory, modeling_language, models):
+    storage.load(models / "UML.gaphor", element_factory, modeling_language)
+    for diagram in element_factory.select(Diagram):
+        diagram.enable_watches()
+    gc.collect()
+
+
+@pytest.mark.slow
+def test_reload_model(element_factory, modeling_language, models, record_property):
+    dispatcher = element_factory.element_dispatcher
+    statistics = []
+    memory = []
+
+    # Fill caches, e.g. of compiled style sheets and watch paths, before
+    # the first measurement
+    load_model(element_factory, modeling_language, models)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(LOADS):
+        load_model(element_factory, modeling_language, models)
+        statistics.append(dispatcher.statistics())
+        memory.append(tracemalloc.get_traced_memory()[0])
+    load_time = (time.perf_counter() - start) / LOADS
+    tracemalloc.stop()
+
+    for name, value in statistics[-1].items():
+        record_property(f"dispatcher_{name}", value)
+    record_property("load_time", load_time)
+    record_property("memory_first_load", memory[0])
+    record_property("memory_last_load", memory[-1])
+
+    assert all(s == statistics[0] for s in statistics)
+    assert memory[-1] < memory[0] * 1.01
@@ -0,0 +1,113 @@
+# flake8: noqa F401,F811
+"""Benchmark repainting a large diagram after a small edit, and while
+scrolling."""
+
+import time
+
+import cairo
+import pytest
+from gaphas.painter import BoundingBoxPainter
+from gaphas.view import GtkView
+from gi.repository import Gtk
+
+from gaphor import UML
+from gaphor.conftest import element_factory, event_manager, modeling_language
+from gaphor.core.modeling import Diagram, StyleSheet
+from gaphor.diagram.painter import ItemPainter, RenderCache
+from gaphor.diagram.selection import Selection
+from gaphor.diagram.view import DiagramView
+from gaphor.transaction import Transaction
+from gaphor.UML.classes import ClassItem
+
+COLUMNS = 50
+ROWS = 40
+EDITS = 20
+
+
+def large_diagram(element_factory, event_manager):
+    with Transaction(event_manager):
+        element_factory.create(StyleSheet)
+        diagram = element_factory.create(Diagram)
+        for n in range(COLUMNS * ROWS):
+            item = diagram.create(ClassItem, subject=element_factory.create(UML.Class))
+            item.matrix.translate(200 * (n % COLUMNS), 150 * (n // COLUMNS))
+    return diagram
+
+
+def edit_frame_time(view, diagram):
+    item_painter = ItemPainter(view.selection)
+    view.painter = item_painter
+    view.bounding_box_painter = BoundingBoxPainter(item_painter)
+    view.model = diagram
+    view.set_size_request(1600, 1200)
+    window = show(view)
+    view.update_back_buffer()
+
+    item = diagram.ownedPresentation[COLUMNS + 1]
+    start = time.perf_counter()
+    for n in range(EDITS):
+        item.matrix.translate(5 if n % 2 else -5, 0)
+        view.request_update((item,))
+    frame_time = (time.perf_counter() - start) / EDITS
+    window.destroy()
+    view.model = None
+    return frame_time
+
+
+def show(view):
+    if Gtk.get_major_version() == 3:
+        window = Gtk.Window.new(Gtk.WindowType.TOPLEVEL)
+        window.add(view)
+        window.show_all()
+    else:
+        window = Gtk.Window.new()
+        window.set_child(view)
+        window.show()
+    return window
+
+
+@pytest.mark.slow
+def test_repaint_after_small_edit(element_factory, event_manager, record_property):
+    diagram = large_diagram(element_factory, event_manager)
+
+    full_frame_time = edit_frame_time(GtkView(selection=Selection()), diagram)
+    dirty_frame_time = edit_frame_time(DiagramView(selection=Selection()), diagram)
+
+    record_property("items", len(diagram.ownedPresentation))
+    record_property("full_frame_time", full_frame_time)
+    record_property("edit_frame_time", dirty_frame_time)
+
+    assert dirty_frame_time < full_frame_time
+
+
+def pan_frame_time(painter, items):
+    surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, 800, 600)
+    start = time.perf_counter()
+    for n in range(EDITS):
+        cr = cairo.Context(surface)
+        cr.translate(-10 * n, -5 * n)
+        painter.paint(items, cr)
+    return (time.perf_counter() - start) / EDITS
+
+
+@pytest.mark.slow
+def test_pan_with_render_cache(element_factory, event_manager, record_property):
+    diagram = large_diagram(element_factory, event_manager)
+    items = list(diagram.get_all_items())
+    diagram.update_now(items)
+    painter = ItemPainter()
+    cached_painter = ItemPainter(render_cache=RenderCache())
+
+    frame_time = pan_frame_time(painter, items)
+    surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, 800, 600)
+    start = time.perf_counter()
+    cached_painter.paint(items, cairo.Context(surface))
+    record_time = time.perf_counter() - start
+    cached_frame_time = pan_frame_time(cached_painter, items)
+
+    record_property("items", len(items))
+    record_property("frame_time", frame_time)
+    record_property("record_time", record_time)
+    record_property("cached_frame_time", cached_frame_time)
+
+    assert cached_frame_time < frame_time
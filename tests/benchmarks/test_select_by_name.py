@@ -0,0 +1,35 @@
+"""Benchmark looking up elements by name."""
+
+import time
+
+import pytest
+
+from gaphor import UML
+from gaphor.core.modeling import ElementFactory
+
+
+@pytest.mark.slow
+def test_select_by_name(record_property):
+    element_factory = ElementFactory()
+    for n in range(100_000):
+        element_factory.create(UML.Class).name = f"Class{n}"
+    element_factory.add_index("name")
+
+    start = time.perf_counter()
+    scanned = next(
+        element_factory.select(
+            lambda e: isinstance(e, UML.Class) and e.name == "Class99999"
+        )
+    )
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(1_000):
+        indexed = next(element_factory.select_by("name", "Class99999", UML.Class))
+    index_time = (time.perf_counter() - start) / 1_000
+
+    record_property("scan_time", scan_time)
+    record_property("index_time", index_time)
+
+    assert scanned is indexed
+    assert index_time < scan_time
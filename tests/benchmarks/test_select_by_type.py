@@ -0,0 +1,31 @@
+"""Benchmark selecting elements by type for different model sizes."""
+
+import time
+
+import pytest
+
+from gaphor import UML
+from gaphor.core.modeling import ElementFactory, StyleSheet
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("size", [1_000, 10_000, 100_000])
+def test_select_style_sheet(size, record_property):
+    element_factory = ElementFactory()
+    for _ in range(size):
+        element_factory.create(UML.Class)
+    element_factory.create(StyleSheet)
+
+    start = time.perf_counter()
+    for _ in range(1_000):
+        next(element_factory.select(StyleSheet))
+    elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    element_factory.lselect(UML.Classifier)
+    select_all_time = time.perf_counter() - start
+
+    record_property("select_time", elapsed / 1_000)
+    record_property("select_all_time", select_all_time)
+
+    assert elapsed < 0.1
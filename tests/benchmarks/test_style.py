@@ -0,0 +1,134 @@
+# flake8: noqa F401,F811
+"""Benchmark styling the items of the diagrams in a model."""
+
+import time
+
+import pytest
+
+from gaphor import UML
+from gaphor.conftest import element_factory, event_manager, modeling_language
+from gaphor.conftest import test_models as models_dir
+from gaphor.core.modeling import Diagram, StyleSheet
+from gaphor.core.modeling.diagram import StyledItem, StyledItems
+from gaphor.storage import storage
+from gaphor.UML.classes import ClassItem, PackageItem
+
+PASSES = 20
+
+
+def style_items(diagrams):
+    for diagram in diagrams:
+        styled_items = StyledItems(diagram)
+        for item in diagram.get_all_items():
+            diagram.style(styled_items(item))
+
+
+def style_items_unshared(diagrams):
+    for diagram in diagrams:
+        for item in diagram.get_all_items():
+            diagram.style(StyledItem(item))
+
+
+@pytest.mark.slow
+def test_style_all_elements(
+    element_factory, modeling_language, models_dir, record_property
+):
+    storage.load(models_dir / "all-elements.gaphor", element_factory, modeling_language)
+    if not element_factory.lselect(StyleSheet):
+        element_factory.create(StyleSheet)
+    diagrams = element_factory.lselect(Diagram)
+
+    start = time.perf_counter()
+    style_items(diagrams)
+    first_pass_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(PASSES):
+        style_items(diagrams)
+    pass_time = (time.perf_counter() - start) / PASSES
+
+    record_property("items", sum(len(d.ownedPresentation) for d in diagrams))
+    record_property("first_pass_time", first_pass_time)
+    record_property("pass_time", pass_time)
+
+    assert pass_time < first_pass_time
+
+
+def large_style_sheet(names, rules):
+    """A style sheet with rules for the given element names and for
+    elements that do not occur in the model."""
+    names = sorted(names) + [f"unknown{n}" for n in range(50)]
+    return "\n".join(
+        f'{names[n % len(names)]}[name^="x{n}"] {{ color: #{n:06x}; }}'
+        for n in range(rules)
+    )
+
+
+@pytest.mark.slow
+def test_style_with_large_style_sheet(
+    element_factory, modeling_language, models_dir, record_property
+):
+    storage.load(models_dir / "all-elements.gaphor", element_factory, modeling_language)
+    diagrams = element_factory.lselect(Diagram)
+    names = {StyledItem(item).name() for d in diagrams for item in d.get_all_items()}
+    style_sheet = next(element_factory.select(StyleSheet), None)
+    if not style_sheet:
+        style_sheet = element_factory.create(StyleSheet)
+    style_sheet.styleSheet = large_style_sheet(names, 500)
+    compiled_style_sheet = style_sheet._compiled_style_sheet
+
+    start = time.perf_counter()
+    for _ in range(PASSES):
+        compiled_style_sheet._cache.clear()
+        style_items(diagrams)
+    pass_time = (time.perf_counter() - start) / PASSES
+
+    record_property("rules", len(compiled_style_sheet.selectors))
+    record_property("pass_time", pass_time)
+
+
+def nested_diagram(element_factory, chains, depth, leaves):
+    """A diagram with chains of nested packages, with classes in the
+    innermost package."""
+    diagram = element_factory.create(Diagram)
+    for _ in range(chains):
+        parent = None
+        for _ in range(depth):
+            package = diagram.create(
+                PackageItem, subject=element_factory.create(UML.Package)
+            )
+            package.parent = parent
+            parent = package
+        for _ in range(leaves):
+            klass = diagram.create(ClassItem, subject=element_factory.create(UML.Class))
+            klass.parent = parent
+    return diagram
+
+
+@pytest.mark.slow
+def test_style_nested_items(element_factory, record_property):
+    diagram = nested_diagram(element_factory, chains=20, depth=25, leaves=75)
+    style_sheet = element_factory.create(StyleSheet)
+    style_sheet.styleSheet = """
+        package class { color: red; }
+        package package > class { font-size: 10; }
+        package:hover class { color: blue; }
+        diagram package package package { line-width: 3; }
+    """
+    diagrams = [diagram]
+
+    start = time.perf_counter()
+    for _ in range(PASSES):
+        style_items_unshared(diagrams)
+    unshared_pass_time = (time.perf_counter() - start) / PASSES
+
+    start = time.perf_counter()
+    for _ in range(PASSES):
+        style_items(diagrams)
+    pass_time = (time.perf_counter() - start) / PASSES
+
+    record_property("items", len(diagram.ownedPresentation))
+    record_property("unshared_pass_time", unshared_pass_time)
+    record_property("pass_time", pass_time)
+
+    assert pass_time < unshared_pass_time
@@ -0,0 +1,54 @@
+# flake8: noqa F401,F811
+"""Benchmark editing the style sheet of a model with a large diagram."""
+
+import time
+
+import pytest
+
+from gaphor import UML
+from gaphor.conftest import element_factory, event_manager, modeling_language
+from gaphor.core.modeling import Diagram, StyleSheet
+from gaphor.core.modeling.diagram import StyledItem
+from gaphor.UML.classes import ClassItem, PackageItem
+
+EDITS = 50
+
+
+def style_sheet_text(n):
+    """A style sheet with many rules, of which the package rule is
+    edited."""
+    rules = "\n".join(f'class[name^="x{r}"] {{ color: #{r:06x}; }}' for r in range(200))
+    return f"{rules}\npackage {{ line-width: {n % 5}; }}"
+
+
+@pytest.mark.slow
+def test_edit_style_sheet(element_factory, record_property):
+    diagram = element_factory.create(Diagram)
+    for _ in range(20):
+        diagram.create(PackageItem, subject=element_factory.create(UML.Package))
+    for _ in range(2000):
+        diagram.create(ClassItem, subject=element_factory.create(UML.Class))
+    style_sheet = element_factory.create(StyleSheet)
+    style_sheet.styleSheet = style_sheet_text(0)
+    items = diagram.ownedPresentation.items
+
+    compile_time = 0.0
+    update_time = 0.0
+    updated = 0
+    for n in range(1, EDITS + 1):
+        start = time.perf_counter()
+        style_sheet.styleSheet = style_sheet_text(n)
+        compile_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        dirty_items = [i for i in items if style_sheet.changed(StyledItem(i))]
+        diagram._update_items(dirty_items)
+        update_time += time.perf_counter() - start
+        updated += len(dirty_items)
+
+    record_property("items", len(items))
+    record_property("updated_items", updated / EDITS)
+    record_property("compile_time", compile_time / EDITS)
+    record_property("update_time", update_time / EDITS)
+
+    assert updated == 20 * EDITS
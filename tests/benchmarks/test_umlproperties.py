@@ -0,0 +1,54 @@
+# flake8: noqa F401,F811
+"""Benchmark the per-class property tables used by save, postload and
+unlink."""
+
+import time
+from io import StringIO
+
+import pytest
+
+from gaphor.conftest import element_factory, event_manager, modeling_language, models
+from gaphor.core.modeling.properties import umlproperty, umlproperty_table
+from gaphor.storage import storage
+
+
+def reflect_umlproperties(cls):
+    return [
+        prop
+        for propname in dir(cls)
+        if not propname.startswith("_")
+        and isinstance(prop := getattr(cls, propname), umlproperty)
+    ]
+
+
+@pytest.mark.slow
+def test_umlproperty_table_versus_reflection(
+    element_factory, modeling_language, models, record_property
+):
+    storage.load(models / "UML.gaphor", element_factory, modeling_language)
+    elements = element_factory.lselect()
+
+    start = time.perf_counter()
+    for e in elements:
+        reflect_umlproperties(type(e))
+    reflection_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for e in elements:
+        umlproperty_table(type(e))
+    table_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    storage.save(StringIO(), element_factory)
+    save_time = time.perf_counter() - start
+
+    record_property("elements", len(elements))
+    record_property("reflection_time", reflection_time)
+    record_property("table_time", table_time)
+    record_property("save_time", save_time)
+
+    assert all(
+        list(umlproperty_table(type(e))) == reflect_umlproperties(type(e))
+        for e in elements
+    )
+    assert table_time < reflection_time
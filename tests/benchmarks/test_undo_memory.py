@@ -0,0 +1,115 @@
+# flake8: noqa F401,F811
+"""Benchmark the memory used by the undo history."""
+
+import tracemalloc
+
+import pytest
+
+from gaphor import UML
+from gaphor.conftest import diagram, element_factory, event_manager, modeling_language
+from gaphor.core import Transaction
+from gaphor.services.undojournal import UndoJournal
+from gaphor.services.undomanager import UndoManager
+from gaphor.UML.classes import ClassItem
+
+OPERATIONS = 10_000
+DIAGRAM_ITEMS = 200
+TRANSACTIONS = 500
+
+
+@pytest.fixture
+def undo_manager(event_manager, element_factory):
+    undo_manager = UndoManager(event_manager, element_factory)
+    yield undo_manager
+    undo_manager.shutdown()
+
+
+@pytest.mark.slow
+def test_memory_of_undo_history(
+    diagram, element_factory, event_manager, undo_manager, record_property
+):
+    with Transaction(event_manager):
+        item = diagram.create(ClassItem, subject=element_factory.create(UML.Class))
+        klass = item.subject
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    with Transaction(event_manager):
+        for n in range(OPERATIONS // 2):
+            item.matrix.translate(1, 1)
+            klass.name = str(n)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    record_property("undo_history_size", after - before)
+    record_property("bytes_per_operation", (after - before) / OPERATIONS)
+
+    assert undo_manager.can_undo()
+
+
+@pytest.mark.slow
+def test_memory_of_undo_history_for_large_diagram_edit(
+    diagram, element_factory, event_manager, undo_manager, record_property
+):
+    with Transaction(event_manager):
+        for n in range(DIAGRAM_ITEMS):
+            item = diagram.create(ClassItem, subject=element_factory.create(UML.Class))
+            item.subject.name = f"Class{n}"
+    size = element_factory.size()
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    with Transaction(event_manager):
+        for item in list(diagram.ownedPresentation):
+            item.subject.unlink()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    undo_step = undo_manager._undo_stack[-1]
+    record_property("undo_history_size", after - before)
+    record_property("undo_step_size", undo_step.size)
+    record_property("bytes_per_undo_action", (after - before) / len(undo_step._actions))
+
+    undo_manager.undo_transaction()
+
+    assert element_factory.size() == size
+    assert len(diagram.ownedPresentation) == DIAGRAM_ITEMS
+    assert all(item.subject.name for item in diagram.ownedPresentation)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("journaled", [False, True])
+def test_memory_of_deep_undo_history(
+    journaled, diagram, element_factory, event_manager, tmp_path, record_property
+):
+    journal = UndoJournal(element_factory, tmp_path / "undo") if journaled else None
+    undo_manager = UndoManager(
+        event_manager,
+        element_factory,
+        stack_depth=TRANSACTIONS,
+        memory_budget=1024 * 1024 if journaled else TRANSACTIONS * 1024 * 1024,
+        journal=journal,
+    )
+    with Transaction(event_manager):
+        item = diagram.create(ClassItem, subject=element_factory.create(UML.Class))
+        klass = item.subject
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for n in range(TRANSACTIONS):
+        with Transaction(event_manager):
+            for m in range(50):
+                item.matrix.translate(1, 1)
+                klass.name = f"{n}.{m}"
+                klass.isAbstract = m % 2
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    record_property("undo_history_size", after - before)
+
+    for _ in range(TRANSACTIONS):
+        undo_manager.undo_transaction()
+
+    assert not undo_manager.can_undo()
+    assert not klass.name
+    undo_manager.shutdown()
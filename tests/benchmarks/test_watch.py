@@ -0,0 +1,85 @@
+# flake8: noqa F401,F811
+"""Benchmark subscribing presentations to the element dispatcher."""
+
+import time
+
+import pytest
+
+from gaphor import UML
+from gaphor.conftest import (
+    diagram,
+    element_factory,
+    event_manager,
+    modeling_language,
+    models,
+)
+from gaphor.core.eventmanager import EventManager
+from gaphor.core.modeling import ElementFactory
+from gaphor.core.modeling.elementdispatcher import ElementDispatcher
+from gaphor.storage import storage
+from gaphor.UML.classes import ClassItem
+
+ITEMS = 1_000
+
+
+class UncachedElementDispatcher(ElementDispatcher):
+    def _path_to_properties(self, element, path):
+        return self._compile_path(type(element), path)
+
+
+def subscribe_items(dispatcher_type, items, modeling_language):
+    dispatcher = dispatcher_type(EventManager(), modeling_language)
+    start = time.perf_counter()
+    for item in items:
+        for path, handler in item._watcher._watched_paths.items():
+            dispatcher.subscribe(handler, item, path)
+    elapsed = time.perf_counter() - start
+    dispatcher.shutdown()
+    return elapsed
+
+
+def load_model(dispatcher_type, path, modeling_language):
+    event_manager = EventManager()
+    element_factory = ElementFactory(
+        event_manager, dispatcher_type(event_manager, modeling_language)
+    )
+    start = time.perf_counter()
+    storage.load(path, element_factory, modeling_language)
+    elapsed = time.perf_counter() - start
+    element_factory.shutdown()
+    return elapsed
+
+
+@pytest.mark.slow
+def test_subscribe_presentations(
+    diagram, element_factory, modeling_language, record_property
+):
+    with element_factory.block_events():
+        items = [
+            diagram.create(ClassItem, subject=element_factory.create(UML.Class))
+            for _ in range(ITEMS)
+        ]
+
+    uncached_time = min(
+        subscribe_items(UncachedElementDispatcher, items, modeling_language)
+        for _ in range(3)
+    )
+    cached_time = min(
+        subscribe_items(ElementDispatcher, items, modeling_language) for _ in range(3)
+    )
+
+    record_property("uncached_subscribe_time", uncached_time)
+    record_property("cached_subscribe_time", cached_time)
+
+    assert cached_time < uncached_time
+
+
+@pytest.mark.slow
+def test_load_diagrams(models, modeling_language, record_property):
+    path = models / "UML.gaphor"
+
+    uncached_time = load_model(UncachedElementDispatcher, path, modeling_language)
+    cached_time = load_model(ElementDispatcher, path, modeling_language)
+
+    record_property("uncached_load_time", uncached_time)
+    record_property("cached_load_time", cached_time)
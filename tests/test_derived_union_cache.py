@@ -0,0 +1,96 @@
+"""Derived unions cache their values per element.
+
+This model based test performs random edits on a small UML model and
+checks that the cached unions always match a freshly computed union.
+"""
+
+from __future__ import annotations
+
+from hypothesis import reproduce_failure  # noqa
+from hypothesis.control import assume
+from hypothesis.stateful import (
+    RuleBasedStateMachine,
+    initialize,
+    invariant,
+    rule,
+    run_state_machine_as_test,
+)
+from hypothesis.strategies import data, sampled_from
+
+from gaphor import UML
+from gaphor.core.eventmanager import EventManager
+from gaphor.core.modeling import ElementFactory
+from gaphor.core.modeling.properties import derived, derivedunion
+
+
+def test_derived_union_cache():
+    run_state_machine_as_test(DerivedUnionCache)
+
+
+class DerivedUnionCache(RuleBasedStateMachine):
+    @initialize()
+    def new_model(self):
+        self.model = ElementFactory(EventManager())
+        self.model.create(UML.Package)
+
+    def select(self, type):
+        elements = sorted(self.model.select(type), key=lambda e: e.id)
+        assume(elements)
+        return sampled_from(elements)
+
+    @rule(data=data())
+    def create_package(self, data):
+        package = data.draw(self.select(UML.Package))
+        self.model.create(UML.Package).package = package
+
+    @rule(data=data())
+    def create_class(self, data):
+        package = data.draw(self.select(UML.Package))
+        self.model.create(UML.Class).package = package
+
+    @rule(data=data())
+    def create_attribute(self, data):
+        klass = data.draw(self.select(UML.Class))
+        klass.ownedAttribute = self.model.create(UML.Property)
+
+    @rule(data=data())
+    def create_operation(self, data):
+        klass = data.draw(self.select(UML.Class))
+        klass.ownedOperation = self.model.create(UML.Operation)
+
+    @rule(data=data())
+    def move_type(self, data):
+        klass = data.draw(self.select(UML.Class))
+        package = data.draw(self.select(UML.Package))
+        klass.package = package
+
+    @rule(data=data())
+    def move_attribute(self, data):
+        attribute = data.draw(self.select(UML.Property))
+        klass = data.draw(self.select(UML.Class))
+        klass.ownedAttribute = attribute
+
+    @rule(data=data())
+    def remove_attribute(self, data):
+        attribute = data.draw(self.select(UML.Property))
+        assume(attribute.owner)
+        del attribute.class_
+
+    @rule(data=data())
+    def delete_element(self, data):
+        element = data.draw(self.select(UML.NamedElement))
+        element.unlink()
+
+    @invariant()
+    def unions_are_up_to_date(self):
+        for element in self.model.select():
+            for prop in element.umlproperties():
+                if isinstance(prop, derivedunion) or (
+                    isinstance(prop, derived) and prop.subsets
+                ):
+                    cached = prop.get(element)
+                    actual = prop.filter(element)
+                    if prop.upper == 1:
+                        assert cached is (actual[0] if actual else None)
+                    else:
+                        assert set(cached) == set(actual)